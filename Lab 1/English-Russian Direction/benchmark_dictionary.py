@@ -0,0 +1,161 @@
+"""
+Модуль содержит нагрузочные тесты англо-русского словаря на синтетических корпусах.
+
+Для каждого размера корпуса (по умолчанию от 10 тыс. до 10 млн слов) измеряются
+вставка, поиск по потоку запросов с распределением Ципфа, удаление, поиск по
+префиксу, сохранение и загрузка. Вместе со временем фиксируются высота дерева
+и число поворотов, чтобы была видна стоимость AVL-балансировки.
+
+Запуск:
+    python benchmark_dictionary.py --sizes 10000 100000 --queries 100000
+"""
+
+import argparse
+import os
+import random
+import string
+import tempfile
+import time
+from bisect import bisect_left
+from itertools import accumulate
+from typing import Dict, List, Union
+
+from dictionary import EnglishRussianDictionary
+
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000, 10_000_000]
+
+
+def generate_words(count: int, seed: int = 0) -> List[str]:
+    """
+    Генерирует список уникальных псевдослов в случайном порядке.
+
+    Args:
+        count: Количество слов
+        seed: Начальное значение генератора случайных чисел
+
+    Returns:
+        Список уникальных слов из строчных латинских букв
+    """
+    rng = random.Random(seed)
+    letters = string.ascii_lowercase
+    words = set()
+
+    while len(words) < count:
+        length = rng.randint(3, 12)
+        words.add(''.join(rng.choices(letters, k=length)))
+
+    result = list(words)
+    rng.shuffle(result)
+    return result
+
+
+def zipf_queries(words: List[str], count: int, exponent: float = 1.0,
+                 seed: int = 0) -> List[str]:
+    """
+    Генерирует поток запросов, в котором частота слова с рангом r пропорциональна 1 / r^exponent.
+
+    Args:
+        words: Слова словаря; порядок списка задает ранги
+        count: Длина потока запросов
+        exponent: Показатель распределения Ципфа
+        seed: Начальное значение генератора случайных чисел
+
+    Returns:
+        Список запрашиваемых слов
+    """
+    rng = random.Random(seed)
+    cumulative = list(accumulate(1.0 / (rank ** exponent) for rank in range(1, len(words) + 1)))
+    total = cumulative[-1]
+    last = len(words) - 1
+    return [words[min(bisect_left(cumulative, rng.random() * total), last)] for _ in range(count)]
+
+
+def _timed(func, *args):
+    """Выполняет функцию и возвращает пару (результат, время в секундах)."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def run_benchmark(size: int, queries: int = 100_000, seed: int = 0) -> Dict[str, Union[int, float]]:
+    """
+    Выполняет полный набор измерений для корпуса заданного размера.
+
+    Args:
+        size: Количество слов в корпусе
+        queries: Количество запросов поиска
+        seed: Начальное значение генератора случайных чисел
+
+    Returns:
+        Словарь с временем операций (секунды), высотой дерева и числом поворотов
+    """
+    words = generate_words(size, seed)
+    query_stream = zipf_queries(words, queries, seed=seed)
+    delete_words = words[::10]
+    prefixes = [word[:2] for word in words[:100]]
+
+    dictionary = EnglishRussianDictionary()
+
+    def insert_all():
+        for word in words:
+            dictionary[word] = word[::-1]
+
+    def lookup_all():
+        for word in query_stream:
+            dictionary[word]
+
+    def delete_all():
+        for word in delete_words:
+            del dictionary[word]
+
+    def prefix_all():
+        for prefix in prefixes:
+            dictionary.search_prefix(prefix)
+
+    report: Dict[str, Union[int, float]] = {"size": size}
+
+    _, report["insert"] = _timed(insert_all)
+    report["height_after_insert"] = dictionary.height()
+    report["rotations_after_insert"] = dictionary.rotations
+
+    _, report["lookup"] = _timed(lookup_all)
+    _, report["prefix_search"] = _timed(prefix_all)
+
+    rotations_before_delete = dictionary.rotations
+    _, report["delete"] = _timed(delete_all)
+    report["height_after_delete"] = dictionary.height()
+    report["rotations_on_delete"] = dictionary.rotations - rotations_before_delete
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        filename = os.path.join(temp_dir, "dictionary.txt")
+        _, report["save"] = _timed(dictionary.save_to_file, filename)
+        _, report["load"] = _timed(EnglishRussianDictionary.load_from_file, filename)
+
+    return report
+
+
+def main():
+    """Запускает нагрузочные тесты и печатает таблицу результатов."""
+    parser = argparse.ArgumentParser(description="Нагрузочные тесты англо-русского словаря")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Размеры синтетических корпусов")
+    parser.add_argument("--queries", type=int, default=100_000,
+                        help="Количество запросов поиска")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Начальное значение генератора случайных чисел")
+    args = parser.parse_args()
+
+    columns = ["size", "insert", "lookup", "delete", "prefix_search", "save", "load",
+               "height_after_insert", "rotations_after_insert",
+               "height_after_delete", "rotations_on_delete"]
+    print(" | ".join(columns))
+
+    for size in args.sizes:
+        report = run_benchmark(size, args.queries, args.seed)
+        print(" | ".join(f"{report[column]:.4f}" if isinstance(report[column], float)
+                         else str(report[column]) for column in columns), flush=True)
+
+
+if __name__ == "__main__":
+    main()
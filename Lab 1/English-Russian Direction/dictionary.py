@@ -9,9 +9,18 @@
     KeyError - когда слово не найдено
     ValueError - при неверных аргументах
     FileNotFoundError - когда файл не найден
+
+Журнал изменений:
+    Словарь может вести журнал операций (файл '<снимок>.log'), в который
+    построчно дописываются JSON-записи ["+", слово, перевод] и ["-", слово];
+    JSON экранирует ':' и переводы строк внутри слов. При загрузке журнал
+    воспроизводится поверх снимка, а при накоплении записей сжимается в новый снимок.
 """
 
-from typing import Optional, List, Tuple, Iterator
+import json
+import os
+from bisect import bisect_left
+from typing import Optional, List, Tuple, Iterator, Iterable, Dict, TextIO
 
 
 class TreeNode:
@@ -70,6 +79,11 @@ class EnglishRussianDictionary:
         """
         self._root: Optional[TreeNode] = None
         self._size = 0
+        self.rotations = 0
+        self._snapshot_filename: Optional[str] = None
+        self._log_file: Optional[TextIO] = None
+        self._log_records = 0
+        self._compact_threshold = 0
         
         if initial_data:
             for key, value in initial_data:
@@ -93,6 +107,9 @@ class EnglishRussianDictionary:
             raise ValueError("Ключ и значение не могут быть пустыми")
         
         self._root = self._insert(self._root, key, value)
+        
+        if self._log_file is not None:
+            self._write_log_record(["+", key, value])
     
     def __getitem__(self, key: str) -> str:
         """
@@ -133,6 +150,9 @@ class EnglishRussianDictionary:
         
         self._root = self._delete(self._root, key)
         self._size -= 1
+        
+        if self._log_file is not None:
+            self._write_log_record(["-", key])
     
     def __contains__(self, key: str) -> bool:
         """
@@ -198,6 +218,15 @@ class EnglishRussianDictionary:
         self[key.strip()] = value.strip()
         return self
     
+    def height(self) -> int:
+        """
+        Возвращает высоту дерева (0 для пустого словаря).
+        
+        Пример:
+            >>> dictionary.height()
+        """
+        return self._height(self._root)
+    
     def _height(self, node: Optional[TreeNode]) -> int:
         """Возвращает высоту узла."""
         if node is None:
@@ -216,6 +245,7 @@ class EnglishRussianDictionary:
     
     def _rotate_right(self, y: TreeNode) -> TreeNode:
         """Правый поворот для балансировки."""
+        self.rotations += 1
         x = y.left
         T2 = x.right
         
@@ -229,6 +259,7 @@ class EnglishRussianDictionary:
     
     def _rotate_left(self, x: TreeNode) -> TreeNode:
         """Левый поворот для балансировки."""
+        self.rotations += 1
         y = x.right
         T2 = y.left
         
@@ -345,6 +376,48 @@ class EnglishRussianDictionary:
         
         return _inorder(self._root)
     
+    def translate_batch(self, words: Iterable[str]) -> List[Optional[str]]:
+        """
+        Переводит список слов (например, токенизированный текст) за один вызов.
+        
+        Слова дедуплицируются и сортируются, после чего дерево обходится один
+        раз: отсортированные ключи делятся между поддеревьями по ключу узла,
+        поэтому общие верхние уровни дерева не проходятся повторно.
+        
+        Args:
+            words: Английские слова в произвольном порядке, возможно с повторами
+            
+        Returns:
+            Переводы в порядке исходных слов; None для отсутствующих слов
+            
+        Пример:
+            >>> dictionary.translate_batch(["hello", "world", "hello", "xyz"])
+            ['привет', 'мир', 'привет', None]
+        """
+        words = list(words)
+        translations = self._lookup_sorted(sorted(set(words)))
+        return [translations.get(word) for word in words]
+    
+    def _lookup_sorted(self, keys: List[str]) -> Dict[str, str]:
+        """Ищет отсортированные уникальные ключи за один совместный обход дерева."""
+        found: Dict[str, str] = {}
+        
+        def _lookup(node: Optional[TreeNode], lo: int, hi: int):
+            if node is None or lo >= hi:
+                return
+            
+            mid = bisect_left(keys, node.key, lo, hi)
+            _lookup(node.left, lo, mid)
+            
+            if mid < hi and keys[mid] == node.key:
+                found[node.key] = node.value
+                mid += 1
+            
+            _lookup(node.right, mid, hi)
+        
+        _lookup(self._root, 0, len(keys))
+        return found
+    
     def search_prefix(self, prefix: str) -> List[Tuple[str, str]]:
         """
         Находит все слова, начинающиеся с указанного префикса.
@@ -423,6 +496,10 @@ class EnglishRussianDictionary:
             
             dictionary[key] = value
         
+        log_filename = cls._log_filename(filename)
+        if os.path.exists(log_filename):
+            dictionary._replay_log(log_filename)
+        
         return dictionary
     
     def save_to_file(self, filename: str) -> None:
@@ -443,6 +520,110 @@ class EnglishRussianDictionary:
         """Очищает словарь."""
         self._root = None
         self._size = 0
+        
+        if self._log_file is not None:
+            self.compact()
+    
+    @staticmethod
+    def _log_filename(filename: str) -> str:
+        """Возвращает имя файла журнала для указанного снимка."""
+        return filename + ".log"
+    
+    def open_log(self, filename: str, compact_threshold: int = 1000) -> None:
+        """
+        Включает журналирование изменений словаря.
+        
+        Текущее содержимое записывается в снимок filename, после чего каждая
+        операция __setitem__ и __delitem__ дописывается в журнал 'filename.log'.
+        Сохранение стоит O(изменений) вместо O(n); когда в журнале накапливается
+        compact_threshold записей, он сжимается в новый снимок.
+        
+        Args:
+            filename: Путь к файлу снимка
+            compact_threshold: Число записей журнала до автоматического сжатия
+            
+        Raises:
+            ValueError: Если compact_threshold не положителен
+            
+        Пример:
+            >>> dictionary = EnglishRussianDictionary.load_from_file("words.txt")
+            >>> dictionary.open_log("words.txt")
+            >>> dictionary["sun"] = "солнце"  # дописано в words.txt.log
+        """
+        if compact_threshold <= 0:
+            raise ValueError("Порог сжатия журнала должен быть положительным")
+        
+        self.close_log()
+        self._snapshot_filename = filename
+        self._compact_threshold = compact_threshold
+        self.compact()
+    
+    def close_log(self) -> None:
+        """Закрывает журнал изменений; уже записанные операции сохраняются."""
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+        self._snapshot_filename = None
+    
+    def compact(self) -> None:
+        """
+        Сжимает журнал: записывает полный снимок словаря и очищает журнал.
+        
+        Снимок сначала пишется во временный файл и затем атомарно заменяет
+        старый, поэтому сбой во время сжатия не теряет данные.
+        
+        Raises:
+            ValueError: Если журналирование не включено
+        """
+        if self._snapshot_filename is None:
+            raise ValueError("Журнал изменений не открыт")
+        
+        if self._log_file is not None:
+            self._log_file.close()
+        
+        temp_filename = self._snapshot_filename + ".tmp"
+        self.save_to_file(temp_filename)
+        os.replace(temp_filename, self._snapshot_filename)
+        
+        self._log_file = open(self._log_filename(self._snapshot_filename), 'w', encoding='utf-8')
+        self._log_records = 0
+    
+    def _write_log_record(self, record: List[str]) -> None:
+        """Дописывает запись в журнал одной строкой JSON и при необходимости сжимает его."""
+        self._log_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._log_file.flush()
+        self._log_records += 1
+        
+        if self._log_records >= self._compact_threshold:
+            self.compact()
+    
+    def _replay_log(self, log_filename: str) -> None:
+        """
+        Воспроизводит журнал изменений поверх загруженного снимка.
+        
+        Незавершенная последняя строка (обрыв записи при сбое) пропускается.
+        Удаление отсутствующего слова игнорируется, так как журнал мог
+        пережить сбой между записью снимка и очисткой журнала.
+        """
+        with open(log_filename, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+        
+        for line_num, line in enumerate(lines, 1):
+            if not line.endswith("\n"):
+                break
+            
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                record = None
+            
+            if isinstance(record, list) and len(record) == 3 and record[0] == '+':
+                self[record[1]] = record[2]
+            elif isinstance(record, list) and len(record) == 2 and record[0] == '-':
+                if record[1] in self:
+                    del self[record[1]]
+            else:
+                raise ValueError(f"Неверная запись журнала в строке {line_num}: {line.rstrip()}")
 
 
 def main():
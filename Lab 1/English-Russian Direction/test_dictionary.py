@@ -80,6 +80,17 @@ class TestEnglishRussianDictionary(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.dict += "invalid_string"
     
+    def test_height_and_rotations(self):
+        """Тест высоты дерева и счетчика поворотов при упорядоченной вставке."""
+        test_dict = EnglishRussianDictionary()
+        self.assertEqual(test_dict.height(), 0)
+        
+        for i in range(7):
+            test_dict[f"k{i}"] = "v"
+        
+        self.assertEqual(test_dict.height(), 3)
+        self.assertEqual(test_dict.rotations, 4)
+    
     def test_iteration(self):
         """Тест итерации по словарю."""
         words = [word for word, _ in self.dict]
@@ -112,6 +123,24 @@ class TestEnglishRussianDictionary(unittest.TestCase):
         result = self.dict.search_prefix("xyz")
         self.assertEqual(len(result), 0)
     
+    def test_translate_batch(self):
+        """Тест пакетного перевода с повторами и отсутствующими словами."""
+        words = ["world", "hello", "xyz", "world", "apple"]
+        result = self.dict.translate_batch(words)
+        self.assertEqual(result, ["мир", "привет", None, "мир", "яблоко"])
+    
+    def test_translate_batch_matches_getitem(self):
+        """Тест совпадения пакетного перевода с поштучным поиском."""
+        big_dict = EnglishRussianDictionary([(f"w{i:03d}", f"с{i}") for i in range(200)])
+        words = [f"w{i:03d}" for i in range(0, 250, 3)]
+        expected = [big_dict[w] if w in big_dict else None for w in words]
+        self.assertEqual(big_dict.translate_batch(words), expected)
+    
+    def test_translate_batch_empty(self):
+        """Тест пакетного перевода пустого списка."""
+        self.assertEqual(self.dict.translate_batch([]), [])
+        self.assertEqual(EnglishRussianDictionary().translate_batch(["a"]), [None])
+    
     def test_save_and_load_from_txt_file(self):
         """Тест сохранения и загрузки из TXT файла."""
         with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt', encoding='utf-8') as f:
@@ -183,6 +212,92 @@ class TestEnglishRussianDictionary(unittest.TestCase):
             if os.path.exists(temp_filename):
                 os.unlink(temp_filename)
     
+    def test_log_replayed_on_load(self):
+        """Тест воспроизведения журнала изменений при загрузке."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = os.path.join(temp_dir, "words.txt")
+            self.dict.open_log(filename)
+            self.dict["sun"] = "солнце"
+            self.dict += "moon:луна"
+            del self.dict["hello"]
+            
+            with open(filename + ".log", encoding='utf-8') as f:
+                self.assertEqual(f.read(), '["+", "sun", "солнце"]\n'
+                                           '["+", "moon", "луна"]\n'
+                                           '["-", "hello"]\n')
+            
+            loaded_dict = EnglishRussianDictionary.load_from_file(filename)
+            self.dict.close_log()
+            
+            self.assertEqual(list(loaded_dict), list(self.dict))
+    
+    def test_log_compaction(self):
+        """Тест сжатия журнала в снимок."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = os.path.join(temp_dir, "words.txt")
+            self.dict.open_log(filename, compact_threshold=2)
+            self.dict["sun"] = "солнце"
+            self.dict["moon"] = "луна"
+            self.dict["star"] = "звезда"
+            self.dict.close_log()
+            
+            with open(filename + ".log", encoding='utf-8') as f:
+                self.assertEqual(f.read(), '["+", "star", "звезда"]\n')
+            
+            with open(filename, encoding='utf-8') as f:
+                self.assertIn("moon:луна\n", f.read())
+            
+            loaded_dict = EnglishRussianDictionary.load_from_file(filename)
+            self.assertEqual(len(loaded_dict), 6)
+            self.assertEqual(loaded_dict["star"], "звезда")
+    
+    def test_log_ignores_torn_record(self):
+        """Тест пропуска незавершенной записи журнала после сбоя."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = os.path.join(temp_dir, "words.txt")
+            self.dict.save_to_file(filename)
+            with open(filename + ".log", 'w', encoding='utf-8') as f:
+                f.write('["-", "hello"]\n["-", "absent"]\n["+", "sun", "солн')
+            
+            loaded_dict = EnglishRussianDictionary.load_from_file(filename)
+            
+            self.assertEqual(len(loaded_dict), 2)
+            self.assertFalse("hello" in loaded_dict)
+            self.assertFalse("sun" in loaded_dict)
+    
+    def test_log_round_trip_special_keys(self):
+        """Тест журнала со словами, содержащими ':' и перевод строки."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = os.path.join(temp_dir, "words.txt")
+            self.dict.open_log(filename)
+            self.dict["re:do"] = "пере:делать"
+            self.dict["two\nlines"] = "две\nстроки"
+            self.dict["-dash"] = "дефис"
+            del self.dict["hello"]
+            self.dict.close_log()
+            
+            loaded_dict = EnglishRussianDictionary.load_from_file(filename)
+            
+            self.assertEqual(list(loaded_dict), list(self.dict))
+            self.assertEqual(loaded_dict["re:do"], "пере:делать")
+            self.assertEqual(loaded_dict["two\nlines"], "две\nстроки")
+    
+    def test_log_invalid_record(self):
+        """Тест загрузки журнала с неверной записью."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = os.path.join(temp_dir, "words.txt")
+            self.dict.save_to_file(filename)
+            with open(filename + ".log", 'w', encoding='utf-8') as f:
+                f.write("+sun:солнце\n")
+            
+            with self.assertRaises(ValueError):
+                EnglishRussianDictionary.load_from_file(filename)
+    
+    def test_open_log_invalid_threshold(self):
+        """Тест включения журнала с неверным порогом сжатия."""
+        with self.assertRaises(ValueError):
+            self.dict.open_log("words.txt", compact_threshold=0)
+    
     def test_clear(self):
         """Тест очистки словаря."""
         self.dict.clear()
@@ -0,0 +1,66 @@
+"""
+Модуль содержит unit-тесты асинхронного сервиса пакетного перевода.
+
+Классы:
+    TestAsyncBatchTranslator - тесты объединения запросов в микропакеты,
+    ограничения размера пакета и обработки ошибок
+"""
+
+import unittest
+import asyncio
+from dictionary import EnglishRussianDictionary
+from translation_service import AsyncBatchTranslator
+
+
+class TestAsyncBatchTranslator(unittest.TestCase):
+    """Тесты для асинхронного сервиса пакетного перевода."""
+    
+    def setUp(self):
+        """Подготовка тестовых данных."""
+        self.dict = EnglishRussianDictionary([("hello", "привет"), ("world", "мир"), ("apple", "яблоко")])
+    
+    def test_concurrent_requests_share_batch(self):
+        """Тест объединения одновременных запросов в один пакет."""
+        translator = AsyncBatchTranslator(self.dict)
+        
+        async def run():
+            return await asyncio.gather(translator.translate("hello"),
+                                        translator.translate("world"),
+                                        translator.translate("hello"))
+        
+        self.assertEqual(asyncio.run(run()), ["привет", "мир", "привет"])
+        self.assertEqual(translator.batches, 1)
+    
+    def test_batch_size_limit(self):
+        """Тест отправки пакета при достижении максимального размера."""
+        translator = AsyncBatchTranslator(self.dict, max_batch_size=2)
+        
+        async def run():
+            return await translator.translate_words(["hello", "world", "apple"])
+        
+        self.assertEqual(asyncio.run(run()), ["привет", "мир", "яблоко"])
+        self.assertEqual(translator.batches, 2)
+    
+    def test_missing_word(self):
+        """Тест перевода отсутствующего слова."""
+        translator = AsyncBatchTranslator(self.dict)
+        
+        async def run():
+            return await asyncio.gather(translator.translate("hello"),
+                                        translator.translate("xyz"),
+                                        return_exceptions=True)
+        
+        result = asyncio.run(run())
+        self.assertEqual(result[0], "привет")
+        self.assertIsInstance(result[1], KeyError)
+    
+    def test_invalid_arguments(self):
+        """Тест создания сервиса с неверными параметрами."""
+        with self.assertRaises(ValueError):
+            AsyncBatchTranslator(self.dict, max_batch_size=0)
+        with self.assertRaises(ValueError):
+            AsyncBatchTranslator(self.dict, max_delay=-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
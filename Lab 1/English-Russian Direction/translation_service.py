@@ -0,0 +1,117 @@
+"""
+Модуль реализует асинхронный сервис пакетного перевода поверх словаря.
+
+Классы:
+    AsyncBatchTranslator - собирает одновременные запросы в микропакеты
+
+Исключения:
+    KeyError - когда слово не найдено
+    ValueError - при неверных аргументах
+"""
+
+import asyncio
+from typing import Dict, List, Optional
+
+from dictionary import EnglishRussianDictionary
+
+
+class AsyncBatchTranslator:
+    """
+    Асинхронная обертка над EnglishRussianDictionary.translate_batch.
+
+    Одновременные вызовы translate() не обходят дерево по отдельности:
+    запросы накапливаются до max_batch_size слов или до истечения max_delay
+    секунд, после чего весь микропакет переводится одним обходом дерева.
+
+    Примеры:
+        >>> translator = AsyncBatchTranslator(dictionary)
+        >>> words = await asyncio.gather(translator.translate("hello"),
+        ...                              translator.translate("world"))
+    """
+
+    def __init__(self, dictionary: EnglishRussianDictionary,
+                 max_batch_size: int = 256, max_delay: float = 0.001):
+        """
+        Инициализирует сервис перевода.
+
+        Args:
+            dictionary: Словарь для перевода
+            max_batch_size: Максимальное число уникальных слов в микропакете
+            max_delay: Максимальное время ожидания пакета в секундах
+
+        Raises:
+            ValueError: Если размер пакета не положителен или задержка отрицательна
+        """
+        if max_batch_size <= 0:
+            raise ValueError("Размер пакета должен быть положительным")
+        if max_delay < 0:
+            raise ValueError("Задержка не может быть отрицательной")
+
+        self._dictionary = dictionary
+        self._max_batch_size = max_batch_size
+        self._max_delay = max_delay
+        self._pending: Dict[str, List[asyncio.Future]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self.batches = 0
+
+    async def translate(self, word: str) -> str:
+        """
+        Переводит слово в составе ближайшего микропакета.
+
+        Args:
+            word: Английское слово
+
+        Returns:
+            Русский перевод
+
+        Raises:
+            KeyError: Если слово не найдено в словаре
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(word, []).append(future)
+
+        if len(self._pending) >= self._max_batch_size:
+            self.flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._max_delay, self.flush)
+
+        return await future
+
+    async def translate_words(self, words: List[str]) -> List[str]:
+        """
+        Переводит список слов, разделяя микропакеты с другими запросами.
+
+        Args:
+            words: Английские слова
+
+        Returns:
+            Переводы в порядке исходных слов
+
+        Raises:
+            KeyError: Если какое-либо слово не найдено в словаре
+        """
+        return list(await asyncio.gather(*(self.translate(word) for word in words)))
+
+    def flush(self) -> None:
+        """Немедленно переводит все накопленные запросы одним пакетом."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        words = list(pending)
+        translations = self._dictionary.translate_batch(words)
+        self.batches += 1
+
+        for word, translation in zip(words, translations):
+            for future in pending[word]:
+                if future.done():
+                    continue
+                if translation is None:
+                    future.set_exception(KeyError(f"Слово '{word}' не найдено в словаре"))
+                else:
+                    future.set_result(translation)
@@ -0,0 +1,215 @@
+"""
+@file benchmark.py
+@brief Нагрузочное сравнение алгоритмов сортировки на разных распределениях данных
+@details Сравнивает ShellSorter, LSDRadixSorter и встроенную sorted() на равномерных,
+         отсортированных, обратных, малоуникальных, ципфовских и почти отсортированных
+         данных размером от 10^3 до 10^7 элементов. Время измеряется perf_counter
+         с прогревом и повторениями; результаты сохраняются в CSV и JSON.
+
+Запуск:
+    python benchmark.py --sizes 1000 10000 100000 --repeat 5 --csv results.csv --json results.json
+"""
+
+import argparse
+import csv
+import json
+import random
+import statistics
+import time
+from bisect import bisect_left
+from itertools import accumulate
+from typing import Callable, Dict, List, Optional
+
+from sorters import ShellSorter, LSDRadixSorter, AutoSorter
+
+
+DEFAULT_SIZES = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
+
+
+def generate_uniform(n: int, rng: random.Random) -> List[int]:
+    """
+    @brief Равномерно распределенные целые в диапазоне [0, 10n]
+    """
+    return [rng.randint(0, 10 * n) for _ in range(n)]
+
+
+def generate_sorted(n: int, rng: random.Random) -> List[int]:
+    """
+    @brief Уже отсортированные данные
+    """
+    return sorted(generate_uniform(n, rng))
+
+
+def generate_reversed(n: int, rng: random.Random) -> List[int]:
+    """
+    @brief Данные, отсортированные по убыванию
+    """
+    return sorted(generate_uniform(n, rng), reverse=True)
+
+
+def generate_few_unique(n: int, rng: random.Random) -> List[int]:
+    """
+    @brief Данные всего с 16 различными значениями
+    """
+    values = [rng.randint(0, 10 ** 6) for _ in range(16)]
+    return [rng.choice(values) for _ in range(n)]
+
+
+def generate_zipf(n: int, rng: random.Random, exponent: float = 1.1) -> List[int]:
+    """
+    @brief Данные с распределением Ципфа: значение ранга r встречается с частотой 1 / r^exponent
+    """
+    distinct = max(1, n // 10)
+    cumulative = list(accumulate(1.0 / (rank ** exponent) for rank in range(1, distinct + 1)))
+    total = cumulative[-1]
+    return [min(bisect_left(cumulative, rng.random() * total), distinct - 1) for _ in range(n)]
+
+
+def generate_nearly_sorted(n: int, rng: random.Random, swap_fraction: float = 0.01) -> List[int]:
+    """
+    @brief Отсортированные данные, в которых переставлена доля swap_fraction случайных пар
+    """
+    data = generate_sorted(n, rng)
+    for _ in range(max(1, int(n * swap_fraction))):
+        i = rng.randrange(n)
+        j = rng.randrange(n)
+        data[i], data[j] = data[j], data[i]
+    return data
+
+
+DISTRIBUTIONS: Dict[str, Callable[[int, random.Random], List[int]]] = {
+    "uniform": generate_uniform,
+    "sorted": generate_sorted,
+    "reversed": generate_reversed,
+    "few_unique": generate_few_unique,
+    "zipf": generate_zipf,
+    "nearly_sorted": generate_nearly_sorted,
+}
+
+
+ALGORITHMS: Dict[str, Callable[[List[int]], List[int]]] = {
+    "shell": lambda data: ShellSorter(instrumented=False).sort(data),
+    "radix": lambda data: LSDRadixSorter(instrumented=False).sort(data),
+    "auto": lambda data: AutoSorter(instrumented=False).sort(data),
+    "sorted": sorted,
+}
+
+
+def measure(func: Callable[[List[int]], List[int]], data: List[int],
+            warmup: int = 1, repeat: int = 3) -> Dict[str, float]:
+    """
+    @brief Измеряет время работы функции сортировки
+    @param func Функция сортировки
+    @param data Входные данные (не изменяются)
+    @param warmup Количество прогревочных запусков, не входящих в результат
+    @param repeat Количество измеряемых запусков
+    @return Словарь с минимальным, медианным и средним временем в секундах
+    """
+    for _ in range(warmup):
+        func(data)
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(data)
+        timings.append(time.perf_counter() - start)
+
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.mean(timings),
+    }
+
+
+def run_benchmark(sizes: List[int], distributions: Optional[List[str]] = None,
+                  algorithms: Optional[List[str]] = None, warmup: int = 1, repeat: int = 3,
+                  max_shell_size: int = 10 ** 5, seed: int = 0) -> List[dict]:
+    """
+    @brief Выполняет сравнение алгоритмов для всех сочетаний размеров и распределений
+    @param sizes Размеры входных данных
+    @param distributions Имена распределений (по умолчанию все)
+    @param algorithms Имена алгоритмов (по умолчанию все)
+    @param warmup Количество прогревочных запусков
+    @param repeat Количество измеряемых запусков
+    @param max_shell_size Наибольший размер, на котором запускается ShellSorter
+           (O(n^(3/2)) на чистом Python слишком долог для 10^7)
+    @param seed Начальное значение генератора случайных чисел
+    @return Список строк отчета
+    """
+    distributions = distributions or list(DISTRIBUTIONS)
+    algorithms = algorithms or list(ALGORITHMS)
+    rows = []
+
+    for size in sizes:
+        for distribution in distributions:
+            data = DISTRIBUTIONS[distribution](size, random.Random(seed))
+            for algorithm in algorithms:
+                row = {"size": size, "distribution": distribution, "algorithm": algorithm}
+                if algorithm == "shell" and size > max_shell_size:
+                    row.update({"min": None, "median": None, "mean": None, "skipped": True})
+                else:
+                    row.update(measure(ALGORITHMS[algorithm], data, warmup, repeat))
+                    row["skipped"] = False
+                rows.append(row)
+                print(format_row(row), flush=True)
+
+    return rows
+
+
+def format_row(row: dict) -> str:
+    """
+    @brief Форматирует строку отчета для вывода в консоль
+    """
+    if row["skipped"]:
+        timing = "пропущено"
+    else:
+        timing = f"min {row['min']:.6f} с, median {row['median']:.6f} с"
+    return f"{row['size']:>10} {row['distribution']:>14} {row['algorithm']:>7}: {timing}"
+
+
+def write_csv(rows: List[dict], path: str) -> None:
+    """
+    @brief Сохраняет отчет в CSV файл
+    """
+    fields = ["size", "distribution", "algorithm", "min", "median", "mean", "skipped"]
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def write_json(rows: List[dict], path: str) -> None:
+    """
+    @brief Сохраняет отчет в JSON файл
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(rows, f, ensure_ascii=False, indent=2)
+
+
+def main():
+    """
+    @brief Разбирает аргументы командной строки и запускает сравнение
+    """
+    parser = argparse.ArgumentParser(description="Сравнение алгоритмов сортировки")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--distributions", nargs="+", choices=list(DISTRIBUTIONS))
+    parser.add_argument("--algorithms", nargs="+", choices=list(ALGORITHMS))
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-shell-size", type=int, default=10 ** 5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--csv", help="Путь к CSV отчету")
+    parser.add_argument("--json", help="Путь к JSON отчету")
+    args = parser.parse_args()
+
+    rows = run_benchmark(args.sizes, args.distributions, args.algorithms, args.warmup,
+                         args.repeat, args.max_shell_size, args.seed)
+
+    if args.csv:
+        write_csv(rows, args.csv)
+    if args.json:
+        write_json(rows, args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -225,9 +225,9 @@ def demonstrate_performance_comparison():
     # Shell Sort
     print("\n--- Shell Sort ---")
     shell_sorter = ShellSorter()
-    start_time = time.time()
+    start_time = time.perf_counter()
     result_shell = shell_sorter.sort(data)
-    shell_time = time.time() - start_time
+    shell_time = time.perf_counter() - start_time
     stats = shell_sorter.get_statistics()
     print(f"Время выполнения: {shell_time:.6f} секунд")
     print(f"Сравнений: {stats['comparisons']}")
@@ -236,9 +236,9 @@ def demonstrate_performance_comparison():
     # Radix Sort
     print("\n--- LSD Radix Sort ---")
     radix_sorter = LSDRadixSorter()
-    start_time = time.time()
+    start_time = time.perf_counter()
     result_radix = radix_sorter.sort(data)
-    radix_time = time.time() - start_time
+    radix_time = time.perf_counter() - start_time
     stats = radix_sorter.get_statistics()
     print(f"Время выполнения: {radix_time:.6f} секунд")
     print(f"Проходов: {stats['passes']}")
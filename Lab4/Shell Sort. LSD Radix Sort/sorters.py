@@ -5,8 +5,29 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import List, TypeVar, Callable, Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import (Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar, Callable,
+                    Any, Union)
+from array import array
+import bisect
 import copy
+import heapq
+import itertools
+import math
+import mmap
+import operator
+import os
+import pickle
+import re
+import struct
+import sys
+import tempfile
+import time
+
+try:
+    import numpy as np
+except ImportError:  # NumPy - необязательная зависимость, без нее используется чистый Python
+    np = None
 
 T = TypeVar('T')
 
@@ -29,6 +50,75 @@ class BaseSorter(ABC):
         """
         pass
 
+    def argsort(self, data: List[T], key: Callable[[T], Any] = None, reverse: bool = False) -> List[int]:
+        """
+        @brief Возвращает перестановку индексов, упорядочивающую данные, не перемещая их
+        @param data Список элементов
+        @param key Функция для извлечения ключа сравнения из элемента
+        @param reverse Флаг обратной сортировки (по убыванию)
+        @return Список индексов: data[result[0]], data[result[1]], ... упорядочены
+        @details Реализация по умолчанию сортирует индексы методом sort;
+                 наследники переопределяют ее, чтобы не вычислять ключи повторно
+        """
+        getter = data.__getitem__ if key is None else (lambda i: key(data[i]))
+        return self.sort(list(range(len(data))), key=getter, reverse=reverse)
+
+    @staticmethod
+    def apply_permutation(data: List[T], permutation: List[int]) -> List[T]:
+        """
+        @brief Строит новый список элементов в порядке перестановки
+        @param data Исходный список (не изменяется)
+        @param permutation Перестановка индексов, например результат argsort
+        @return Список [data[i] for i in permutation]
+        """
+        return [data[i] for i in permutation]
+
+    def top_k(self, data: List[T], k: int, key: Callable[[T], Any] = None,
+              reverse: bool = False) -> List[T]:
+        """
+        @brief Возвращает первые k элементов сортировки, не упорядочивая весь список
+        @param data Список элементов (не изменяется)
+        @param k Количество элементов
+        @param key Функция для извлечения ключа сравнения из элемента
+        @param reverse Флаг обратной сортировки (k наибольших вместо k наименьших)
+        @return Список из min(k, len(data)) элементов в порядке сортировки
+        @details Реализация по умолчанию использует кучу ограниченного размера:
+                 O(n log k) времени и O(k) дополнительной памяти. Результат совпадает
+                 с sorted(data, key=key, reverse=reverse)[:k], включая порядок равных ключей
+        """
+        if k <= 0 or not data:
+            return []
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        return select(k, data, key=key)
+
+    def nth_element(self, data: List[T], n: int, key: Callable[[T], Any] = None,
+                    reverse: bool = False) -> T:
+        """
+        @brief Возвращает элемент, который стоял бы на позиции n после сортировки
+        @param data Список элементов (не изменяется)
+        @param n Позиция (отрицательные значения отсчитываются с конца)
+        @param key Функция для извлечения ключа сравнения из элемента
+        @param reverse Флаг обратной сортировки (по убыванию)
+        @return Элемент с n-м по порядку ключом (тот же, что sorted(data, key, reverse)[n])
+        @throws IndexError если позиция вне диапазона
+        """
+        position = self._normalize_position(data, n)
+        return self.top_k(data, position + 1, key, reverse)[-1]
+
+    @staticmethod
+    def _normalize_position(data: List[T], n: int) -> int:
+        """
+        @brief Приводит позицию к диапазону [0, len(data))
+        @param data Список элементов
+        @param n Позиция (отрицательные значения отсчитываются с конца)
+        @return Неотрицательная позиция
+        @throws IndexError если позиция вне диапазона
+        """
+        position = n + len(data) if n < 0 else n
+        if not 0 <= position < len(data):
+            raise IndexError(f"Позиция {n} вне диапазона списка длины {len(data)}")
+        return position
+
     def _compare(self, a: T, b: T, key: Callable[[T], Any] = None, reverse: bool = False) -> bool:
         """
         @brief Сравнивает два элемента с учетом функции ключа и направления сортировки
@@ -45,12 +135,206 @@ class BaseSorter(ABC):
             return val_a < val_b
         return val_a > val_b
 
+    @staticmethod
+    def _count_descents(keys: List[Any], greater: Callable[[Any, Any], bool]) -> int:
+        """
+        @brief Считает соседние пары, стоящие в неправильном порядке
+        @param keys Массив ключей
+        @param greater Функция сравнения: True если первый ключ должен идти после второго
+        @return Количество "спусков"; массив состоит из (спуски + 1) упорядоченных серий
+        @details Один проход на уровне C (map по двум срезам), без цикла на Python
+        """
+        return sum(map(greater, keys, itertools.islice(keys, 1, None)))
+
+
+class GapSequence(ABC):
+    """
+    @class GapSequence
+    @brief Абстрактная стратегия последовательности интервалов для сортировки Шелла
+    @details Наследники возвращают убывающий список интервалов, заканчивающийся 1
+    """
+
+    name = ""
+
+    @abstractmethod
+    def gaps(self, n: int) -> List[int]:
+        """
+        @brief Вычисляет интервалы для массива заданного размера
+        @param n Размер массива
+        @return Интервалы в порядке убывания, последний равен 1
+        """
+        pass
+
+    def resolve(self, n: int) -> 'GapSequence':
+        """
+        @brief Возвращает конкретную последовательность для массива размера n
+        @param n Размер массива
+        @return Последовательность, которая будет использована при сортировке
+        """
+        return self
+
+    @staticmethod
+    def _below(increasing: List[int], n: int) -> List[int]:
+        """
+        @brief Отбирает интервалы меньше n и разворачивает их в убывающий порядок
+        @param increasing Возрастающая последовательность, начинающаяся с 1
+        @param n Размер массива
+        @return Интервалы в порядке убывания (минимум [1])
+        """
+        gaps = [gap for gap in increasing if gap < n]
+        return gaps[::-1] or [1]
+
+
+class KnuthGapSequence(GapSequence):
+    """
+    @class KnuthGapSequence
+    @brief Последовательность Кнута: h = 3*h + 1 (1, 4, 13, 40, ...)
+    """
+
+    name = "knuth"
+
+    def gaps(self, n: int) -> List[int]:
+        gap = 1
+        while gap < n // 3:
+            gap = 3 * gap + 1
+
+        gaps = []
+        while gap >= 1:
+            gaps.append(gap)
+            gap //= 3
+        return gaps
+
+
+class CiuraGapSequence(GapSequence):
+    """
+    @class CiuraGapSequence
+    @brief Эмпирическая последовательность Циуры (1, 4, 10, 23, 57, ...)
+    @details После 1750 продолжается умножением на 2.25
+    """
+
+    name = "ciura"
+    BASE = [1, 4, 10, 23, 57, 132, 301, 701, 1750]
+
+    def gaps(self, n: int) -> List[int]:
+        sequence = list(self.BASE)
+        while sequence[-1] < n:
+            sequence.append(int(sequence[-1] * 2.25))
+        return self._below(sequence, n)
+
+
+class SedgewickGapSequence(GapSequence):
+    """
+    @class SedgewickGapSequence
+    @brief Последовательность Седжвика 1986 года: 4^k + 3*2^(k-1) + 1 (1, 8, 23, 77, ...)
+    @details Худший случай O(n^(4/3))
+    """
+
+    name = "sedgewick"
+
+    def gaps(self, n: int) -> List[int]:
+        sequence = [1]
+        k = 1
+        while sequence[-1] < n:
+            sequence.append(4 ** k + 3 * 2 ** (k - 1) + 1)
+            k += 1
+        return self._below(sequence, n)
+
+
+class TokudaGapSequence(GapSequence):
+    """
+    @class TokudaGapSequence
+    @brief Последовательность Токуды: ceil((9 * (9/4)^k - 4) / 5) (1, 4, 9, 20, 46, ...)
+    """
+
+    name = "tokuda"
+
+    def gaps(self, n: int) -> List[int]:
+        sequence = [1]
+        k = 1
+        while sequence[-1] < n:
+            sequence.append(math.ceil((9 * (9 / 4) ** k - 4) / 5))
+            k += 1
+        return self._below(sequence, n)
+
+
+class PrattGapSequence(GapSequence):
+    """
+    @class PrattGapSequence
+    @brief Последовательность Пратта: все числа вида 2^p * 3^q (1, 2, 3, 4, 6, 8, 9, ...)
+    @details Худший случай O(n log^2 n), но проходов O(log^2 n), поэтому
+             на практике обычно медленнее остальных
+    """
+
+    name = "pratt"
+
+    def gaps(self, n: int) -> List[int]:
+        sequence = []
+        power_of_two = 1
+        while power_of_two < max(n, 2):
+            gap = power_of_two
+            while gap < max(n, 2):
+                sequence.append(gap)
+                gap *= 3
+            power_of_two *= 2
+        return self._below(sorted(sequence), n)
+
+
+class AutoGapSequence(GapSequence):
+    """
+    @class AutoGapSequence
+    @brief Выбирает последовательность по размеру входных данных
+    @details Для массивов до SMALL_SIZE элементов используется Циура (подобрана
+             эмпирически для таких размеров), для больших - Токуда
+    """
+
+    name = "auto"
+    SMALL_SIZE = 100000
+
+    def gaps(self, n: int) -> List[int]:
+        return self.resolve(n).gaps(n)
+
+    def resolve(self, n: int) -> GapSequence:
+        if n <= self.SMALL_SIZE:
+            return CiuraGapSequence()
+        return TokudaGapSequence()
+
+
+class GapSequenceFactory:
+    """
+    @class GapSequenceFactory
+    @brief Фабрика последовательностей интервалов для сортировки Шелла
+    """
+
+    SEQUENCES = {
+        "knuth": KnuthGapSequence,
+        "ciura": CiuraGapSequence,
+        "sedgewick": SedgewickGapSequence,
+        "tokuda": TokudaGapSequence,
+        "pratt": PrattGapSequence,
+        "auto": AutoGapSequence,
+    }
+
+    @staticmethod
+    def create_gap_sequence(name: str) -> GapSequence:
+        """
+        @brief Создает последовательность интервалов по имени
+        @param name Имя последовательности ("knuth", "ciura", "sedgewick", "tokuda", "pratt" или "auto")
+        @return Объект последовательности
+        @throws ValueError если указано неизвестное имя
+        """
+        sequence_class = GapSequenceFactory.SEQUENCES.get(name.lower())
+        if sequence_class is None:
+            raise ValueError(f"Неизвестная последовательность интервалов: {name}. "
+                             f"Доступные: {', '.join(GapSequenceFactory.SEQUENCES)}")
+        return sequence_class()
+
 
 class ShellSorter(BaseSorter):
     """
     @class ShellSorter
     @brief Реализация алгоритма сортировки Шелла
-    @details Использует последовательность Кнута для определения интервалов
+    @details По умолчанию использует последовательность Кнута для определения интервалов;
+             последовательность задается стратегией GapSequence
 
     Алгоритм Shell sort - это усовершенствованная версия сортировки вставками.
     Элементы сравниваются и переставляются на определенном расстоянии друг от друга.
@@ -60,12 +344,34 @@ class ShellSorter(BaseSorter):
     Пространственная сложность: O(1)
     """
 
-    def __init__(self):
+    INSERTION_SHIFT_FACTOR = 8  #< Бюджет сдвигов адаптивной сортировки вставками на элемент
+
+    def __init__(self, precompute_keys: bool = True,
+                 gap_sequence: Union[str, GapSequence] = "knuth", adaptive: bool = False,
+                 instrumented: bool = True):
         """
         @brief Конструктор класса ShellSorter
+        @param precompute_keys Вычислять ключи один раз в параллельный массив
+               (decorate-sort-undecorate) вместо вызова key при каждом сравнении
+        @param gap_sequence Последовательность интервалов: имя или объект GapSequence
+        @param adaptive Распознавать уже упорядоченные входные данные (см. _adaptive_presort)
+        @param instrumented Собирать статистику (сравнения, перестановки, время каждого
+               прохода); без нее внутренний цикл не содержит счетчиков
+        @throws ValueError если указано неизвестное имя последовательности
         """
         self.comparisons = 0
         self.swaps = 0
+        self.pass_times = []
+        self.precompute_keys = precompute_keys
+        self.adaptive = adaptive
+        self.instrumented = instrumented
+        self.runs = 0
+        self.descents = 0
+        self.adaptive_strategy = None
+        if isinstance(gap_sequence, str):
+            gap_sequence = GapSequenceFactory.create_gap_sequence(gap_sequence)
+        self.gap_sequence = gap_sequence
+        self.gap_sequence_used = gap_sequence.name
 
     def sort(self, data: List[T], key: Callable[[T], Any] = None, reverse: bool = False) -> List[T]:
         """
@@ -74,51 +380,365 @@ class ShellSorter(BaseSorter):
         @param key Функция извлечения ключа для сравнения
         @param reverse Флаг сортировки по убыванию
         @return Отсортированный список
+        @details При precompute_keys ключи вычисляются один раз (n вызовов key вместо
+                 O(n^(3/2))), сортируются вместе с индексами, после чего элементы
+                 собираются по полученной перестановке. Адаптивный режим
+                 применяется к предвычисленным ключам (или при key=None)
         """
         self.comparisons = 0
         self.swaps = 0
+        self.pass_times = []
+        self.runs = 0
+        self.descents = 0
+        self.adaptive_strategy = None
 
         # Создаем копию для сохранения исходных данных
         arr = copy.copy(data)
-        n = len(arr)
 
-        # Вычисляем начальный gap по последовательности Кнута: h = 3*h + 1
-        gap = 1
-        while gap < n // 3:
-            gap = 3 * gap + 1
+        if key is None:
+            self._shell_sort(arr, None, reverse)
+            return arr
 
-        # Уменьшаем gap и выполняем сортировку вставками для каждого gap
-        while gap >= 1:
-            # Выполняем сортировку вставками для элементов с интервалом gap
-            for i in range(gap, n):
-                temp = arr[i]
-                j = i
+        if not self.precompute_keys:
+            self._shell_sort_with_key(arr, key, reverse)
+            return arr
+
+        return self.apply_permutation(arr, self.argsort(arr, key, reverse))
+
+    def argsort(self, data: List[T], key: Callable[[T], Any] = None, reverse: bool = False) -> List[int]:
+        """
+        @brief Возвращает перестановку индексов, упорядочивающую данные методом Шелла
+        @param data Список элементов (не изменяется и не копируется)
+        @param key Функция извлечения ключа для сравнения
+        @param reverse Флаг сортировки по убыванию
+        @return Перестановка индексов
+        """
+        self.comparisons = 0
+        self.swaps = 0
+        self.pass_times = []
+        self.runs = 0
+        self.descents = 0
+        self.adaptive_strategy = None
+
+        keys = [key(item) for item in data] if key else list(data)
+        order = list(range(len(keys)))
+        self._shell_sort(keys, order, reverse)
+        return order
+
+    def _gaps(self, n: int) -> List[int]:
+        """
+        @brief Вычисляет интервалы выбранной последовательности и запоминает ее имя
+        @param n Размер массива
+        @return Интервалы в порядке убывания
+        """
+        sequence = self.gap_sequence.resolve(n)
+        self.gap_sequence_used = sequence.name
+        return sequence.gaps(n)
+
+    def _shell_sort(self, keys: List[Any], order: Optional[List[int]], reverse: bool) -> None:
+        """
+        @brief Сортирует ключи на месте, переставляя параллельный массив индексов
+        @param keys Массив ключей
+        @param order Параллельный массив индексов или None
+        @param reverse Флаг сортировки по убыванию
+        @details Направление сортировки выбирается один раз до циклов,
+                 поэтому во внутреннем цикле нет ветвления по reverse
+        """
+        greater = operator.lt if reverse else operator.gt
+        n = len(keys)
+
+        if self.adaptive and self._adaptive_presort(keys, order, greater):
+            return
+
+        for gap in self._gaps(n):
+            if not self.instrumented:
+                self._gap_pass(keys, order, gap, greater)
+                continue
+
+            start_time = time.perf_counter()
+            comparisons, swaps = self._gap_pass_counted(keys, order, gap, greater)
+            self.pass_times.append({'gap': gap, 'time': time.perf_counter() - start_time})
+            self.comparisons += comparisons
+            self.swaps += swaps
+
+    @staticmethod
+    def _gap_pass(keys: List[Any], order: Optional[List[int]], gap: int,
+                  greater: Callable[[Any, Any], bool]) -> None:
+        """
+        @brief Один проход сортировки вставками с интервалом gap без сбора статистики
+        @param keys Массив ключей
+        @param order Параллельный массив индексов или None
+        @param gap Интервал
+        @param greater Функция сравнения с учетом направления сортировки
+        """
+        n = len(keys)
+        for i in range(gap, n):
+            temp = keys[i]
+            j = i
+
+            if order is None:
+                # Сдвигаем элементы, которые больше temp
+                while j >= gap and greater(keys[j - gap], temp):
+                    keys[j] = keys[j - gap]
+                    j -= gap
+                keys[j] = temp
+                continue
 
+            # Сдвигаем ключи вместе с индексами
+            temp_index = order[i]
+            while j >= gap and greater(keys[j - gap], temp):
+                keys[j] = keys[j - gap]
+                order[j] = order[j - gap]
+                j -= gap
+            keys[j] = temp
+            order[j] = temp_index
+
+    @staticmethod
+    def _gap_pass_counted(keys: List[Any], order: Optional[List[int]], gap: int,
+                          greater: Callable[[Any, Any], bool]) -> Tuple[int, int]:
+        """
+        @brief Один проход сортировки вставками с интервалом gap с подсчетом операций
+        @param keys Массив ключей
+        @param order Параллельный массив индексов или None
+        @param gap Интервал
+        @param greater Функция сравнения с учетом направления сортировки
+        @return Пара (сравнения, перестановки); счетчики - локальные переменные
+        """
+        n = len(keys)
+        comparisons = 0
+        swaps = 0
+        for i in range(gap, n):
+            temp = keys[i]
+            j = i
+
+            if order is None:
                 # Сдвигаем элементы, которые больше temp
                 while j >= gap:
-                    self.comparisons += 1
-                    if self._compare(arr[j - gap], temp, key, reverse):
-                        arr[j] = arr[j - gap]
+                    comparisons += 1
+                    if greater(keys[j - gap], temp):
+                        keys[j] = keys[j - gap]
                         j -= gap
-                        self.swaps += 1
+                        swaps += 1
                     else:
                         break
+                keys[j] = temp
+                continue
 
-                arr[j] = temp
+            # Сдвигаем ключи вместе с индексами
+            temp_index = order[i]
+            while j >= gap:
+                comparisons += 1
+                if greater(keys[j - gap], temp):
+                    keys[j] = keys[j - gap]
+                    order[j] = order[j - gap]
+                    j -= gap
+                    swaps += 1
+                else:
+                    break
+            keys[j] = temp
+            order[j] = temp_index
 
-            gap //= 3
+        return comparisons, swaps
 
-        return arr
+    def _adaptive_presort(self, keys: List[Any], order: Optional[List[int]],
+                          greater: Callable[[Any, Any], bool]) -> bool:
+        """
+        @brief Распознает упорядоченные входные данные перед проходами Шелла
+        @param keys Массив ключей
+        @param order Параллельный массив индексов или None
+        @param greater Функция сравнения с учетом направления сортировки
+        @return True если массив уже отсортирован и проходы Шелла не нужны
+        @details Один проход считает серии:
+                 - одна серия: данные уже отсортированы, работы нет;
+                 - строго убывающий массив: достаточно развернуть его;
+                 - мало серий: сортировка вставками с бюджетом сдвигов
+                   INSERTION_SHIFT_FACTOR * n (O(n + инверсий)); если бюджет
+                   исчерпан, частично упорядоченный массив досортировывается Шеллом.
+                 Все три пути устойчивы.
+        """
+        n = len(keys)
+        self.descents = self._count_descents(keys, greater)
+        self.runs = self.descents + 1 if n else 0
+        if self.instrumented:
+            self.comparisons += max(n - 1, 0)
+
+        if self.descents == 0:
+            self.adaptive_strategy = "presorted"
+            return True
+
+        if self.descents == n - 1:
+            keys.reverse()
+            if order is not None:
+                order.reverse()
+            if self.instrumented:
+                self.swaps += n // 2
+            self.adaptive_strategy = "reversed"
+            return True
+
+        if self.descents <= n // self.INSERTION_SHIFT_FACTOR:
+            if self._bounded_insertion_sort(keys, order, greater, self.INSERTION_SHIFT_FACTOR * n):
+                self.adaptive_strategy = "insertion"
+                return True
+
+        self.adaptive_strategy = "shell"
+        return False
+
+    def _bounded_insertion_sort(self, keys: List[Any], order: Optional[List[int]],
+                                greater: Callable[[Any, Any], bool], budget: int) -> bool:
+        """
+        @brief Сортировка вставками с ограничением числа сдвигов
+        @param keys Массив ключей
+        @param order Параллельный массив индексов или None
+        @param greater Функция сравнения с учетом направления сортировки
+        @param budget Максимальное число сдвигов
+        @return True если массив отсортирован, False если бюджет исчерпан
+                (массив остается корректной перестановкой исходного)
+        """
+        shifts = 0
+        comparisons = 0
+        completed = True
+        for i in range(1, len(keys)):
+            temp = keys[i]
+            temp_index = order[i] if order is not None else None
+            j = i
+            while j > 0:
+                comparisons += 1
+                if not greater(keys[j - 1], temp):
+                    break
+                keys[j] = keys[j - 1]
+                if order is not None:
+                    order[j] = order[j - 1]
+                j -= 1
+                shifts += 1
+            keys[j] = temp
+            if order is not None:
+                order[j] = temp_index
+            if shifts > budget:
+                completed = False
+                break
+
+        if self.instrumented:
+            self.comparisons += comparisons
+            self.swaps += shifts
+        return completed
+
+    def _shell_sort_with_key(self, arr: List[T], key: Callable[[T], Any], reverse: bool) -> None:
+        """
+        @brief Сортирует массив на месте, вычисляя ключи при каждом сравнении
+        @param arr Массив для сортировки
+        @param key Функция извлечения ключа
+        @param reverse Флаг сортировки по убыванию
+        @details Используется при precompute_keys=False, когда дополнительная
+                 память под массив ключей нежелательна
+        """
+        greater = operator.lt if reverse else operator.gt
+        n = len(arr)
+
+        for gap in self._gaps(n):
+            if not self.instrumented:
+                self._key_gap_pass(arr, key, gap, greater)
+                continue
+
+            start_time = time.perf_counter()
+            comparisons, swaps = self._key_gap_pass_counted(arr, key, gap, greater)
+            self.pass_times.append({'gap': gap, 'time': time.perf_counter() - start_time})
+            self.comparisons += comparisons
+            self.swaps += swaps
+
+    @staticmethod
+    def _key_gap_pass(arr: List[T], key: Callable[[T], Any], gap: int,
+                      greater: Callable[[Any, Any], bool]) -> None:
+        """
+        @brief Один проход с интервалом gap по элементам с вычислением ключей без сбора статистики
+        @param arr Массив для сортировки
+        @param key Функция извлечения ключа
+        @param gap Интервал
+        @param greater Функция сравнения с учетом направления сортировки
+        """
+        for i in range(gap, len(arr)):
+            temp = arr[i]
+            temp_key = key(temp)
+            j = i
+            while j >= gap and greater(key(arr[j - gap]), temp_key):
+                arr[j] = arr[j - gap]
+                j -= gap
+            arr[j] = temp
+
+    @staticmethod
+    def _key_gap_pass_counted(arr: List[T], key: Callable[[T], Any], gap: int,
+                              greater: Callable[[Any, Any], bool]) -> Tuple[int, int]:
+        """
+        @brief Один проход с интервалом gap по элементам с вычислением ключей и подсчетом операций
+        @param arr Массив для сортировки
+        @param key Функция извлечения ключа
+        @param gap Интервал
+        @param greater Функция сравнения с учетом направления сортировки
+        @return Пара (сравнения, перестановки); счетчики - локальные переменные
+        """
+        comparisons = 0
+        swaps = 0
+        for i in range(gap, len(arr)):
+            temp = arr[i]
+            temp_key = key(temp)
+            j = i
+            while j >= gap:
+                comparisons += 1
+                if greater(key(arr[j - gap]), temp_key):
+                    arr[j] = arr[j - gap]
+                    j -= gap
+                    swaps += 1
+                else:
+                    break
+            arr[j] = temp
+
+        return comparisons, swaps
 
     def get_statistics(self) -> dict:
         """
         @brief Возвращает статистику последней сортировки
         @return Словарь со статистикой (количество сравнений и перестановок)
         """
-        return {
-            'comparisons': self.comparisons,
-            'swaps': self.swaps
-        }
+        statistics = {'gap_sequence': self.gap_sequence_used}
+        if self.instrumented:
+            statistics.update({
+                'comparisons': self.comparisons,
+                'swaps': self.swaps,
+                'pass_times': self.pass_times
+            })
+        if self.adaptive:
+            statistics.update({
+                'runs': self.runs,
+                'descents': self.descents,
+                'adaptive_strategy': self.adaptive_strategy
+            })
+        return statistics
+
+    @staticmethod
+    def benchmark_gap_sequences(data: List[T], key: Callable[[T], Any] = None, reverse: bool = False,
+                                sequences: Optional[List[str]] = None) -> Dict[str, dict]:
+        """
+        @brief Сортирует данные с каждой последовательностью интервалов и сравнивает их
+        @param data Список для сортировки
+        @param key Функция извлечения ключа для сравнения
+        @param reverse Флаг сортировки по убыванию
+        @param sequences Имена последовательностей (по умолчанию все, кроме "auto")
+        @return Словарь {имя: {'comparisons', 'swaps', 'time'}}, время в секундах
+        """
+        if sequences is None:
+            sequences = [name for name in GapSequenceFactory.SEQUENCES if name != "auto"]
+
+        results = {}
+        for name in sequences:
+            sorter = ShellSorter(gap_sequence=name)
+            start_time = time.perf_counter()
+            sorter.sort(data, key, reverse)
+            elapsed = time.perf_counter() - start_time
+            results[name] = {
+                'comparisons': sorter.comparisons,
+                'swaps': sorter.swaps,
+                'time': elapsed
+            }
+        return results
 
 
 class LSDRadixSorter(BaseSorter):
@@ -134,107 +754,1788 @@ class LSDRadixSorter(BaseSorter):
     Пространственная сложность: O(n + k)
     """
 
-    def __init__(self, base: int = 10):
+    BACKENDS = ("python", "numpy", "auto")
+    NUMPY_MIN_SIZE = 1000  #< Минимальный размер входа, с которого "auto" выбирает NumPy
+    HEAP_SELECT_RATIO = 16  #< При k * HEAP_SELECT_RATIO <= n отбор выполняется кучей
+
+    def __init__(self, base: int = 256, backend: str = "auto", adaptive: bool = False,
+                 instrumented: bool = True):
         """
         @brief Конструктор класса LSDRadixSorter
-        @param base Основание системы счисления (по умолчанию 10)
+        @param base Основание системы счисления (по умолчанию 256)
+        @param backend Реализация проходов: "python", "numpy" или "auto"
+               ("auto" использует NumPy, если он установлен и вход достаточно большой)
+        @param adaptive Пропускать проходы для уже отсортированных или строго убывающих данных
+        @param instrumented Замерять время каждого прохода по разрядам
+        @details Для оснований-степеней двойки (256, 65536) разряд извлекается
+                 сдвигом и маской вместо деления и взятия остатка
+        @throws ValueError если основание меньше 2 или указан неизвестный backend
+        @throws ImportError если выбран backend "numpy", а NumPy не установлен
         """
+        if base < 2:
+            raise ValueError(f"Основание системы счисления должно быть не меньше 2: {base}")
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Неизвестный backend: {backend}. "
+                             f"Доступные: {', '.join(self.BACKENDS)}")
+        if backend == "numpy" and np is None:
+            raise ImportError("Для backend 'numpy' требуется установленный NumPy")
         self.base = base
+        self.backend = backend
+        self.adaptive = adaptive
+        self.instrumented = instrumented
         self.passes = 0
+        self.skipped_passes = 0
+        self.pass_times = []
+        self.backend_used = "python"
+        self.runs = 0
+        self.descents = 0
+        self.adaptive_strategy = None
 
     def sort(self, data: List[T], key: Callable[[T], Any] = None, reverse: bool = False) -> List[T]:
         """
         @brief Сортирует список методом LSD Radix sort
         @param data Список для сортировки
-        @param key Функция извлечения числового ключа
+        @param key Функция извлечения ключа (int, float, str или bytes)
         @param reverse Флаг сортировки по убыванию
         @return Отсортированный список
+        @details Ключи извлекаются один раз в отдельный массив и кодируются
+                 неотрицательными целыми с сохранением порядка (см. _encode_keys); проходы
+                 переключаются между двумя заранее выделенными буферами,
+                 а проходы, в которых все элементы попадают в одну корзину, пропускаются
         """
         self.passes = 0
+        self.skipped_passes = 0
+        self.pass_times = []
+        self.runs = 0
+        self.descents = 0
+        self.adaptive_strategy = None
 
         if not data:
             return []
 
         # Создаем копию для сохранения исходных данных
         arr = copy.copy(data)
-        n = len(arr)
 
-        # Извлекаем числовые значения
-        if key:
-            values = [key(item) for item in arr]
-        else:
-            values = arr
+        # Извлекаем значения ключей один раз
+        keys = [key(item) for item in arr] if key else arr
 
-        # Проверяем, что все значения - целые числа
-        if not all(isinstance(v, int) and v >= 0 for v in values):
-            # Для нецелочисленных типов используем альтернативный метод
+        encoded = self._encode_keys(keys)
+        if encoded is None:
+            # Для ключей, которые нельзя закодировать, используем альтернативный метод
             return self._sort_with_key(arr, key, reverse)
 
-        # Находим максимальное значение для определения количества разрядов
-        max_val = max(values)
+        if reverse:
+            # Инверсия ключа (max - k) сохраняет исходный порядок равных элементов
+            max_val = max(encoded)
+            encoded = [max_val - k for k in encoded]
 
-        # Выполняем поразрядную сортировку
-        exp = 1
-        while max_val // exp > 0:
-            arr = self._counting_sort_by_digit(arr, exp, key)
-            exp *= self.base
-            self.passes += 1
+        if encoded is arr and not self.adaptive and not self._use_numpy(encoded):
+            # Ключи совпадают с самими элементами - перестановка индексов не нужна
+            self.backend_used = "python"
+            arr = self._radix_sort(encoded, None)
+        else:
+            if encoded is arr:
+                encoded = list(encoded)  # Буфер проходов не должен совпадать с элементами
+            arr = self.apply_permutation(arr, self._argsort_encoded(encoded))
+
+        return arr
+
+    def argsort(self, data: List[T], key: Callable[[T], Any] = None, reverse: bool = False) -> List[int]:
+        """
+        @brief Возвращает перестановку индексов, упорядочивающую данные поразрядно
+        @param data Список элементов (не изменяется и не копируется)
+        @param key Функция извлечения ключа (int, float, str или bytes)
+        @param reverse Флаг сортировки по убыванию
+        @return Перестановка индексов
+        """
+        self.passes = 0
+        self.skipped_passes = 0
+        self.pass_times = []
+        self.runs = 0
+        self.descents = 0
+        self.adaptive_strategy = None
+
+        if not data:
+            return []
+
+        keys = [key(item) for item in data] if key else list(data)
+        encoded = self._encode_keys(keys)
+        if encoded is None:
+            return sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse)
 
         if reverse:
-            arr.reverse()
+            max_val = max(encoded)
+            encoded = [max_val - k for k in encoded]
+        return self._argsort_encoded(encoded)
 
-        return arr
+    def _argsort_encoded(self, encoded: List[int]) -> List[int]:
+        """
+        @brief Вычисляет упорядочивающую перестановку для закодированных ключей
+        @param encoded Закодированные ключи (используются как буфер проходов)
+        @return Перестановка индексов (устойчивая)
+        """
+        n = len(encoded)
+
+        if self.adaptive and self._adaptive_presort(encoded):
+            order = list(range(n))
+            if self.adaptive_strategy == "reversed":
+                order.reverse()
+            return order
 
-    def _counting_sort_by_digit(self, arr: List[T], exp: int, key: Callable[[T], Any] = None) -> List[T]:
+        if self._use_numpy(encoded):
+            self.backend_used = "numpy"
+            return self._radix_argsort_numpy(encoded)
+
+        self.backend_used = "python"
+        return self._radix_sort(encoded, list(range(n)))
+
+    def sort_multikey(self, data: List[T], keys: List[Tuple[Callable[[T], Any], bool]]) -> List[T]:
         """
-        @brief Вспомогательный метод сортировки подсчетом по определенному разряду
-        @param arr Массив для сортировки
-        @param exp Текущий разряд (1, 10, 100, ...)
-        @param key Функция извлечения ключа
-        @return Отсортированный по данному разряду массив
+        @brief Устойчиво сортирует список по составному ключу с направлением для каждой части
+        @param data Список для сортировки
+        @param keys Части ключа от старшей к младшей: пары (функция ключа, по убыванию)
+        @return Отсортированный список
+        @details Части обрабатываются от младшей к старшей; для каждой выполняется
+                 своя серия LSD проходов по перестановке индексов. Так как каждая
+                 серия устойчива, итог упорядочен по всему составному ключу.
+                 Убывание задается инверсией закодированного ключа (max - k),
+                 поэтому равные элементы сохраняют исходный порядок.
+
+        Пример: студенты по баллу по убыванию, затем по возрасту по возрастанию:
+            sorter.sort_multikey(students, [(lambda s: s.grade, True), (lambda s: s.age, False)])
         """
-        n = len(arr)
-        output = [None] * n
-        count = [0] * self.base
+        self.passes = 0
+        self.skipped_passes = 0
+        self.pass_times = []
+        self.backend_used = "python"
+
+        arr = copy.copy(data)
+        order = list(range(len(arr)))
+        if not arr:
+            return arr
 
-        # Подсчитываем количество элементов для каждой цифры
-        for i in range(n):
-            value = key(arr[i]) if key else arr[i]
-            digit = (value // exp) % self.base
-            count[digit] += 1
+        for key, descending in reversed(keys):
+            values = [key(arr[i]) for i in order]
+            encoded = self._encode_keys(values)
 
-        # Преобразуем count в массив позиций
-        for i in range(1, self.base):
-            count[i] += count[i - 1]
+            if encoded is None:
+                # Для ключей, которые нельзя закодировать, - устойчивая встроенная сортировка
+                ranked = sorted(range(len(order)), key=values.__getitem__, reverse=descending)
+                order = [order[i] for i in ranked]
+                continue
 
-        # Строим выходной массив
-        for i in range(n - 1, -1, -1):
-            value = key(arr[i]) if key else arr[i]
-            digit = (value // exp) % self.base
-            output[count[digit] - 1] = arr[i]
-            count[digit] -= 1
+            if descending:
+                max_val = max(encoded)
+                encoded = [max_val - k for k in encoded]
+            order = self._radix_sort(encoded, order)
 
-        return output
+        return [arr[i] for i in order]
 
-    def _sort_with_key(self, arr: List[T], key: Callable[[T], Any] = None, reverse: bool = False) -> List[T]:
+    def top_k(self, data: List[T], k: int, key: Callable[[T], Any] = None,
+              reverse: bool = False) -> List[T]:
         """
-        @brief Альтернативный метод сортировки для нецелочисленных типов
-        @param arr Массив для сортировки
-        @param key Функция извлечения ключа
-        @param reverse Флаг обратной сортировки
-        @return Отсортированный массив
+        @brief Возвращает первые k элементов сортировки с помощью поразрядного отбора
+        @param data Список элементов (не изменяется)
+        @param k Количество элементов
+        @param key Функция извлечения ключа (int, float, str или bytes)
+        @param reverse Флаг обратной сортировки (k наибольших вместо k наименьших)
+        @return Список из min(k, len(data)) элементов в порядке сортировки
+        @details Отбор (см. _radix_select) работает за O(d * n), после чего
+                 сортируются только k отобранных элементов. При малых k куча
+                 ограниченного размера (heapq на уровне C) быстрее, и используется она
         """
-        # Используем встроенную сортировку для нецелочисленных типов
-        result = sorted(arr, key=key, reverse=reverse)
-        return result
+        if k <= 0 or not data:
+            return []
+        if k >= len(data):
+            return self.sort(data, key, reverse)
+        if k * self.HEAP_SELECT_RATIO <= len(data):
+            return super().top_k(data, k, key, reverse)
 
-    def get_statistics(self) -> dict:
+        keys = [key(item) for item in data] if key else data
+        encoded = self._encode_keys(keys)
+        if encoded is None:
+            return super().top_k(data, k, key, reverse)
+
+        # Индексы по возрастанию: устойчивый argsort упорядочит равные ключи как sort()
+        selected = sorted(self._radix_select(encoded, k, reverse))
+        select_passes, select_skipped = self.passes, self.skipped_passes
+        order = self.argsort([encoded[i] for i in selected], reverse=reverse)
+        self.passes += select_passes
+        self.skipped_passes += select_skipped
+        return [data[selected[i]] for i in order]
+
+    def nth_element(self, data: List[T], n: int, key: Callable[[T], Any] = None,
+                    reverse: bool = False) -> T:
         """
-        @brief Возвращает статистику последней сортировки
-        @return Словарь со статистикой (количество проходов)
+        @brief Возвращает элемент, который стоял бы на позиции n после сортировки
+        @param data Список элементов (не изменяется)
+        @param n Позиция (отрицательные значения отсчитываются с конца)
+        @param key Функция извлечения ключа (int, float, str или bytes)
+        @param reverse Флаг обратной сортировки (по убыванию)
+        @return Элемент с n-м по порядку ключом
+        @throws IndexError если позиция вне диапазона
+        @details Отобранные n + 1 элементов не сортируются: достаточно взять крайний из них
+                 (среди равных ключей - с наибольшим индексом, как при устойчивой сортировке)
         """
-        return {
-            'passes': self.passes
+        position = self._normalize_position(data, n)
+        if (position + 1) * self.HEAP_SELECT_RATIO <= len(data):
+            return super().nth_element(data, position, key, reverse)
+
+        keys = [key(item) for item in data] if key else data
+        encoded = self._encode_keys(keys)
+        if encoded is None:
+            return super().nth_element(data, position, key, reverse)
+
+        selected = self._radix_select(encoded, position + 1, reverse)
+        if reverse:
+            return data[max(selected, key=lambda i: (-encoded[i], i))]
+        return data[max(selected, key=lambda i: (encoded[i], i))]
+
+    def _radix_select(self, encoded: List[int], k: int, largest: bool) -> List[int]:
+        """
+        @brief Отбирает индексы k наименьших (или наибольших) ключей, начиная со старшего разряда
+        @param encoded Закодированные неотрицательные ключи
+        @param k Количество отбираемых элементов (0 < k < len(encoded))
+        @param largest Отбирать наибольшие ключи
+        @return Индексы отобранных элементов в произвольном порядке
+        @details На каждом разряде кандидаты раскладываются по корзинам; корзины,
+                 целиком попадающие в первые k, отбираются, а дальше рассматривается
+                 только корзина, на которую приходится граница. Порядок индексов
+                 в корзинах сохраняется, поэтому из равных граничных ключей
+                 отбираются элементы с меньшими индексами, как при устойчивой сортировке
+        """
+        base = self.base
+        self.passes = 0
+        self.skipped_passes = 0
+
+        level = 0
+        max_val = max(encoded)
+        while base ** (level + 1) <= max_val:
+            level += 1
+
+        candidates = list(range(len(encoded)))
+        selected = []
+        while k > 0 and level >= 0:
+            exp = base ** level
+            buckets = [[] for _ in range(base)]
+            for i in candidates:
+                buckets[encoded[i] // exp % base].append(i)
+            level -= 1
+
+            if any(len(bucket) == len(candidates) for bucket in buckets):
+                self.skipped_passes += 1
+                continue
+            self.passes += 1
+
+            for bucket in (reversed(buckets) if largest else buckets):
+                if len(bucket) > k:
+                    candidates = bucket
+                    break
+                selected.extend(bucket)
+                k -= len(bucket)
+                if k == 0:
+                    break
+
+        # Оставшиеся кандидаты имеют одинаковые ключи
+        selected.extend(candidates[:k])
+        return selected
+
+    @staticmethod
+    def _encode_keys(keys: List[Any]) -> Optional[List[int]]:
+        """
+        @brief Кодирует ключи неотрицательными целыми числами с сохранением порядка
+        @param keys Массив ключей
+        @return Закодированные ключи (сам массив keys, если он уже подходит)
+                или None, если ключи нельзя закодировать
+        @details Поддерживаются:
+                 - целые числа любого знака: сдвиг на минимальное значение;
+                 - числа с плавающей точкой (вместе с int до 2^53): битовое
+                   представление IEEE-754, у положительных инвертируется знаковый
+                   бит, у отрицательных - все биты;
+                 - строки и bytes: байты UTF-8 фиксированной ширины (дополненные
+                   нулями) с длиной в младших битах, что совпадает с
+                   лексикографическим порядком
+        """
+        kinds = {type(k) for k in keys}
+
+        if kinds <= {int, bool}:
+            min_val = min(keys)
+            if min_val >= 0:
+                return keys
+            return [k - min_val for k in keys]
+
+        if kinds <= {int, bool, float}:
+            if any(k != k for k in keys):
+                return None  # NaN не имеет порядка
+            if any(type(k) is not float and abs(k) > 2 ** 53 for k in keys):
+                return None  # Такие целые теряют точность при переводе в float
+            sign_bit = 1 << 63
+            all_bits = (1 << 64) - 1
+            encoded = []
+            for k in keys:
+                # + 0.0 приводит -0.0 к 0.0, чтобы равные ключи кодировались одинаково
+                bits = struct.unpack('>Q', struct.pack('>d', k + 0.0))[0]
+                encoded.append(bits ^ all_bits if bits & sign_bit else bits | sign_bit)
+            return encoded
+
+        if kinds == {str} or kinds == {bytes}:
+            if kinds == {str}:
+                raw = [k.encode('utf-8', 'surrogatepass') for k in keys]
+            else:
+                raw = keys
+            width = max(len(b) for b in raw)
+            length_bits = width.bit_length()
+            return [int.from_bytes(b + bytes(width - len(b)), 'big') << length_bits | len(b)
+                    for b in raw]
+
+        return None
+
+    def _adaptive_presort(self, encoded: List[int]) -> bool:
+        """
+        @brief Распознает отсортированные по возрастанию или строго убывающие ключи
+        @param encoded Закодированные ключи
+        @return True если проходы не нужны (при "reversed" массив нужно развернуть)
+        """
+        n = len(encoded)
+        self.descents = self._count_descents(encoded, operator.gt)
+        self.runs = self.descents + 1
+
+        if self.descents == 0:
+            self.adaptive_strategy = "presorted"
+            return True
+        if self.descents == n - 1:
+            self.adaptive_strategy = "reversed"
+            return True
+
+        self.adaptive_strategy = "radix"
+        return False
+
+    def _use_numpy(self, encoded: List[int]) -> bool:
+        """
+        @brief Определяет, выполнять ли проходы средствами NumPy
+        @param encoded Закодированные неотрицательные ключи
+        @return True если выбран NumPy и ключи помещаются в uint64
+        """
+        if self.backend == "python" or np is None:
+            return False
+        if self.backend == "auto" and len(encoded) < self.NUMPY_MIN_SIZE:
+            return False
+        return max(encoded) < 2 ** 64
+
+    def _radix_argsort_numpy(self, keys: List[int]) -> List[int]:
+        """
+        @brief Векторизованная поразрядная сортировка, возвращающая перестановку
+        @param keys Неотрицательные ключи, помещающиеся в uint64
+        @return Перестановка индексов, упорядочивающая ключи (устойчиво)
+        @details Гистограмма разряда считается через bincount, раскладка по
+                 корзинам - устойчивым argsort по цифрам разряда
+        """
+        n = len(keys)
+        base = self.base
+        values = np.array(keys, dtype=np.uint64)
+        permutation = np.arange(n)
+        max_val = int(values.max())
+        exp = 1
+
+        while max_val // exp > 0:
+            start_time = time.perf_counter()
+            digits = ((values // np.uint64(exp)) % np.uint64(base)).astype(np.intp)
+            counts = np.bincount(digits, minlength=base)
+            exp *= base
+
+            # Все элементы в одной корзине - проход не меняет порядок
+            if counts[digits[0]] == n:
+                self.skipped_passes += 1
+                continue
+
+            order = np.argsort(digits, kind='stable')
+            values = values[order]
+            permutation = permutation[order]
+            self.passes += 1
+            if self.instrumented:
+                self.pass_times.append(time.perf_counter() - start_time)
+
+        return permutation.tolist()
+
+    def _radix_sort(self, keys: List[int], items: Optional[List[T]]) -> List[Any]:
+        """
+        @brief Поразрядная сортировка неотрицательных целых ключей
+        @param keys Массив ключей (используется как один из буферов и портится)
+        @param items Параллельный массив элементов или None, если элементы совпадают с ключами
+        @return Отсортированный массив элементов (или ключей, если items равен None)
+        """
+        n = len(keys)
+        base = self.base
+        power_of_two = base & (base - 1) == 0
+        bits = base.bit_length() - 1
+        mask = base - 1
+
+        # Два буфера, между которыми переключаются проходы, и буфер разрядов,
+        # выделяемый один раз на всю сортировку
+        src_keys, dst_keys = keys, [0] * n
+        src_items, dst_items = items, ([None] * n if items is not None else None)
+        digits = [0] * n
+
+        # Находим количество разрядов максимального значения
+        digit_count = 0
+        remaining = max(keys)
+        while remaining > 0:
+            remaining //= base
+            digit_count += 1
+
+        shift = 0
+        exp = 1
+        for _ in range(digit_count):
+            start_time = time.perf_counter()
+
+            # Вычисляем разряды в общий буфер и подсчитываем количество элементов для каждой цифры
+            count = [0] * base
+            if power_of_two:
+                for i, k in enumerate(src_keys):
+                    digit = (k >> shift) & mask
+                    digits[i] = digit
+                    count[digit] += 1
+            else:
+                for i, k in enumerate(src_keys):
+                    digit = (k // exp) % base
+                    digits[i] = digit
+                    count[digit] += 1
+
+            shift += bits
+            exp *= base
+
+            # Все элементы в одной корзине - проход не меняет порядок
+            if count[digits[0]] == n:
+                self.skipped_passes += 1
+                continue
+
+            # Преобразуем count в начальные позиции корзин
+            total = 0
+            for i in range(base):
+                count[i], total = total, total + count[i]
+
+            # Устойчиво раскладываем элементы по корзинам
+            if src_items is None:
+                for i in range(n):
+                    digit = digits[i]
+                    dst_keys[count[digit]] = src_keys[i]
+                    count[digit] += 1
+            else:
+                for i in range(n):
+                    digit = digits[i]
+                    position = count[digit]
+                    dst_keys[position] = src_keys[i]
+                    dst_items[position] = src_items[i]
+                    count[digit] = position + 1
+
+            src_keys, dst_keys = dst_keys, src_keys
+            src_items, dst_items = dst_items, src_items
+            self.passes += 1
+            if self.instrumented:
+                self.pass_times.append(time.perf_counter() - start_time)
+
+        return src_keys if src_items is None else src_items
+
+    def _sort_with_key(self, arr: List[T], key: Callable[[T], Any] = None, reverse: bool = False) -> List[T]:
+        """
+        @brief Альтернативный метод сортировки для нецелочисленных типов
+        @param arr Массив для сортировки
+        @param key Функция извлечения ключа
+        @param reverse Флаг обратной сортировки
+        @return Отсортированный массив
+        """
+        # Используем встроенную сортировку для нецелочисленных типов
+        result = sorted(arr, key=key, reverse=reverse)
+        return result
+
+    def get_statistics(self) -> dict:
+        """
+        @brief Возвращает статистику последней сортировки
+        @return Словарь со статистикой (количество проходов)
+        """
+        statistics = {
+            'passes': self.passes,
+            'skipped_passes': self.skipped_passes,
+            'backend': self.backend_used
+        }
+        if self.instrumented:
+            statistics['pass_times'] = self.pass_times
+        if self.adaptive:
+            statistics.update({
+                'runs': self.runs,
+                'descents': self.descents,
+                'adaptive_strategy': self.adaptive_strategy
+            })
+        return statistics
+
+
+class MSDRadixSorter(BaseSorter):
+    """
+    @class MSDRadixSorter
+    @brief Поразрядная сортировка со старшего разряда на месте (American flag sort)
+    @details Элементы переставляются циклами внутри самого буфера, после чего
+             алгоритм сортирует каждую корзину по следующему разряду.
+             Корзины размером не больше small_bucket досортировываются вставками.
+
+    Временная сложность: O(d * (n + k)), где d - количество разрядов, k - основание
+    Дополнительная память: O(k * d) для целых неотрицательных элементов без key
+    (при key или ключах других типов - еще массив закодированных ключей)
+    Сортировка неустойчива.
+    """
+
+    SMALL_BUCKET = 32  #< Корзины не больше этого размера сортируются вставками
+
+    def __init__(self, base: int = 256, small_bucket: int = SMALL_BUCKET):
+        """
+        @brief Конструктор класса MSDRadixSorter
+        @param base Основание системы счисления (по умолчанию 256)
+        @param small_bucket Размер корзины, начиная с которого разряды больше не раскладываются
+        @throws ValueError если основание меньше 2
+        """
+        if base < 2:
+            raise ValueError(f"Основание системы счисления должно быть не меньше 2: {base}")
+        self.base = base
+        self.small_bucket = max(1, small_bucket)
+        self.passes = 0
+        self.skipped_passes = 0
+        self.small_buckets = 0
+        self.max_depth = 0
+
+    def sort(self, data: List[T], key: Callable[[T], Any] = None, reverse: bool = False) -> List[T]:
+        """
+        @brief Сортирует копию списка методом American flag sort
+        @param data Список для сортировки (не изменяется)
+        @param key Функция извлечения ключа (int, float, str или bytes)
+        @param reverse Флаг сортировки по убыванию
+        @return Отсортированный список
+        """
+        arr = copy.copy(data)
+        self.sort_in_place(arr, key, reverse)
+        return arr
+
+    def sort_in_place(self, data: List[T], key: Callable[[T], Any] = None, reverse: bool = False) -> None:
+        """
+        @brief Сортирует список на месте, не выделяя буферов размера n
+        @param data Список для сортировки (изменяется)
+        @param key Функция извлечения ключа (int, float, str или bytes)
+        @param reverse Флаг сортировки по убыванию
+        @details Ключи, которые нельзя закодировать (см. LSDRadixSorter._encode_keys),
+                 сортируются встроенным list.sort
+        """
+        self.passes = 0
+        self.skipped_passes = 0
+        self.small_buckets = 0
+        self.max_depth = 0
+
+        if not data:
+            return
+
+        keys = [key(item) for item in data] if key else data
+        encoded = LSDRadixSorter._encode_keys(keys)
+        if encoded is None:
+            data.sort(key=key, reverse=reverse)
+            return
+
+        # Целые неотрицательные элементы сортируются сами по себе, без параллельного массива
+        items = None if encoded is data else data
+
+        digit_count = 0
+        remaining = max(encoded)
+        while remaining > 0:
+            remaining //= self.base
+            digit_count += 1
+
+        if digit_count == 0:
+            self.skipped_passes += 1
+        else:
+            self._flag_sort(encoded, items, 0, len(encoded), digit_count - 1)
+
+        if reverse:
+            data.reverse()
+
+    def _flag_sort(self, keys: List[int], items: Optional[List[T]], lo: int, hi: int,
+                   level: int) -> None:
+        """
+        @brief Раскладывает диапазон [lo, hi) по разряду level, затем корзины - по следующим разрядам
+        @param keys Массив ключей
+        @param items Параллельный массив элементов или None
+        @param lo Начало диапазона
+        @param hi Конец диапазона (не включается)
+        @param level Номер старшего разряда (0 - младший)
+        @details Корзины обрабатываются через явный стек диапазонов (lo, hi, level, depth),
+                 а не рекурсией: глубина равна числу разрядов ключа и для длинных строк
+                 с общим префиксом превышает предел рекурсии Python
+        """
+        base = self.base
+        power_of_two = base & (base - 1) == 0
+        mask = base - 1
+        bits = base.bit_length() - 1
+
+        stack = [(lo, hi, level, 1)]
+        while stack:
+            lo, hi, level, depth = stack.pop()
+            self.max_depth = max(self.max_depth, depth)
+
+            if hi - lo <= self.small_bucket:
+                self.small_buckets += 1
+                self._insertion_sort(keys, items, lo, hi)
+                continue
+
+            while True:
+                shift = level * bits
+                exp = base ** level
+
+                count = [0] * base
+                for i in range(lo, hi):
+                    k = keys[i]
+                    count[(k >> shift) & mask if power_of_two else k // exp % base] += 1
+
+                k = keys[lo]
+                single = count[(k >> shift) & mask if power_of_two else k // exp % base] == hi - lo
+                if not single:
+                    break
+
+                # Все элементы в одной корзине - сразу переходим к следующему разряду
+                self.skipped_passes += 1
+                if level == 0:
+                    break
+                level -= 1
+
+            if single:
+                continue
+
+            # Границы корзин: heads[b] - следующая свободная позиция, ends[b] - конец корзины
+            heads = [0] * base
+            ends = [0] * base
+            total = lo
+            for b in range(base):
+                heads[b] = total
+                total += count[b]
+                ends[b] = total
+            starts = heads[:]
+
+            # Переставляем элементы циклами: каждый элемент переносится сразу в свою корзину
+            for b in range(base):
+                while heads[b] < ends[b]:
+                    position = heads[b]
+                    k = keys[position]
+                    item = items[position] if items is not None else None
+                    digit = (k >> shift) & mask if power_of_two else k // exp % base
+                    while digit != b:
+                        j = heads[digit]
+                        heads[digit] = j + 1
+                        keys[j], k = k, keys[j]
+                        if items is not None:
+                            items[j], item = item, items[j]
+                        digit = (k >> shift) & mask if power_of_two else k // exp % base
+                    keys[position] = k
+                    if items is not None:
+                        items[position] = item
+                    heads[b] = position + 1
+            self.passes += 1
+
+            if level == 0:
+                continue
+
+            # Корзины кладутся в стек с конца, чтобы обрабатываться по возрастанию
+            for b in range(base - 1, -1, -1):
+                if ends[b] - starts[b] > 1:
+                    stack.append((starts[b], ends[b], level - 1, depth + 1))
+
+    @staticmethod
+    def _insertion_sort(keys: List[int], items: Optional[List[T]], lo: int, hi: int) -> None:
+        """
+        @brief Сортировка вставками диапазона [lo, hi) с параллельным массивом элементов
+        @param keys Массив ключей
+        @param items Параллельный массив элементов или None
+        @param lo Начало диапазона
+        @param hi Конец диапазона (не включается)
+        """
+        for i in range(lo + 1, hi):
+            temp = keys[i]
+            temp_item = items[i] if items is not None else None
+            j = i
+            while j > lo and keys[j - 1] > temp:
+                keys[j] = keys[j - 1]
+                if items is not None:
+                    items[j] = items[j - 1]
+                j -= 1
+            keys[j] = temp
+            if items is not None:
+                items[j] = temp_item
+
+    def get_statistics(self) -> dict:
+        """
+        @brief Возвращает статистику последней сортировки
+        @return Словарь с количеством раскладок, пропущенных разрядов,
+                досортированных вставками корзин и глубиной разложения
+        """
+        return {
+            'passes': self.passes,
+            'skipped_passes': self.skipped_passes,
+            'small_buckets': self.small_buckets,
+            'max_depth': self.max_depth
+        }
+
+
+def _sort_chunk_worker(task: Tuple[str, List[Any], int, bool]) -> List[Tuple[Any, int]]:
+    """
+    @brief Сортирует фрагмент ключей в процессе-исполнителе
+    @param task Кортеж (алгоритм, ключи фрагмента, смещение фрагмента, reverse)
+    @return Отсортированные пары (ключ, глобальный индекс)
+    """
+    algorithm, keys, offset, reverse = task
+    if algorithm == "shell":
+        sorter = ShellSorter(instrumented=False)
+    else:
+        sorter = LSDRadixSorter(backend="python", instrumented=False)
+    order = sorter.sort(list(range(len(keys))), key=keys.__getitem__, reverse=reverse)
+    return [(keys[i], offset + i) for i in order]
+
+
+def _radix_histogram_worker(task: Tuple[List[int], int, int]) -> List[List[int]]:
+    """
+    @brief Строит гистограммы всех разрядов фрагмента закодированных ключей
+    @param task Кортеж (ключи фрагмента, основание, количество разрядов)
+    @return Таблица count[разряд][цифра]
+    @details Количество цифр в каждом разряде не зависит от порядка элементов,
+             поэтому гистограммы всех проходов можно построить заранее и параллельно
+    """
+    keys, base, digit_count = task
+    tables = []
+    exp = 1
+    for _ in range(digit_count):
+        count = [0] * base
+        for k in keys:
+            count[(k // exp) % base] += 1
+        tables.append(count)
+        exp *= base
+    return tables
+
+
+class ParallelSorter(BaseSorter):
+    """
+    @class ParallelSorter
+    @brief Многопроцессная сортировка больших массивов
+    @details В процессы передаются только ключи, сами объекты остаются в
+             родительском процессе и собираются по итоговой перестановке.
+
+    Алгоритм "shell": массив делится на фрагменты, каждый фрагмент сортируется
+    в пуле процессов, после чего фрагменты сливаются k-путевым слиянием (heapq.merge).
+
+    Алгоритм "radix": гистограммы всех разрядов строятся параллельно по фрагментам,
+    суммируются, после чего выполняются проходы раскладки; проходы с одной
+    непустой корзиной пропускаются без повторного подсчета.
+    """
+
+    ALGORITHMS = ("shell", "radix")
+
+    def __init__(self, algorithm: str = "shell", workers: Optional[int] = None,
+                 min_chunk_size: int = 50000):
+        """
+        @brief Конструктор класса ParallelSorter
+        @param algorithm Алгоритм сортировки фрагментов ("shell" или "radix")
+        @param workers Количество процессов (по умолчанию число ядер)
+        @param min_chunk_size Минимальный размер фрагмента; меньшие входы сортируются в текущем процессе
+        @throws ValueError если указан неизвестный алгоритм или неверные параметры
+        """
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(f"Неизвестный алгоритм: {algorithm}. "
+                             f"Доступные: {', '.join(self.ALGORITHMS)}")
+        if workers is not None and workers < 1:
+            raise ValueError(f"Количество процессов должно быть положительным: {workers}")
+        if min_chunk_size < 1:
+            raise ValueError(f"Размер фрагмента должен быть положительным: {min_chunk_size}")
+        self.algorithm = algorithm
+        self.workers = workers or os.cpu_count() or 1
+        self.min_chunk_size = min_chunk_size
+        self.chunks = 0
+        self.passes = 0
+
+    def sort(self, data: List[T], key: Callable[[T], Any] = None, reverse: bool = False) -> List[T]:
+        """
+        @brief Сортирует список с использованием пула процессов
+        @param data Список для сортировки
+        @param key Функция извлечения ключа (вызывается в текущем процессе)
+        @param reverse Флаг сортировки по убыванию
+        @return Отсортированный список
+        """
+        self.chunks = 0
+        self.passes = 0
+
+        arr = copy.copy(data)
+        n = len(arr)
+        chunk_count = min(self.workers, n // self.min_chunk_size)
+
+        if chunk_count < 2:
+            self.chunks = 1 if n else 0
+            sorter = ShellSorter() if self.algorithm == "shell" else LSDRadixSorter()
+            result = sorter.sort(arr, key, reverse)
+            self.passes = getattr(sorter, 'passes', 0)
+            return result
+
+        keys = [key(item) for item in arr] if key else arr
+        self.chunks = chunk_count
+        bounds = [n * i // chunk_count for i in range(chunk_count + 1)]
+
+        if self.algorithm == "radix":
+            encoded = LSDRadixSorter._encode_keys(keys)
+            if encoded is not None:
+                if reverse:
+                    # Инверсия ключа (max - k) сохраняет исходный порядок равных элементов
+                    max_val = max(encoded)
+                    encoded = [max_val - k for k in encoded]
+                order = self._parallel_radix(encoded, bounds)
+                return [arr[i] for i in order]
+
+        tasks = [(self.algorithm, keys[bounds[i]:bounds[i + 1]], bounds[i], reverse)
+                 for i in range(chunk_count)]
+        with ProcessPoolExecutor(max_workers=chunk_count) as executor:
+            runs = list(executor.map(_sort_chunk_worker, tasks))
+
+        merged = heapq.merge(*runs, key=operator.itemgetter(0), reverse=reverse)
+        return [arr[index] for _, index in merged]
+
+    def _parallel_radix(self, keys: List[int], bounds: List[int]) -> List[int]:
+        """
+        @brief LSD сортировка с параллельным построением гистограмм
+        @param keys Закодированные неотрицательные ключи
+        @param bounds Границы фрагментов
+        @return Перестановка индексов, упорядочивающая ключи (устойчиво)
+        """
+        n = len(keys)
+        base = LSDRadixSorter().base
+
+        digit_count = 0
+        remaining = max(keys)
+        while remaining > 0:
+            remaining //= base
+            digit_count += 1
+
+        tasks = [(keys[bounds[i]:bounds[i + 1]], base, digit_count) for i in range(len(bounds) - 1)]
+        with ProcessPoolExecutor(max_workers=len(tasks)) as executor:
+            chunk_tables = list(executor.map(_radix_histogram_worker, tasks))
+
+        src_keys, dst_keys = list(keys), [0] * n
+        src_order, dst_order = list(range(n)), [0] * n
+        exp = 1
+
+        for digit_index in range(digit_count):
+            count = [sum(table[digit_index][d] for table in chunk_tables) for d in range(base)]
+            if max(count) == n:
+                exp *= base
+                continue
+
+            total = 0
+            for d in range(base):
+                count[d], total = total, total + count[d]
+
+            for i in range(n):
+                k = src_keys[i]
+                digit = (k // exp) % base
+                position = count[digit]
+                dst_keys[position] = k
+                dst_order[position] = src_order[i]
+                count[digit] = position + 1
+
+            src_keys, dst_keys = dst_keys, src_keys
+            src_order, dst_order = dst_order, src_order
+            exp *= base
+            self.passes += 1
+
+        return src_order
+
+    def get_statistics(self) -> dict:
+        """
+        @brief Возвращает статистику последней сортировки
+        @return Словарь со статистикой (алгоритм, процессы, фрагменты, проходы)
+        """
+        return {
+            'algorithm': self.algorithm,
+            'workers': self.workers,
+            'chunks': self.chunks,
+            'passes': self.passes
+        }
+
+    @staticmethod
+    def benchmark_speedup(data: List[T], algorithm: str = "shell",
+                          worker_counts: Optional[List[int]] = None,
+                          min_chunk_size: int = 1) -> Dict[int, dict]:
+        """
+        @brief Измеряет ускорение в зависимости от количества процессов
+        @param data Список для сортировки
+        @param algorithm Алгоритм сортировки фрагментов
+        @param worker_counts Проверяемые количества процессов (по умолчанию 1, 2, 4, ... до числа ядер)
+        @param min_chunk_size Минимальный размер фрагмента
+        @return Словарь {процессы: {'time', 'speedup'}}, ускорение относительно одного процесса
+        """
+        if worker_counts is None:
+            cores = os.cpu_count() or 1
+            worker_counts = [1]
+            while worker_counts[-1] * 2 <= cores:
+                worker_counts.append(worker_counts[-1] * 2)
+            if worker_counts[-1] != cores:
+                worker_counts.append(cores)
+
+        results = {}
+        baseline = None
+        for workers in worker_counts:
+            sorter = ParallelSorter(algorithm, workers, min_chunk_size)
+            start_time = time.perf_counter()
+            sorter.sort(data)
+            elapsed = time.perf_counter() - start_time
+            if baseline is None:
+                baseline = elapsed
+            results[workers] = {
+                'time': elapsed,
+                'speedup': baseline / elapsed if elapsed > 0 else float('inf')
+            }
+        return results
+
+
+class ExternalSorter:
+    """
+    @class ExternalSorter
+    @brief Внешняя сортировка данных, не помещающихся в оперативную память
+    @details Записи читаются потоком; как только оценка занимаемой памяти
+             превышает memory_budget, накопленный фрагмент сортируется
+             (Shell или radix) и сбрасывается во временный файл-серию.
+             Затем серии сливаются k-путевым слиянием на куче с буферизованным
+             чтением; если серий больше max_merge_width, слияние многоуровневое.
+
+    Серии хранят пары (ключ, запись) в формате pickle, поэтому функция ключа
+    вызывается для каждой записи ровно один раз.
+    """
+
+    ALGORITHMS = ("shell", "radix")
+
+    def __init__(self, memory_budget: int = 64 * 1024 * 1024, algorithm: str = "radix",
+                 max_merge_width: int = 64, buffer_size: int = 1024 * 1024,
+                 temp_dir: Optional[str] = None):
+        """
+        @brief Конструктор класса ExternalSorter
+        @param memory_budget Приблизительный объем памяти под одну серию в байтах
+        @param algorithm Алгоритм сортировки серий ("shell" или "radix")
+        @param max_merge_width Максимальное число серий, сливаемых за один проход
+        @param buffer_size Размер буфера чтения и записи файла серии в байтах
+        @param temp_dir Каталог для временных файлов (по умолчанию системный)
+        @throws ValueError если указан неизвестный алгоритм или неверные параметры
+        """
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(f"Неизвестный алгоритм: {algorithm}. "
+                             f"Доступные: {', '.join(self.ALGORITHMS)}")
+        if memory_budget < 1 or buffer_size < 1:
+            raise ValueError("Объем памяти и размер буфера должны быть положительными")
+        if max_merge_width < 2:
+            raise ValueError(f"Ширина слияния должна быть не меньше 2: {max_merge_width}")
+        self.memory_budget = memory_budget
+        self.algorithm = algorithm
+        self.max_merge_width = max_merge_width
+        self.buffer_size = buffer_size
+        self.temp_dir = temp_dir
+        self.records = 0
+        self.runs = 0
+        self.merges = 0
+
+    def sort_stream(self, records: Iterable[T], key: Callable[[T], Any] = None,
+                    reverse: bool = False) -> Iterator[T]:
+        """
+        @brief Сортирует поток записей
+        @param records Итерируемый источник записей (записи должны поддерживать pickle)
+        @param key Функция извлечения ключа для сравнения
+        @param reverse Флаг сортировки по убыванию
+        @return Итератор по отсортированным записям; временные файлы удаляются
+                после полного прохода по итератору или его закрытия
+        """
+        self.records = 0
+        self.runs = 0
+        self.merges = 0
+
+        run_files = []
+        chunk = []
+        chunk_bytes = 0
+
+        try:
+            for record in records:
+                record_key = key(record) if key else record
+                chunk.append((record_key, record))
+                chunk_bytes += sys.getsizeof(record) + sys.getsizeof(record_key)
+                self.records += 1
+
+                if chunk_bytes >= self.memory_budget:
+                    run_files.append(self._spill(self._sort_run(chunk, reverse)))
+                    chunk = []
+                    chunk_bytes = 0
+
+            if not run_files:
+                # Все данные поместились в память - временные файлы не нужны
+                self.runs = 1 if chunk else 0
+                for _, record in self._sort_run(chunk, reverse):
+                    yield record
+                return
+
+            if chunk:
+                run_files.append(self._spill(self._sort_run(chunk, reverse)))
+            chunk = []
+            self.runs = len(run_files)
+
+            while len(run_files) > self.max_merge_width:
+                run_files = self._merge_level(run_files, reverse)
+
+            self.merges += 1
+            for _, record in self._merge(run_files, reverse):
+                yield record
+        finally:
+            self._remove(run_files)
+
+    def sort_file(self, input_path: str, output_path: str, key: Callable[[str], Any] = None,
+                  reverse: bool = False, encoding: str = 'utf-8') -> None:
+        """
+        @brief Сортирует строки текстового файла в выходной файл
+        @param input_path Путь к входному файлу (одна запись на строку)
+        @param output_path Путь к выходному файлу
+        @param key Функция извлечения ключа из строки (без символа перевода строки)
+        @param reverse Флаг сортировки по убыванию
+        @param encoding Кодировка файлов
+        @throws FileNotFoundError если входной файл не существует
+        """
+        with open(input_path, 'r', encoding=encoding, buffering=self.buffer_size) as source, \
+                open(output_path, 'w', encoding=encoding, buffering=self.buffer_size) as target:
+            lines = (line.rstrip('\n') for line in source)
+            for line in self.sort_stream(lines, key, reverse):
+                target.write(line + '\n')
+
+    def _merge_level(self, run_files: List[str], reverse: bool) -> List[str]:
+        """
+        @brief Сливает соседние группы по max_merge_width серий в одну серию каждую
+        @param run_files Пути к файлам серий в порядке поступления записей
+        @param reverse Флаг сортировки по убыванию
+        @return Пути к сериям следующего уровня в том же порядке
+        @details Слитая серия занимает место своей группы, поэтому записи
+                 с равными ключами сохраняют исходный порядок (слияние устойчиво).
+                 Файлы группы удаляются, даже если слияние прервано исключением;
+                 при исключении удаляются и уже созданные серии этого уровня
+        """
+        merged_runs = []
+        try:
+            for start in range(0, len(run_files), self.max_merge_width):
+                group = run_files[start:start + self.max_merge_width]
+                if len(group) == 1:
+                    merged_runs.append(group[0])
+                    continue
+                try:
+                    merged_runs.append(self._spill(self._merge(group, reverse)))
+                finally:
+                    self._remove(group)
+                self.merges += 1
+        except BaseException:
+            self._remove(merged_runs)
+            raise
+        return merged_runs
+
+    def _sort_run(self, chunk: List[Tuple[Any, T]], reverse: bool) -> List[Tuple[Any, T]]:
+        """
+        @brief Сортирует фрагмент пар (ключ, запись) в памяти
+        @param chunk Фрагмент пар
+        @param reverse Флаг сортировки по убыванию
+        @return Отсортированный фрагмент
+        """
+        if self.algorithm == "shell":
+            sorter = ShellSorter(instrumented=False)
+        else:
+            sorter = LSDRadixSorter(instrumented=False)
+        return sorter.sort(chunk, key=operator.itemgetter(0), reverse=reverse)
+
+    def _spill(self, pairs: Iterable[Tuple[Any, T]]) -> str:
+        """
+        @brief Записывает отсортированные пары во временный файл-серию
+        @param pairs Отсортированные пары (ключ, запись)
+        @return Путь к файлу серии
+        """
+        fd, path = tempfile.mkstemp(prefix="sort_run_", suffix=".pkl", dir=self.temp_dir)
+        try:
+            with os.fdopen(fd, 'wb', buffering=self.buffer_size) as f:
+                # Каждая пара записывается независимо, чтобы таблица ссылок pickle не росла
+                for pair in pairs:
+                    pickle.dump(pair, f, pickle.HIGHEST_PROTOCOL)
+        except BaseException:
+            os.unlink(path)
+            raise
+        return path
+
+    def _read_run(self, path: str) -> Iterator[Tuple[Any, T]]:
+        """
+        @brief Последовательно читает пары из файла серии
+        @param path Путь к файлу серии
+        @return Итератор по парам (ключ, запись)
+        """
+        with open(path, 'rb', buffering=self.buffer_size) as f:
+            while True:
+                try:
+                    yield pickle.load(f)
+                except EOFError:
+                    return
+
+    def _merge(self, paths: List[str], reverse: bool) -> Iterator[Tuple[Any, T]]:
+        """
+        @brief K-путевое слияние серий на куче
+        @param paths Пути к файлам серий
+        @param reverse Флаг сортировки по убыванию
+        @return Итератор по слитым парам (ключ, запись)
+        """
+        return heapq.merge(*(self._read_run(path) for path in paths),
+                           key=operator.itemgetter(0), reverse=reverse)
+
+    @staticmethod
+    def _remove(paths: List[str]) -> None:
+        """
+        @brief Удаляет временные файлы серий
+        @param paths Пути к файлам
+        """
+        for path in paths:
+            if os.path.exists(path):
+                os.unlink(path)
+
+    def get_statistics(self) -> dict:
+        """
+        @brief Возвращает статистику последней сортировки
+        @return Словарь со статистикой (записи, серии, операции слияния)
+        """
+        return {
+            'records': self.records,
+            'runs': self.runs,
+            'merges': self.merges
+        }
+
+
+class RecordSorter:
+    """
+    @class RecordSorter
+    @brief Поразрядная сортировка записей фиксированной ширины прямо в двоичном буфере
+    @details Записи описываются форматом struct (например "<HHQ" для года, числа
+             страниц и ISBN книги). Ключ сортировки задается номерами полей формата.
+             Объекты Python для записей не создаются: байты ключевых полей читаются
+             из буфера напрямую и приводятся к беззнаковому виду с сохранением
+             порядка, LSD-проходы по байтам упорядочивают массив номеров записей
+             (array('q'), 8 байт на запись), а затем записи переставляются
+             в буфере циклами перестановки через буфер размером в одну запись.
+
+    Поддерживаемые типы ключевых полей: целые (b B h H i I l L q Q n N ?),
+    числа с плавающей точкой (e f d) и байтовые строки (c s p).
+    """
+
+    BYTE_ORDERS = "@=<>!"
+    INTEGER_CODES = "bBhHiIlLqQnN?"
+    SIGNED_CODES = "bhilqn"
+    FLOAT_CODES = "efd"
+    BYTES_CODES = "csp"
+
+    def __init__(self, record_format: str, key_fields: Sequence[int] = (0,)):
+        """
+        @brief Конструктор класса RecordSorter
+        @param record_format Формат записи модуля struct
+        @param key_fields Номера полей формата, образующих ключ, в порядке приоритета
+        @throws ValueError если формат не содержит полей, номер поля неверен
+                или поле не может быть ключом
+        """
+        self.record_format = record_format
+        self.record_size = struct.calcsize(record_format)
+        self.fields = self._parse_format(record_format)
+        if not key_fields:
+            raise ValueError("Нужно указать хотя бы одно ключевое поле")
+        for index in key_fields:
+            if not 0 <= index < len(self.fields):
+                raise ValueError(f"Номер поля {index} вне диапазона: "
+                                 f"в формате {len(self.fields)} полей")
+            if self.fields[index][0] == 'P':
+                raise ValueError("Указатель не может быть ключом сортировки")
+        self.key_fields = list(key_fields)
+        self.records = 0
+        self.passes = 0
+        self.skipped_passes = 0
+        self.moves = 0
+
+    def _parse_format(self, record_format: str) -> List[Tuple[str, int, int]]:
+        """
+        @brief Разбирает формат struct на поля
+        @param record_format Формат записи
+        @return Список полей (код, смещение в записи, размер в байтах)
+        @throws ValueError если в формате нет полей
+        """
+        order = record_format[0] if record_format[:1] in self.BYTE_ORDERS else "@"
+        body = record_format[1:] if record_format[:1] in self.BYTE_ORDERS else record_format
+
+        fields = []
+        prefix = ""
+        for count, code in re.findall(r'(\d*)([xcbB?hHiIlLqQnNefdspP])', body):
+            count = int(count) if count else 1
+            if code in "sp":
+                tokens = [f"{count}{code}"]
+            else:
+                tokens = [code] * count
+            for token in tokens:
+                # Смещение с учетом выравнивания: размер префикса вместе с полем минус размер поля
+                size = struct.calcsize(order + token)
+                offset = struct.calcsize(order + prefix + token) - size
+                prefix += token
+                if code != 'x':
+                    fields.append((code, offset, size))
+
+        if not fields:
+            raise ValueError(f"Формат {record_format!r} не содержит полей")
+        self.big_endian = order in ">!" or (order in "@=" and sys.byteorder == "big")
+        return fields
+
+    def _key_bytes(self) -> List[Tuple[int, str, int]]:
+        """
+        @brief Перечисляет байты ключа от старшего к младшему
+        @return Список (смещение байта в записи, преобразование, смещение старшего байта поля)
+        @details Преобразования приводят байты к беззнаковому порядку: "raw" - без
+                 изменений, "sign" - инверсия знакового бита, "float_sign" и "float" -
+                 преобразование IEEE-754 (у отрицательных чисел инвертируются все биты),
+                 "pascal" - байт содержимого строки 'p' или 0 за пределами ее длины.
+                 У строки 'p' сначала сравнивается содержимое, а байт длины, хранящийся
+                 первым, служит последним разрядом: так "ab" < "ab\\x00" < "b"
+        """
+        key_bytes = []
+        for index in self.key_fields:
+            code, offset, size = self.fields[index]
+            if code == 'p':
+                key_bytes.extend((offset + i, "pascal", offset) for i in range(1, size))
+                key_bytes.append((offset, "raw", offset))
+                continue
+            if code in self.BYTES_CODES:
+                key_bytes.extend((offset + i, "raw", offset) for i in range(size))
+                continue
+
+            positions = list(range(offset, offset + size))
+            if not self.big_endian:
+                positions.reverse()
+            msb = positions[0]
+            if code in self.FLOAT_CODES:
+                key_bytes.append((msb, "float_sign", msb))
+                key_bytes.extend((position, "float", msb) for position in positions[1:])
+            else:
+                key_bytes.append((msb, "sign" if code in self.SIGNED_CODES else "raw", msb))
+                key_bytes.extend((position, "raw", msb) for position in positions[1:])
+        return key_bytes
+
+    def sort(self, buffer: Union[bytearray, memoryview, mmap.mmap], reverse: bool = False) -> None:
+        """
+        @brief Сортирует записи на месте в буфере
+        @param buffer Изменяемый буфер: bytearray, memoryview или mmap
+        @param reverse Флаг сортировки по убыванию (сортировка устойчива в обоих направлениях)
+        @throws ValueError если длина буфера не кратна размеру записи
+        @throws TypeError если буфер доступен только для чтения
+        """
+        view = memoryview(buffer).cast('B')
+        try:
+            if view.readonly:
+                raise TypeError("Буфер доступен только для чтения")
+            if len(view) % self.record_size:
+                raise ValueError(f"Длина буфера {len(view)} не кратна размеру записи "
+                                 f"{self.record_size}")
+
+            n = len(view) // self.record_size
+            self.records = n
+            self.passes = 0
+            self.skipped_passes = 0
+            self.moves = 0
+            if n < 2:
+                return
+
+            order = self._argsort_records(view, n, reverse)
+            self._apply_order(view, order)
+        finally:
+            view.release()
+
+    def sort_file(self, path: str, reverse: bool = False) -> None:
+        """
+        @brief Сортирует записи двоичного файла на месте через отображение в память
+        @param path Путь к файлу записей
+        @param reverse Флаг сортировки по убыванию
+        @throws FileNotFoundError если файл не существует
+        @throws ValueError если размер файла не кратен размеру записи
+        """
+        with open(path, 'r+b') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                self.records = 0
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_WRITE) as mapped:
+                self.sort(mapped, reverse)
+                mapped.flush()
+
+    def _argsort_records(self, view: memoryview, n: int, reverse: bool) -> array:
+        """
+        @brief Вычисляет порядок записей LSD-проходами по байтам ключа
+        @param view Байтовое представление буфера
+        @param n Количество записей
+        @param reverse Флаг сортировки по убыванию
+        @return Массив номеров записей в порядке сортировки
+        """
+        size = self.record_size
+        flip = 0xFF if reverse else 0
+        src = array('q', range(n))
+        dst = array('q', bytes(8 * n))
+
+        for position, transform, msb in reversed(self._key_bytes()):
+            if transform == "raw":
+                digits = [view[i * size + position] ^ flip for i in src]
+            elif transform == "sign":
+                digits = [view[i * size + position] ^ 0x80 ^ flip for i in src]
+            elif transform == "pascal":
+                # Байты после длины строки не входят в ключ
+                digits = [(view[i * size + position] if view[i * size + msb] >= position - msb
+                           else 0) ^ flip for i in src]
+            elif transform == "float_sign":
+                digits = [(view[i * size + position] ^ 0xFF if view[i * size + position] & 0x80
+                           else view[i * size + position] | 0x80) ^ flip for i in src]
+            else:
+                digits = [view[i * size + position] ^ (0xFF if view[i * size + msb] & 0x80 else 0)
+                          ^ flip for i in src]
+
+            count = [0] * 256
+            for digit in digits:
+                count[digit] += 1
+
+            # Все записи в одной корзине - проход не меняет порядок
+            if count[digits[0]] == n:
+                self.skipped_passes += 1
+                continue
+
+            total = 0
+            for b in range(256):
+                count[b], total = total, total + count[b]
+            for i in range(n):
+                digit = digits[i]
+                dst[count[digit]] = src[i]
+                count[digit] += 1
+
+            src, dst = dst, src
+            self.passes += 1
+
+        return src
+
+    def _apply_order(self, view: memoryview, order: array) -> None:
+        """
+        @brief Переставляет записи в буфере согласно порядку, обходя циклы перестановки
+        @param view Байтовое представление буфера
+        @param order Номера записей в порядке сортировки (портится)
+        """
+        size = self.record_size
+        temp = bytearray(size)
+
+        for start in range(len(order)):
+            if order[start] == start:
+                continue
+            temp[:] = view[start * size:(start + 1) * size]
+            j = start
+            while True:
+                source = order[j]
+                order[j] = j
+                if source == start:
+                    view[j * size:(j + 1) * size] = temp
+                    break
+                view[j * size:(j + 1) * size] = view[source * size:(source + 1) * size]
+                self.moves += 1
+                j = source
+            self.moves += 1
+
+    def get_statistics(self) -> dict:
+        """
+        @brief Возвращает статистику последней сортировки
+        @return Словарь с количеством записей, проходов и перемещений записей
+        """
+        return {
+            'records': self.records,
+            'passes': self.passes,
+            'skipped_passes': self.skipped_passes,
+            'moves': self.moves
+        }
+
+
+class AutoSorter(BaseSorter):
+    """
+    @class AutoSorter
+    @brief Сортировщик, выбирающий алгоритм по однократной выборке входных данных
+    @details Учитывает размер входа, тип ключей, диапазон ключей относительно n
+             и уже существующую упорядоченность, после чего передает работу
+             сортировке вставками, гибриду вставок и Шелла, LSD Radix или Shell sort.
+             Выбранная стратегия и причина выбора доступны в get_statistics()
+    """
+
+    INSERTION_MAX_SIZE = 32       #< До этого размера используется сортировка вставками
+    SAMPLE_SIZE = 256             #< Количество соседних пар в выборке упорядоченности
+    NEARLY_SORTED_FRACTION = 0.02 #< Доля спусков в выборке, при которой вход считается почти упорядоченным
+    RADIX_BASE = 256              #< Основание, по которому оценивается число проходов Radix
+
+    def __init__(self, instrumented: bool = True):
+        """
+        @brief Конструктор класса AutoSorter
+        @param instrumented Собирать статистику выбранного сортировщика
+        """
+        self.instrumented = instrumented
+        self.strategy = None
+        self.reason = None
+        self.key_type = None
+        self.sample_descents = 0.0
+        self.delegate = None
+
+    def sort(self, data: List[T], key: Callable[[T], Any] = None, reverse: bool = False) -> List[T]:
+        """
+        @brief Сортирует данные алгоритмом, выбранным по выборке
+        @param data Список элементов для сортировки
+        @param key Функция для извлечения ключа сравнения из элемента
+        @param reverse Флаг обратной сортировки (по убыванию)
+        @return Новый отсортированный список
+        """
+        return self.apply_permutation(data, self.argsort(data, key, reverse))
+
+    def argsort(self, data: List[T], key: Callable[[T], Any] = None, reverse: bool = False) -> List[int]:
+        """
+        @brief Возвращает перестановку индексов, упорядочивающую данные
+        @param data Список элементов
+        @param key Функция для извлечения ключа сравнения из элемента
+        @param reverse Флаг обратной сортировки (по убыванию)
+        @return Список индексов в порядке сортировки
+        """
+        keys = list(data) if key is None else [key(item) for item in data]
+        greater = operator.lt if reverse else operator.gt
+        self.delegate = None
+        self._choose_strategy(keys, greater)
+
+        if self.strategy == "insertion":
+            order = list(range(len(keys)))
+            ShellSorter._gap_pass(keys, order, 1, greater)
+            return order
+        if self.strategy == "hybrid":
+            self.delegate = ShellSorter(adaptive=True, instrumented=self.instrumented)
+        elif self.strategy == "radix":
+            self.delegate = LSDRadixSorter(base=self.RADIX_BASE, instrumented=self.instrumented)
+        else:
+            self.delegate = ShellSorter(gap_sequence="auto", instrumented=self.instrumented)
+        return self.delegate.argsort(keys, None, reverse)
+
+    def _choose_strategy(self, keys: List[Any], greater: Callable[[Any, Any], bool]) -> None:
+        """
+        @brief Выбирает стратегию сортировки и запоминает причину выбора
+        @param keys Массив ключей
+        @param greater Функция сравнения с учетом направления сортировки
+        """
+        n = len(keys)
+        self.key_type = type(keys[0]).__name__ if keys else None
+        self.sample_descents = 0.0
+
+        if n <= self.INSERTION_MAX_SIZE:
+            self.strategy = "insertion"
+            self.reason = f"малый размер входа: {n} <= {self.INSERTION_MAX_SIZE}"
+            return
+
+        # Выборка равномерно расположенных соседних пар
+        step = max(1, (n - 1) // self.SAMPLE_SIZE)
+        positions = range(0, n - 1, step)
+        descents = sum(greater(keys[i], keys[i + 1]) for i in positions)
+        self.sample_descents = descents / len(positions)
+
+        if (self.sample_descents <= self.NEARLY_SORTED_FRACTION
+                or self.sample_descents >= 1 - self.NEARLY_SORTED_FRACTION):
+            self.strategy = "hybrid"
+            self.reason = (f"вход почти упорядочен: доля спусков в выборке "
+                           f"{self.sample_descents:.3f}")
+            return
+
+        encoded = LSDRadixSorter._encode_keys(keys)
+        if encoded is None:
+            self.strategy = "shell"
+            self.reason = f"ключи типа {self.key_type} не кодируются для поразрядной сортировки"
+            return
+
+        key_range = max(encoded)
+        passes = -(-key_range.bit_length() // (self.RADIX_BASE.bit_length() - 1))
+        if passes <= n.bit_length():
+            self.strategy = "radix"
+            self.reason = (f"диапазон ключей {key_range} требует {passes} проходов "
+                           f"при log2(n) = {n.bit_length()}")
+        else:
+            self.strategy = "shell"
+            self.reason = (f"диапазон ключей {key_range.bit_length()} бит требует {passes} "
+                           f"проходов при log2(n) = {n.bit_length()}")
+
+    def get_statistics(self) -> dict:
+        """
+        @brief Возвращает выбранную стратегию, причину выбора и статистику сортировщика
+        @return Словарь со статистикой
+        """
+        statistics = {
+            'strategy': self.strategy,
+            'reason': self.reason,
+            'key_type': self.key_type,
+            'sample_descents': self.sample_descents
+        }
+        if self.delegate is not None:
+            statistics.update(self.delegate.get_statistics())
+        return statistics
+
+
+class SortedBatchList:
+    """
+    @class SortedBatchList
+    @brief Упорядоченный контейнер, принимающий данные пакетами
+    @details Элементы хранятся в отсортированных блоках размером порядка block_size.
+             Каждый новый пакет сортируется заданным сортировщиком (только сам
+             пакет), после чего его элементы распределяются по блокам бинарным
+             поиском по максимумам блоков и сливаются с ними; переполненные блоки
+             делятся. Повторная сортировка всего содержимого не выполняется.
+
+    Элементы с равными ключами из более позднего пакета располагаются после
+    уже добавленных.
+    """
+
+    BLOCK_SIZE = 1000  #< Желаемый размер блока; блок делится, когда превышает его вдвое
+
+    def __init__(self, iterable: Optional[Iterable[T]] = None, key: Callable[[T], Any] = None,
+                 sorter: Optional[BaseSorter] = None, block_size: int = BLOCK_SIZE):
+        """
+        @brief Конструктор класса SortedBatchList
+        @param iterable Начальные элементы (добавляются одним пакетом)
+        @param key Функция для извлечения ключа сравнения из элемента
+        @param sorter Сортировщик пакетов (по умолчанию AutoSorter)
+        @param block_size Желаемый размер блока
+        @throws ValueError если размер блока меньше 1
+        """
+        if block_size < 1:
+            raise ValueError(f"Размер блока должен быть положительным: {block_size}")
+        self.key = key
+        self.sorter = sorter if sorter is not None else AutoSorter(instrumented=False)
+        self.block_size = block_size
+        self._blocks: List[List[T]] = []
+        self._keys: List[List[Any]] = []
+        self._maxes: List[Any] = []
+        # Позиции первых элементов блоков и len в конце; None - пересчитать при запросе
+        self._starts: Optional[List[int]] = None
+        self._len = 0
+        self.batches = 0
+
+        if iterable is not None:
+            self.extend(iterable)
+
+    def add(self, item: T) -> None:
+        """
+        @brief Добавляет один элемент
+        @param item Элемент
+        """
+        self.extend([item])
+
+    def extend(self, batch: Iterable[T]) -> None:
+        """
+        @brief Добавляет пакет элементов
+        @param batch Элементы пакета в произвольном порядке
+        @details Пакет сортируется сортировщиком контейнера, затем сливается
+                 только с теми блоками, в диапазон которых попадают его ключи
+        """
+        items = list(batch)
+        if not items:
+            return
+
+        keys = items if self.key is None else [self.key(item) for item in items]
+        order = self.sorter.argsort(keys)
+        items = [items[i] for i in order]
+        keys = items if self.key is None else [keys[i] for i in order]
+        self.batches += 1
+        self._len += len(items)
+
+        if not self._blocks:
+            self._replace_block(0, 0, items, keys)
+            return
+
+        # Группируем элементы пакета по блокам: блок b получает ключи из [maxes[b-1], maxes[b])
+        groups = []
+        start = 0
+        last = len(self._blocks) - 1
+        while start < len(items):
+            block = min(bisect.bisect_right(self._maxes, keys[start]), last)
+            if block == last:
+                end = len(items)
+            else:
+                end = bisect.bisect_left(keys, self._maxes[block], start)
+            groups.append((block, start, end))
+            start = end
+
+        # Сливаем с конца, чтобы деление блоков не сдвигало номера еще не обработанных
+        for block, start, end in reversed(groups):
+            merged = list(heapq.merge(zip(self._keys[block], self._blocks[block]),
+                                      zip(keys[start:end], items[start:end]),
+                                      key=operator.itemgetter(0)))
+            merged_items = [item for _, item in merged]
+            merged_keys = merged_items if self.key is None else [k for k, _ in merged]
+            self._replace_block(block, block + 1, merged_items, merged_keys)
+
+    def _replace_block(self, first: int, last: int, items: List[T], keys: List[Any]) -> None:
+        """
+        @brief Заменяет блоки [first, last) отсортированными элементами, деля их на блоки
+        @param first Номер первого заменяемого блока
+        @param last Номер блока после последнего заменяемого
+        @param items Отсортированные элементы
+        @param keys Ключи элементов (сам список items, если функция ключа не задана)
+        """
+        size = self.block_size
+        if len(items) <= 2 * size:
+            bounds = [0, len(items)]
+        else:
+            bounds = list(range(0, len(items), size)) + [len(items)]
+
+        blocks = [items[lo:hi] for lo, hi in zip(bounds, bounds[1:])]
+        if self.key is None:
+            block_keys = blocks
+        else:
+            block_keys = [keys[lo:hi] for lo, hi in zip(bounds, bounds[1:])]
+
+        self._blocks[first:last] = blocks
+        self._keys[first:last] = block_keys
+        self._maxes[first:last] = [block[-1] for block in block_keys]
+        self._starts = None
+
+    def __len__(self) -> int:
+        """
+        @brief Возвращает количество элементов
+        """
+        return self._len
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        @brief Перебирает элементы в порядке сортировки
+        """
+        return itertools.chain.from_iterable(self._blocks)
+
+    def __reversed__(self) -> Iterator[T]:
+        """
+        @brief Перебирает элементы в обратном порядке
+        """
+        return itertools.chain.from_iterable(reversed(block) for block in reversed(self._blocks))
+
+    def __getitem__(self, index: int) -> T:
+        """
+        @brief Возвращает элемент по позиции в порядке сортировки
+        @param index Позиция (отрицательные значения отсчитываются с конца)
+        @throws IndexError если позиция вне диапазона
+        """
+        position = index + self._len if index < 0 else index
+        if not 0 <= position < self._len:
+            raise IndexError(f"Позиция {index} вне диапазона контейнера длины {self._len}")
+        block, offset = self._locate(position)
+        return self._blocks[block][offset]
+
+    def __contains__(self, item: T) -> bool:
+        """
+        @brief Проверяет наличие элемента, просматривая только элементы с равным ключом
+        """
+        key_value = item if self.key is None else self.key(item)
+        for candidate in self.irange(key_value, key_value):
+            if candidate == item:
+                return True
+        return False
+
+    def bisect_left(self, key_value: Any) -> int:
+        """
+        @brief Возвращает первую позицию, в которую можно вставить ключ без нарушения порядка
+        @param key_value Значение ключа
+        @return Позиция слева от всех элементов с равным ключом
+        """
+        block = bisect.bisect_left(self._maxes, key_value)
+        if block == len(self._maxes):
+            return self._len
+        return self._offset(block) + bisect.bisect_left(self._keys[block], key_value)
+
+    def bisect_right(self, key_value: Any) -> int:
+        """
+        @brief Возвращает последнюю позицию, в которую можно вставить ключ без нарушения порядка
+        @param key_value Значение ключа
+        @return Позиция справа от всех элементов с равным ключом
+        """
+        block = bisect.bisect_right(self._maxes, key_value)
+        if block == len(self._maxes):
+            return self._len
+        return self._offset(block) + bisect.bisect_right(self._keys[block], key_value)
+
+    def irange(self, minimum: Any = None, maximum: Any = None,
+               inclusive: Tuple[bool, bool] = (True, True), reverse: bool = False) -> Iterator[T]:
+        """
+        @brief Перебирает элементы, ключи которых лежат в заданном диапазоне
+        @param minimum Нижняя граница ключа (None - без ограничения)
+        @param maximum Верхняя граница ключа (None - без ограничения)
+        @param inclusive Включать ли нижнюю и верхнюю границы
+        @param reverse Перебирать в обратном порядке
+        @return Итератор по элементам диапазона
+        """
+        if minimum is None:
+            start = 0
+        else:
+            start = self.bisect_left(minimum) if inclusive[0] else self.bisect_right(minimum)
+        if maximum is None:
+            stop = self._len
+        else:
+            stop = self.bisect_right(maximum) if inclusive[1] else self.bisect_left(maximum)
+        return self.islice(start, stop, reverse)
+
+    def islice(self, start: int = 0, stop: Optional[int] = None, reverse: bool = False) -> Iterator[T]:
+        """
+        @brief Перебирает элементы с позициями из [start, stop)
+        @param start Первая позиция
+        @param stop Позиция после последней (None - до конца)
+        @param reverse Перебирать в обратном порядке
+        @return Итератор по элементам
+        """
+        stop = self._len if stop is None else min(stop, self._len)
+        start = max(start, 0)
+        if start >= stop:
+            return
+        first_block, first_offset = self._locate(start)
+        last_block, last_offset = self._locate(stop - 1)
+
+        blocks = range(first_block, last_block + 1)
+        for block in (reversed(blocks) if reverse else blocks):
+            lo = first_offset if block == first_block else 0
+            hi = last_offset + 1 if block == last_block else len(self._blocks[block])
+            part = self._blocks[block][lo:hi]
+            yield from (reversed(part) if reverse else part)
+
+    def _block_starts(self) -> List[int]:
+        """
+        @brief Возвращает накопленные размеры блоков: позиции их первых элементов и len в конце
+        @details Массив пересчитывается за O(число блоков) только после изменения блоков,
+                 поэтому серия запросов между пакетами обходится без повторного прохода
+        """
+        if self._starts is None:
+            self._starts = list(itertools.accumulate(map(len, self._blocks), initial=0))
+        return self._starts
+
+    def _offset(self, block: int) -> int:
+        """
+        @brief Возвращает позицию первого элемента блока
+        """
+        return self._block_starts()[block]
+
+    def _locate(self, position: int) -> Tuple[int, int]:
+        """
+        @brief Находит блок и смещение внутри блока для позиции бинарным поиском
+        @param position Позиция из [0, len)
+        @return Пара (номер блока, смещение)
+        """
+        if not 0 <= position < self._len:
+            raise IndexError(position)
+        starts = self._block_starts()
+        block = bisect.bisect_right(starts, position) - 1
+        return block, position - starts[block]
+
+    def get_statistics(self) -> dict:
+        """
+        @brief Возвращает статистику контейнера
+        @return Словарь с количеством элементов, блоков и добавленных пакетов
+        """
+        return {
+            'size': self._len,
+            'blocks': len(self._blocks),
+            'batches': self.batches
         }
 
 
@@ -249,7 +2550,8 @@ class SorterFactory:
     def create_sorter(sorter_type: str) -> BaseSorter:
         """
         @brief Создает объект сортировщика заданного типа
-        @param sorter_type Тип сортировщика ("shell" или "radix")
+        @param sorter_type Тип сортировщика ("shell", "radix", "msd_radix", "parallel_shell",
+               "parallel_radix" или "auto")
         @return Объект сортировщика
         @throws ValueError если указан неверный тип сортировщика
         """
@@ -259,7 +2561,16 @@ class SorterFactory:
             return ShellSorter()
         elif sorter_type == "radix":
             return LSDRadixSorter()
+        elif sorter_type == "msd_radix":
+            return MSDRadixSorter()
+        elif sorter_type == "parallel_shell":
+            return ParallelSorter("shell")
+        elif sorter_type == "parallel_radix":
+            return ParallelSorter("radix")
+        elif sorter_type == "auto":
+            return AutoSorter()
         else:
             raise ValueError(f"Неизвестный тип сортировщика: {sorter_type}. "
-                           f"Доступные типы: 'shell', 'radix'")
+                           f"Доступные типы: 'shell', 'radix', 'msd_radix', 'parallel_shell', "
+                           f"'parallel_radix', 'auto'")
 
@@ -6,7 +6,14 @@
 
 import unittest
 from typing import List
-from .sorters import ShellSorter, LSDRadixSorter, SorterFactory
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+from .sorters import (ShellSorter, LSDRadixSorter, MSDRadixSorter, ParallelSorter,
+                      ExternalSorter, RecordSorter, AutoSorter, SortedBatchList, SorterFactory,
+                      GapSequenceFactory)
 from .custom_classes import Student, Product, Book
 
 
@@ -213,6 +220,68 @@ class TestShellSorter(unittest.TestCase):
         self.assertIn('swaps', stats)
         self.assertGreater(stats['comparisons'], 0)
 
+    def test_uninstrumented_mode(self):
+        """
+        @brief Тест сортировки без сбора статистики
+        """
+        import random
+        data = [random.randint(-100, 100) for _ in range(300)]
+        fast_sorter = ShellSorter(instrumented=False)
+        self.assertEqual(fast_sorter.sort(data), sorted(data))
+        self.assertEqual(fast_sorter.sort(data, reverse=True), sorted(data, reverse=True))
+        self.assertEqual([abs(x) for x in fast_sorter.sort(data, key=abs)],
+                         sorted(abs(x) for x in data))
+        stats = fast_sorter.get_statistics()
+        self.assertNotIn('comparisons', stats)
+        self.assertNotIn('pass_times', stats)
+        self.assertEqual(fast_sorter.comparisons, 0)
+
+        lazy_sorter = ShellSorter(precompute_keys=False, instrumented=False)
+        self.assertEqual([abs(x) for x in lazy_sorter.sort(data, key=abs, reverse=True)],
+                         sorted((abs(x) for x in data), reverse=True))
+        self.assertEqual((lazy_sorter.comparisons, lazy_sorter.swaps, lazy_sorter.pass_times),
+                         (0, 0, []))
+
+    def test_top_k_and_nth_element(self):
+        """
+        @brief Тест частичной сортировки кучей ограниченного размера
+        """
+        import random
+        rng = random.Random(7)
+        data = [rng.randint(-500, 500) for _ in range(1000)]
+        self.assertEqual(self.sorter.top_k(data, 10), sorted(data)[:10])
+        self.assertEqual(self.sorter.top_k(data, 10, reverse=True), sorted(data, reverse=True)[:10])
+        self.assertEqual(self.sorter.top_k(data, 0), [])
+        self.assertEqual(self.sorter.top_k([3, 1, 2], 5), [1, 2, 3])
+        self.assertEqual(self.sorter.nth_element(data, 500, key=abs),
+                         sorted(data, key=abs)[500])
+        self.assertEqual(self.sorter.nth_element(data, -1), max(data))
+        with self.assertRaises(IndexError):
+            self.sorter.nth_element(data, 1000)
+
+    def test_nth_element_ties(self):
+        """
+        @brief Тест что при равных ключах выбирается тот же элемент, что и при устойчивой сортировке
+        """
+        import random
+        rng = random.Random(8)
+        data = [rng.randint(-50, 50) for _ in range(300)]
+        for n in (0, 37, 150, 260, 299):
+            self.assertEqual(self.sorter.nth_element(data, n, key=abs), sorted(data, key=abs)[n])
+            self.assertEqual(self.sorter.nth_element(data, n, key=abs, reverse=True),
+                             sorted(data, key=abs, reverse=True)[n])
+
+    def test_pass_times(self):
+        """
+        @brief Тест замера времени каждого прохода с интервалом
+        """
+        data = list(range(100, 0, -1))
+        self.sorter.sort(data)
+        stats = self.sorter.get_statistics()
+        self.assertEqual([entry['gap'] for entry in stats['pass_times']],
+                         self.sorter._gaps(len(data)))
+        self.assertTrue(all(entry['time'] >= 0 for entry in stats['pass_times']))
+
     def test_original_list_unchanged(self):
         """
         @brief Тест что оригинальный список не изменяется
@@ -231,6 +300,164 @@ class TestShellSorter(unittest.TestCase):
         result = self.sorter.sort(data)
         self.assertEqual(result, sorted(data))
 
+    def test_key_computed_once_per_element(self):
+        """
+        @brief Тест что функция ключа вызывается ровно один раз на элемент
+        """
+        calls = []
+
+        def key(x):
+            calls.append(x)
+            return -x
+
+        data = [5, 2, 8, 1, 9, 3, 7]
+        result = self.sorter.sort(data, key=key)
+        self.assertEqual(result, [9, 8, 7, 5, 3, 2, 1])
+        self.assertEqual(len(calls), len(data))
+
+    def test_precompute_keys_matches_per_comparison_keys(self):
+        """
+        @brief Тест совпадения результатов и статистики с вычислением ключей при каждом сравнении
+        """
+        import random
+        data = [random.randint(1, 50) for _ in range(200)]
+        lazy_sorter = ShellSorter(precompute_keys=False)
+        for reverse in (False, True):
+            expected = lazy_sorter.sort(data, key=lambda x: x % 17, reverse=reverse)
+            result = self.sorter.sort(data, key=lambda x: x % 17, reverse=reverse)
+            self.assertEqual(result, expected)
+            for name in ('comparisons', 'swaps', 'gap_sequence'):
+                self.assertEqual(self.sorter.get_statistics()[name],
+                                 lazy_sorter.get_statistics()[name])
+
+    def test_adaptive_presorted_input(self):
+        """
+        @brief Тест адаптивного режима на уже отсортированных данных
+        """
+        sorter = ShellSorter(adaptive=True)
+        data = list(range(100))
+        self.assertEqual(sorter.sort(data), data)
+        stats = sorter.get_statistics()
+        self.assertEqual(stats['adaptive_strategy'], "presorted")
+        self.assertEqual(stats['runs'], 1)
+        self.assertEqual(stats['swaps'], 0)
+        self.assertEqual(stats['comparisons'], 99)
+
+    def test_adaptive_reversed_input(self):
+        """
+        @brief Тест адаптивного режима на строго убывающих данных
+        """
+        sorter = ShellSorter(adaptive=True)
+        data = list(range(100, 0, -1))
+        self.assertEqual(sorter.sort(data), sorted(data))
+        self.assertEqual(sorter.get_statistics()['adaptive_strategy'], "reversed")
+        self.assertEqual(sorter.sort(data, reverse=True), data)
+        self.assertEqual(sorter.get_statistics()['adaptive_strategy'], "presorted")
+
+    def test_adaptive_nearly_sorted_is_stable(self):
+        """
+        @brief Тест устойчивой досортировки вставками почти упорядоченных данных
+        """
+        sorter = ShellSorter(adaptive=True)
+        students = [Student(f"S{i}", 18 + i // 4, 4.0, i) for i in range(80)]
+        students[10], students[11] = students[11], students[10]
+        students[50], students[60] = students[60], students[50]
+        result = sorter.sort(students, key=lambda s: s.age)
+        self.assertEqual(result, sorted(students, key=lambda s: s.age))
+        stats = sorter.get_statistics()
+        self.assertEqual(stats['adaptive_strategy'], "insertion")
+        self.assertEqual(stats['descents'], 2)
+
+    def test_adaptive_random_input_uses_shell(self):
+        """
+        @brief Тест что на случайных данных адаптивный режим переходит к проходам Шелла
+        """
+        import random
+        data = [random.randint(1, 1000) for _ in range(200)]
+        sorter = ShellSorter(adaptive=True)
+        self.assertEqual(sorter.sort(data), sorted(data))
+        self.assertEqual(sorter.get_statistics()['adaptive_strategy'], "shell")
+        self.assertNotIn('runs', ShellSorter().get_statistics())
+
+    def test_argsort_and_apply_permutation(self):
+        """
+        @brief Тест получения перестановки без перемещения исходных данных
+        """
+        products = [
+            Product("Laptop", 999.99, 5, "Electronics"),
+            Product("Mouse", 29.99, 50, "Electronics"),
+            Product("Keyboard", 79.99, 30, "Electronics")
+        ]
+        by_price = self.sorter.argsort(products, key=lambda p: p.price)
+        by_quantity = self.sorter.argsort(products, key=lambda p: p.quantity, reverse=True)
+        self.assertEqual(by_price, [1, 2, 0])
+        self.assertEqual(by_quantity, [1, 2, 0])
+        self.assertEqual(self.sorter.apply_permutation(products, by_price),
+                         self.sorter.sort(products, key=lambda p: p.price))
+        self.assertEqual(self.sorter.argsort([]), [])
+
+
+class TestGapSequences(unittest.TestCase):
+    """
+    @class TestGapSequences
+    @brief Тесты для последовательностей интервалов сортировки Шелла
+    """
+
+    def test_known_prefixes(self):
+        """
+        @brief Тест начальных элементов каждой последовательности
+        """
+        expected = {
+            "knuth": [1, 4, 13, 40],
+            "ciura": [1, 4, 10, 23, 57],
+            "sedgewick": [1, 8, 23, 77],
+            "tokuda": [1, 4, 9, 20, 46],
+            "pratt": [1, 2, 3, 4, 6, 8, 9],
+        }
+        for name, prefix in expected.items():
+            gaps = GapSequenceFactory.create_gap_sequence(name).gaps(1000)
+            self.assertEqual(gaps[::-1][:len(prefix)], prefix, name)
+            self.assertEqual(gaps, sorted(gaps, reverse=True), name)
+
+    def test_all_sequences_sort_correctly(self):
+        """
+        @brief Тест корректности сортировки с каждой последовательностью
+        """
+        import random
+        data = [random.randint(-500, 500) for _ in range(300)]
+        for name in GapSequenceFactory.SEQUENCES:
+            sorter = ShellSorter(gap_sequence=name)
+            self.assertEqual(sorter.sort(data), sorted(data), name)
+            self.assertEqual(sorter.sort(data, reverse=True), sorted(data, reverse=True), name)
+
+    def test_auto_selects_by_size(self):
+        """
+        @brief Тест выбора последовательности по размеру входных данных
+        """
+        sorter = ShellSorter(gap_sequence="auto")
+        sorter.sort([3, 1, 2])
+        self.assertEqual(sorter.get_statistics()['gap_sequence'], "ciura")
+        auto = GapSequenceFactory.create_gap_sequence("auto")
+        self.assertEqual(auto.resolve(10 ** 6).name, "tokuda")
+
+    def test_invalid_gap_sequence(self):
+        """
+        @brief Тест создания сортировщика с неизвестной последовательностью
+        """
+        with self.assertRaises(ValueError):
+            ShellSorter(gap_sequence="fibonacci")
+
+    def test_benchmark_gap_sequences(self):
+        """
+        @brief Тест сравнения последовательностей на одних данных
+        """
+        data = list(range(200, 0, -1))
+        results = ShellSorter.benchmark_gap_sequences(data, sequences=["knuth", "ciura"])
+        self.assertEqual(set(results), {"knuth", "ciura"})
+        for stats in results.values():
+            self.assertGreater(stats['comparisons'], 0)
+            self.assertGreaterEqual(stats['time'], 0)
+
 
 class TestLSDRadixSorter(unittest.TestCase):
     """
@@ -406,6 +633,20 @@ class TestLSDRadixSorter(unittest.TestCase):
         self.assertIn('passes', stats)
         self.assertGreater(stats['passes'], 0)
 
+    def test_pass_times(self):
+        """
+        @brief Тест замера времени проходов и режима без замеров
+        """
+        data = [170, 45, 75, 90, 802, 24, 2, 66]
+        self.sorter.sort(data)
+        stats = self.sorter.get_statistics()
+        self.assertEqual(len(stats['pass_times']), stats['passes'])
+
+        fast_sorter = LSDRadixSorter(instrumented=False)
+        self.assertEqual(fast_sorter.sort(data), sorted(data))
+        self.assertNotIn('pass_times', fast_sorter.get_statistics())
+        self.assertEqual(fast_sorter.get_statistics()['passes'], stats['passes'])
+
     def test_custom_base(self):
         """
         @brief Тест сортировки с пользовательским основанием
@@ -464,6 +705,901 @@ class TestLSDRadixSorter(unittest.TestCase):
         self.assertAlmostEqual(result[0].grade, 3.5)
         self.assertAlmostEqual(result[-1].grade, 3.9)
 
+    def test_power_of_two_bases(self):
+        """
+        @brief Тест сортировки с основаниями-степенями двойки (сдвиг и маска)
+        """
+        import random
+        data = [random.randint(0, 2 ** 40) for _ in range(200)]
+        for base in (2, 256, 65536):
+            sorter = LSDRadixSorter(base=base)
+            self.assertEqual(sorter.sort(data), sorted(data))
+
+    def test_key_computed_once_per_element(self):
+        """
+        @brief Тест что функция ключа вызывается один раз на элемент, а не на каждом проходе
+        """
+        calls = []
+
+        def key(x):
+            calls.append(x)
+            return x
+
+        data = [170, 45, 75, 90, 802, 24, 2, 66]
+        sorter = LSDRadixSorter(base=10)
+        self.assertEqual(sorter.sort(data, key=key), sorted(data))
+        self.assertEqual(len(calls), len(data))
+
+    def test_single_bucket_passes_skipped(self):
+        """
+        @brief Тест пропуска проходов, в которых все элементы попадают в одну корзину
+        """
+        data = [0x10000 + i for i in range(10)]
+        result = self.sorter.sort(data[::-1])
+        self.assertEqual(result, data)
+        stats = self.sorter.get_statistics()
+        self.assertEqual(stats['passes'], 1)
+        self.assertEqual(stats['skipped_passes'], 2)
+
+    def test_invalid_base(self):
+        """
+        @brief Тест создания сортировщика с неверным основанием
+        """
+        with self.assertRaises(ValueError):
+            LSDRadixSorter(base=1)
+
+    def test_sort_negative_integers(self):
+        """
+        @brief Тест сортировки отрицательных чисел поразрядным методом
+        """
+        data = [-5, 3, -2, 8, -10 ** 12, 0, 7]
+        result = self.sorter.sort(data)
+        self.assertEqual(result, sorted(data))
+        self.assertGreater(self.sorter.get_statistics()['passes'], 0)
+
+    def test_sort_floats_radix(self):
+        """
+        @brief Тест сортировки чисел с плавающей точкой через битовое представление IEEE-754
+        """
+        data = [3.14, -2.5, 0.0, -0.0, float('inf'), -1e-300, 2, -7, 1e300]
+        result = self.sorter.sort(data)
+        self.assertEqual(result, sorted(data))
+        self.assertGreater(self.sorter.get_statistics()['passes'], 0)
+
+    def test_sort_products_by_price(self):
+        """
+        @brief Тест сортировки товаров по цене
+        """
+        products = [
+            Product("Laptop", 999.99, 5, "Electronics"),
+            Product("Mouse", 29.99, 50, "Electronics"),
+            Product("Keyboard", 79.99, 30, "Electronics")
+        ]
+        result = self.sorter.sort(products, key=lambda p: p.price)
+        self.assertEqual([p.price for p in result], [29.99, 79.99, 999.99])
+
+    def test_sort_students_by_name(self):
+        """
+        @brief Тест сортировки студентов по имени (строковые ключи)
+        """
+        students = [
+            Student("Charlie", 23, 3.9, 103),
+            Student("Alice", 22, 3.8, 101),
+            Student("Al", 19, 3.6, 104),
+            Student("Иван", 20, 3.5, 102)
+        ]
+        result = self.sorter.sort(students, key=lambda s: s.name)
+        self.assertEqual([s.name for s in result], ["Al", "Alice", "Charlie", "Иван"])
+        self.assertGreater(self.sorter.get_statistics()['passes'], 0)
+
+    def test_sort_strings_radix_is_stable(self):
+        """
+        @brief Тест устойчивости сортировки по строковому ключу
+        """
+        data = ["b1", "a1", "b2", "a2", "", "a3"]
+        result = self.sorter.sort(data, key=lambda s: s[:1])
+        self.assertEqual(result, ["", "a1", "a2", "a3", "b1", "b2"])
+
+    def test_unsupported_keys_fall_back(self):
+        """
+        @brief Тест альтернативного метода для ключей, которые нельзя закодировать
+        """
+        data = [(2, "b"), (1, "z"), (2, "a")]
+        self.assertEqual(self.sorter.sort(data), sorted(data))
+        self.assertEqual(self.sorter.get_statistics()['passes'], 0)
+
+    def test_adaptive_detection(self):
+        """
+        @brief Тест пропуска поразрядных проходов для упорядоченных данных
+        """
+        sorter = LSDRadixSorter(adaptive=True)
+        data = [1, 5, 5, 9, 300]
+        self.assertEqual(sorter.sort(data), data)
+        self.assertEqual(sorter.get_statistics()['adaptive_strategy'], "presorted")
+        self.assertEqual(sorter.get_statistics()['passes'], 0)
+        self.assertEqual(sorter.sort([300, 9, 5, 1]), [1, 5, 9, 300])
+        self.assertEqual(sorter.get_statistics()['adaptive_strategy'], "reversed")
+        self.assertEqual(sorter.sort([3, 1, 2]), [1, 2, 3])
+        self.assertEqual(sorter.get_statistics()['adaptive_strategy'], "radix")
+
+    def test_multikey_students(self):
+        """
+        @brief Тест сортировки студентов по (баллу по убыванию, возрасту по возрастанию)
+        """
+        import random
+        students = [Student(f"S{i}", random.randint(18, 22), random.choice([3.5, 4.0, 4.5]), i)
+                    for i in range(100)]
+        result = self.sorter.sort_multikey(students, [(lambda s: s.grade, True), (lambda s: s.age, False)])
+        self.assertEqual(result, sorted(students, key=lambda s: (-s.grade, s.age)))
+        self.assertGreater(self.sorter.get_statistics()['passes'], 0)
+
+    def test_multikey_products_and_books(self):
+        """
+        @brief Тест составного ключа со строками, числами с плавающей точкой и целыми
+        """
+        products = [
+            Product("Mouse", 29.99, 50, "Electronics"),
+            Product("Pen", 1.5, 500, "Office"),
+            Product("Laptop", 999.99, 5, "Electronics"),
+            Product("Paper", 4.25, 100, "Office"),
+            Product("Cable", 29.99, 70, "Electronics")
+        ]
+        result = self.sorter.sort_multikey(products, [(lambda p: p.category, False), (lambda p: p.price, True)])
+        self.assertEqual([p.name for p in result], ["Laptop", "Mouse", "Cable", "Paper", "Pen"])
+
+        books = [
+            Book("B1", "Tolstoy", 1869, 1225, 3),
+            Book("B2", "Dostoevsky", 1866, 671, 2),
+            Book("B3", "Tolstoy", 1877, 864, 1),
+            Book("B4", "Dostoevsky", 1869, 640, 4)
+        ]
+        result = self.sorter.sort_multikey(books, [(lambda b: b.year, False), (lambda b: b.author, True)])
+        self.assertEqual([b.title for b in result], ["B2", "B1", "B4", "B3"])
+
+    def test_multikey_unsupported_part_falls_back(self):
+        """
+        @brief Тест составного ключа с частью, которую нельзя закодировать
+        """
+        data = [(1, (2, "b")), (0, (1, "a")), (1, (1, "z")), (0, (2, "a"))]
+        result = self.sorter.sort_multikey(data, [(lambda x: x[0], True), (lambda x: x[1], False)])
+        self.assertEqual(result, [(1, (1, "z")), (1, (2, "b")), (0, (1, "a")), (0, (2, "a"))])
+        self.assertEqual(self.sorter.sort_multikey([], [(lambda x: x, False)]), [])
+
+    def test_argsort(self):
+        """
+        @brief Тест получения устойчивой перестановки поразрядным методом
+        """
+        data = [5, -2, 8, -2, 0, 5]
+        order = self.sorter.argsort(data)
+        self.assertEqual(order, [1, 3, 4, 0, 5, 2])
+        self.assertEqual(self.sorter.apply_permutation(data, order), sorted(data))
+        self.assertEqual(data, [5, -2, 8, -2, 0, 5])
+        self.assertEqual(self.sorter.argsort(["b", "a"], reverse=True), [0, 1])
+        self.assertEqual(self.sorter.argsort([(2,), (1,)]), [1, 0])
+        self.assertEqual(self.sorter.argsort([]), [])
+
+    def test_sort_adaptive_and_key_none_keeps_elements(self):
+        """
+        @brief Тест что буфер проходов не портит элементы при key=None
+        """
+        sorter = LSDRadixSorter(adaptive=True)
+        data = [300, 1, 77, 5, 1000]
+        self.assertEqual(sorter.sort(data), sorted(data))
+
+    def test_invalid_backend(self):
+        """
+        @brief Тест создания сортировщика с неизвестным backend
+        """
+        with self.assertRaises(ValueError):
+            LSDRadixSorter(backend="cuda")
+
+    def test_python_backend(self):
+        """
+        @brief Тест явного выбора реализации на чистом Python
+        """
+        sorter = LSDRadixSorter(backend="python")
+        data = [170, -45, 75.5, 90, 802, 24, 2, 66]
+        self.assertEqual(sorter.sort(data), sorted(data))
+        self.assertEqual(sorter.get_statistics()['backend'], "python")
+
+    @unittest.skipIf(numpy is not None, "NumPy установлен")
+    def test_numpy_backend_requires_numpy(self):
+        """
+        @brief Тест ошибки при выборе backend "numpy" без установленного NumPy
+        """
+        with self.assertRaises(ImportError):
+            LSDRadixSorter(backend="numpy")
+
+    @unittest.skipIf(numpy is None, "NumPy не установлен")
+    def test_numpy_backend_matches_python(self):
+        """
+        @brief Тест совпадения результатов NumPy и Python реализаций
+        """
+        import random
+        students = [Student(f"S{i}", random.randint(17, 30), round(random.uniform(2, 5), 2), i)
+                    for i in range(500)]
+        numpy_sorter = LSDRadixSorter(backend="numpy")
+        python_sorter = LSDRadixSorter(backend="python")
+        for key in (lambda s: s.age, lambda s: s.grade, lambda s: -s.student_id):
+            expected = python_sorter.sort(students, key=key)
+            result = numpy_sorter.sort(students, key=key)
+            self.assertEqual(result, expected)
+        self.assertEqual(numpy_sorter.get_statistics()['backend'], "numpy")
+
+    def test_top_k(self):
+        """
+        @brief Тест отбора k наибольших товаров по цене поразрядным отбором
+        """
+        import random
+        rng = random.Random(5)
+        products = [Product(f"P{i}", round(rng.uniform(1, 1000), 2), i, "Test")
+                    for i in range(3000)]
+        top = self.sorter.top_k(products, 100, key=lambda p: p.price, reverse=True)
+        expected = sorted(products, key=lambda p: p.price, reverse=True)[:100]
+        self.assertEqual([p.price for p in top], [p.price for p in expected])
+
+        data = [rng.randint(-10 ** 6, 10 ** 6) for _ in range(3000)]
+        for k in (1, 17, 256, 2999):
+            self.assertEqual(self.sorter.top_k(data, k), sorted(data)[:k])
+            self.assertEqual(self.sorter.top_k(data, k, reverse=True),
+                             sorted(data, reverse=True)[:k])
+
+    def test_top_k_with_duplicates(self):
+        """
+        @brief Тест отбора при совпадающих ключах и ключах, не поддерживающих Radix
+        """
+        data = [5] * 50 + [1] * 50 + [9] * 50
+        self.assertEqual(self.sorter.top_k(data, 60), [1] * 50 + [5] * 10)
+        self.assertEqual(self.sorter.top_k(data, 55, reverse=True), [9] * 50 + [5] * 5)
+        pairs = [(i % 7, i) for i in range(100)]
+        self.assertEqual(self.sorter.top_k(pairs, 5), sorted(pairs)[:5])
+
+    def test_selection_ties_match_stable_sort(self):
+        """
+        @brief Тест что отбор и сортировка по убыванию упорядочивают равные ключи одинаково
+        """
+        import random
+        rng = random.Random(9)
+        for _ in range(20):
+            data = [(rng.randint(0, 40), i) for i in range(rng.randint(50, 400))]
+            key = lambda pair: pair[0]
+            for reverse in (False, True):
+                expected = sorted(data, key=key, reverse=reverse)
+                self.assertEqual(self.sorter.sort(data, key=key, reverse=reverse), expected)
+                k = rng.randint(1, len(data) - 1)
+                self.assertEqual(self.sorter.top_k(data, k, key=key, reverse=reverse), expected[:k])
+                n = rng.randrange(len(data))
+                self.assertEqual(self.sorter.nth_element(data, n, key=key, reverse=reverse),
+                                 expected[n])
+
+    def test_nth_element(self):
+        """
+        @brief Тест поиска n-го по порядку элемента
+        """
+        import random
+        rng = random.Random(6)
+        data = [rng.uniform(-100, 100) for _ in range(2001)]
+        ordered = sorted(data)
+        self.assertEqual(self.sorter.nth_element(data, 1000), ordered[1000])
+        self.assertEqual(self.sorter.nth_element(data, 0), ordered[0])
+        self.assertEqual(self.sorter.nth_element(data, -1), ordered[-1])
+        self.assertEqual(self.sorter.nth_element(data, 3, reverse=True), ordered[-4])
+        words = ["pear", "apple", "fig", "kiwi"]
+        self.assertEqual(self.sorter.nth_element(words, 1, key=len), "pear")
+        with self.assertRaises(IndexError):
+            self.sorter.nth_element(data, -2002)
+
+
+class TestMSDRadixSorter(unittest.TestCase):
+    """
+    @class TestMSDRadixSorter
+    @brief Тесты для класса MSDRadixSorter
+    """
+
+    def setUp(self):
+        """
+        @brief Подготовка тестового окружения
+        """
+        import random
+        self.random = random.Random(3)
+        self.sorter = MSDRadixSorter()
+
+    def test_sort_empty_and_single(self):
+        """
+        @brief Тест сортировки пустого списка и списка из одного элемента
+        """
+        self.assertEqual(self.sorter.sort([]), [])
+        self.assertEqual(self.sorter.sort([7]), [7])
+        self.assertEqual(self.sorter.sort([0, 0, 0]), [0, 0, 0])
+
+    def test_sort_integers(self):
+        """
+        @brief Тест сортировки целых чисел, включая отрицательные
+        """
+        for base in (2, 10, 16, 256):
+            sorter = MSDRadixSorter(base=base, small_bucket=4)
+            data = [self.random.randint(-10 ** 6, 10 ** 6) for _ in range(2000)]
+            self.assertEqual(sorter.sort(data), sorted(data))
+            self.assertEqual(sorter.sort(data, reverse=True), sorted(data, reverse=True))
+
+    def test_sort_in_place(self):
+        """
+        @brief Тест сортировки на месте без создания нового списка
+        """
+        data = [self.random.randint(0, 2 ** 40) for _ in range(5000)]
+        expected = sorted(data)
+        original = data
+        self.assertIsNone(self.sorter.sort_in_place(data))
+        self.assertIs(data, original)
+        self.assertEqual(data, expected)
+        stats = self.sorter.get_statistics()
+        self.assertGreater(stats['passes'], 0)
+        self.assertGreater(stats['small_buckets'], 0)
+        self.assertLessEqual(stats['max_depth'], 6)
+
+    def test_sort_with_key(self):
+        """
+        @brief Тест сортировки объектов по ключам разных типов
+        """
+        students = [Student(f"S{i}", self.random.randint(18, 30), self.random.uniform(2, 5), i)
+                    for i in range(300)]
+        result = self.sorter.sort(students, key=lambda s: s.grade)
+        self.assertEqual([s.grade for s in result], sorted(s.grade for s in students))
+        result = self.sorter.sort(students, key=lambda s: s.name, reverse=True)
+        self.assertEqual([s.name for s in result],
+                         sorted((s.name for s in students), reverse=True))
+
+    def test_original_list_unchanged(self):
+        """
+        @brief Тест что метод sort не изменяет исходный список
+        """
+        data = [5, 3, 9, 1]
+        self.sorter.sort(data)
+        self.assertEqual(data, [5, 3, 9, 1])
+
+    def test_unencodable_keys_fallback(self):
+        """
+        @brief Тест сортировки ключей, которые нельзя закодировать
+        """
+        data = [(2, 'b'), (1, 'a'), (2, 'a')]
+        self.assertEqual(self.sorter.sort(data), sorted(data))
+
+    def test_long_common_prefixes(self):
+        """
+        @brief Тест ключей, число разрядов которых превышает предел рекурсии
+        """
+        data = ['a' * i for i in range(1500)]
+        self.random.shuffle(data)
+        self.assertEqual(self.sorter.sort(data), sorted(data))
+        self.assertGreater(self.sorter.get_statistics()['max_depth'], 1000)
+
+
+class TestParallelSorter(unittest.TestCase):
+    """
+    @class TestParallelSorter
+    @brief Тесты для класса ParallelSorter
+    """
+
+    def setUp(self):
+        """
+        @brief Подготовка к тестам
+        """
+        import random
+        self.random = random.Random(4)
+        self.data = [self.random.randint(-1000, 1000) for _ in range(300)]
+
+    def test_parallel_shell(self):
+        """
+        @brief Тест сортировки фрагментов Шеллом и k-путевого слияния
+        """
+        sorter = ParallelSorter("shell", workers=2, min_chunk_size=50)
+        self.assertEqual(sorter.sort(self.data), sorted(self.data))
+        self.assertEqual(sorter.sort(self.data, reverse=True), sorted(self.data, reverse=True))
+        self.assertEqual(sorter.get_statistics()['chunks'], 2)
+
+    def test_parallel_radix(self):
+        """
+        @brief Тест поразрядной сортировки с параллельными гистограммами
+        """
+        sorter = ParallelSorter("radix", workers=3, min_chunk_size=50)
+        result = sorter.sort(self.data, key=lambda x: -x)
+        self.assertEqual(result, sorted(self.data, key=lambda x: -x))
+        self.assertEqual(sorter.get_statistics()['chunks'], 3)
+        self.assertGreater(sorter.get_statistics()['passes'], 0)
+
+    def test_parallel_radix_stable_in_both_directions(self):
+        """
+        @brief Тест устойчивости параллельной поразрядной сортировки при равных ключах
+        """
+        pairs = [(x % 10, i) for i, x in enumerate(self.data)]
+        sorter = ParallelSorter("radix", workers=3, min_chunk_size=50)
+        for reverse in (False, True):
+            result = sorter.sort(pairs, key=lambda p: p[0], reverse=reverse)
+            self.assertEqual(result, sorted(pairs, key=lambda p: p[0], reverse=reverse))
+            self.assertEqual(sorter.get_statistics()['chunks'], 3)
+
+    def test_parallel_objects_with_key(self):
+        """
+        @brief Тест сортировки объектов: в процессы передаются только ключи
+        """
+        products = [Product(f"P{i}", (i * 37) % 101 + 0.99, i, "Cat") for i in range(120)]
+        sorter = ParallelSorter("shell", workers=2, min_chunk_size=10)
+        result = sorter.sort(products, key=lambda p: p.price)
+        self.assertEqual([p.price for p in result], sorted(p.price for p in products))
+
+    def test_small_input_sorted_in_process(self):
+        """
+        @brief Тест сортировки маленького входа без пула процессов
+        """
+        sorter = ParallelSorter("radix", workers=4)
+        self.assertEqual(sorter.sort([3, 1, 2]), [1, 2, 3])
+        self.assertEqual(sorter.get_statistics()['chunks'], 1)
+
+    def test_invalid_parameters(self):
+        """
+        @brief Тест создания сортировщика с неверными параметрами
+        """
+        with self.assertRaises(ValueError):
+            ParallelSorter("bubble")
+        with self.assertRaises(ValueError):
+            ParallelSorter(workers=0)
+
+    def test_benchmark_speedup(self):
+        """
+        @brief Тест измерения ускорения относительно одного процесса
+        """
+        results = ParallelSorter.benchmark_speedup(self.data, "shell", worker_counts=[1, 2])
+        self.assertEqual(set(results), {1, 2})
+        self.assertEqual(results[1]['speedup'], 1.0)
+
+    def test_default_argsort(self):
+        """
+        @brief Тест реализации argsort по умолчанию из BaseSorter
+        """
+        sorter = ParallelSorter("shell", workers=2, min_chunk_size=50)
+        order = sorter.argsort(self.data)
+        self.assertEqual(sorter.apply_permutation(self.data, order), sorted(self.data))
+
+
+class TestExternalSorter(unittest.TestCase):
+    """
+    @class TestExternalSorter
+    @brief Тесты для класса ExternalSorter
+    """
+
+    def setUp(self):
+        """
+        @brief Подготовка к тестам
+        """
+        import random
+        import tempfile
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.random = random.Random(5)
+        self.data = [self.random.randint(-1000, 1000) for _ in range(500)]
+
+    def tearDown(self):
+        """
+        @brief Удаление временного каталога
+        """
+        self.temp_dir.cleanup()
+
+    def test_spills_and_merges_runs(self):
+        """
+        @brief Тест сброса серий на диск и многоуровневого слияния
+        """
+        import os
+        sorter = ExternalSorter(memory_budget=1000, max_merge_width=3, temp_dir=self.temp_dir.name)
+        result = list(sorter.sort_stream(iter(self.data)))
+        self.assertEqual(result, sorted(self.data))
+        stats = sorter.get_statistics()
+        self.assertEqual(stats['records'], 500)
+        self.assertGreater(stats['runs'], 3)
+        self.assertGreater(stats['merges'], 1)
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+    def test_multilevel_merge_is_stable(self):
+        """
+        @brief Тест устойчивости при равных ключах, когда серий больше ширины слияния
+        """
+        import os
+        pairs = [(x % 5, i) for i, x in enumerate(self.data)]
+        sorter = ExternalSorter(memory_budget=1000, max_merge_width=3, temp_dir=self.temp_dir.name)
+        for reverse in (False, True):
+            result = list(sorter.sort_stream(pairs, key=lambda p: p[0], reverse=reverse))
+            self.assertEqual(result, sorted(pairs, key=lambda p: p[0], reverse=reverse))
+            self.assertGreater(sorter.get_statistics()['runs'], 9)
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+    def test_failed_merge_removes_runs(self):
+        """
+        @brief Тест удаления временных файлов при ошибке во время слияния
+        """
+        import os
+        sorter = ExternalSorter(memory_budget=1000, max_merge_width=3, temp_dir=self.temp_dir.name)
+        merge = sorter._merge
+
+        def failing_merge(run_files, reverse):
+            for i, pair in enumerate(merge(run_files, reverse)):
+                if i == 10:
+                    raise RuntimeError("сбой слияния")
+                yield pair
+
+        sorter._merge = failing_merge
+        with self.assertRaises(RuntimeError):
+            list(sorter.sort_stream(self.data))
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+    def test_shell_runs_with_key_and_reverse(self):
+        """
+        @brief Тест сортировки серий Шеллом с функцией ключа и по убыванию
+        """
+        sorter = ExternalSorter(memory_budget=1000, algorithm="shell", temp_dir=self.temp_dir.name)
+        result = list(sorter.sort_stream(self.data, key=lambda x: x % 7, reverse=True))
+        self.assertEqual([x % 7 for x in result], sorted((x % 7 for x in self.data), reverse=True))
+
+    def test_sort_objects(self):
+        """
+        @brief Тест внешней сортировки пользовательских объектов
+        """
+        books = [Book(f"Book{i}", "Author", 1900 + (i * 7) % 120, 100 + i, 1000 + i) for i in range(100)]
+        sorter = ExternalSorter(memory_budget=2000, temp_dir=self.temp_dir.name)
+        result = list(sorter.sort_stream(books, key=lambda b: b.year))
+        self.assertEqual([b.year for b in result], sorted(b.year for b in books))
+        self.assertGreater(sorter.get_statistics()['runs'], 1)
+
+    def test_in_memory_when_budget_allows(self):
+        """
+        @brief Тест сортировки без временных файлов, когда данные помещаются в память
+        """
+        sorter = ExternalSorter()
+        self.assertEqual(list(sorter.sort_stream(self.data)), sorted(self.data))
+        self.assertEqual(sorter.get_statistics()['runs'], 1)
+        self.assertEqual(list(sorter.sort_stream([])), [])
+
+    def test_sort_file(self):
+        """
+        @brief Тест сортировки строк текстового файла
+        """
+        import os
+        input_path = os.path.join(self.temp_dir.name, "input.txt")
+        output_path = os.path.join(self.temp_dir.name, "output.txt")
+        words = ["pear", "apple", "яблоко", "fig", "banana"] * 20
+        with open(input_path, 'w', encoding='utf-8') as f:
+            f.write("\n".join(words) + "\n")
+
+        sorter = ExternalSorter(memory_budget=500, temp_dir=self.temp_dir.name)
+        sorter.sort_file(input_path, output_path)
+
+        with open(output_path, encoding='utf-8') as f:
+            self.assertEqual(f.read().splitlines(), sorted(words))
+
+    def test_invalid_parameters(self):
+        """
+        @brief Тест создания сортировщика с неверными параметрами
+        """
+        with self.assertRaises(ValueError):
+            ExternalSorter(algorithm="bubble")
+        with self.assertRaises(ValueError):
+            ExternalSorter(memory_budget=0)
+        with self.assertRaises(ValueError):
+            ExternalSorter(max_merge_width=1)
+
+
+class TestRecordSorter(unittest.TestCase):
+    """
+    @class TestRecordSorter
+    @brief Тесты для класса RecordSorter
+    """
+
+    def setUp(self):
+        """
+        @brief Подготовка тестового окружения
+        """
+        import random
+        self.random = random.Random(11)
+
+    @staticmethod
+    def pack(record_format, records):
+        """
+        @brief Упаковывает записи в bytearray
+        """
+        import struct
+        return bytearray(b''.join(struct.pack(record_format, *record) for record in records))
+
+    @staticmethod
+    def unpack(record_format, buffer):
+        """
+        @brief Распаковывает записи из буфера
+        """
+        import struct
+        return list(struct.iter_unpack(record_format, bytes(buffer)))
+
+    def test_sort_books_by_year_and_pages(self):
+        """
+        @brief Тест сортировки записей книг (год, страницы, ISBN) по двум полям
+        """
+        books = [(self.random.randint(1990, 2024), self.random.randint(50, 900),
+                  self.random.getrandbits(40)) for _ in range(1000)]
+        buffer = self.pack("<HHQ", books)
+        sorter = RecordSorter("<HHQ", key_fields=(0, 1))
+        sorter.sort(buffer)
+        self.assertEqual(self.unpack("<HHQ", buffer), sorted(books, key=lambda b: (b[0], b[1])))
+        stats = sorter.get_statistics()
+        self.assertEqual(stats['records'], 1000)
+        self.assertGreater(stats['passes'], 0)
+
+    def test_sort_is_stable_in_both_directions(self):
+        """
+        @brief Тест устойчивости сортировки по возрастанию и по убыванию
+        """
+        records = [(self.random.randint(0, 5), i) for i in range(300)]
+        for reverse in (False, True):
+            buffer = self.pack(">bI", records)
+            RecordSorter(">bI").sort(memoryview(buffer), reverse=reverse)
+            self.assertEqual(self.unpack(">bI", buffer),
+                             sorted(records, key=lambda r: r[0], reverse=reverse))
+
+    def test_signed_float_and_bytes_keys(self):
+        """
+        @brief Тест ключей со знаком, с плавающей точкой и байтовых строк
+        """
+        records = [(self.random.randint(-2 ** 31, 2 ** 31 - 1), self.random.uniform(-1e6, 1e6),
+                    bytes(self.random.choice(b"abc") for _ in range(self.random.randint(0, 4))))
+                   for _ in range(500)]
+        record_format = "=id4s"
+        for field in range(3):
+            buffer = self.pack(record_format, records)
+            RecordSorter(record_format, key_fields=(field,)).sort(buffer)
+            expected = sorted(self.unpack(record_format, self.pack(record_format, records)),
+                              key=lambda r: r[field])
+            self.assertEqual(self.unpack(record_format, buffer), expected)
+
+    def test_pascal_string_keys(self):
+        """
+        @brief Тест строк 'p' разной длины: байт длины не должен определять порядок
+        """
+        words = [b"b", b"ab", b"abc", b"", b"ab\x00", b"zz", b"a", b"abcdefgh"]
+        words += [bytes(self.random.choice(b"ab\x00") for _ in range(self.random.randint(0, 9)))
+                  for _ in range(300)]
+        records = [(word, i) for i, word in enumerate(words)]
+        for reverse in (False, True):
+            buffer = self.pack("<6pH", records)
+            RecordSorter("<6pH").sort(buffer, reverse=reverse)
+            expected = sorted(self.unpack("<6pH", self.pack("<6pH", records)),
+                              key=lambda r: r[0], reverse=reverse)
+            self.assertEqual(self.unpack("<6pH", buffer), expected)
+
+    def test_native_alignment(self):
+        """
+        @brief Тест формата с выравниванием полей
+        """
+        records = [(self.random.randint(-100, 100), self.random.randint(-10 ** 9, 10 ** 9))
+                   for _ in range(200)]
+        buffer = self.pack("@bqx", records)
+        RecordSorter("@bqx", key_fields=(1, 0)).sort(buffer)
+        self.assertEqual(self.unpack("@bqx", buffer), sorted(records, key=lambda r: (r[1], r[0])))
+
+    def test_sort_file(self):
+        """
+        @brief Тест сортировки двоичного файла через mmap
+        """
+        import os
+        import tempfile
+        records = [(self.random.randint(0, 10 ** 6), i) for i in range(400)]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "records.bin")
+            with open(path, 'wb') as f:
+                f.write(self.pack("<IH", records))
+            RecordSorter("<IH").sort_file(path, reverse=True)
+            with open(path, 'rb') as f:
+                result = self.unpack("<IH", f.read())
+        self.assertEqual(result, sorted(records, key=lambda r: r[0], reverse=True))
+
+    def test_invalid_arguments(self):
+        """
+        @brief Тест ошибок при неверном формате, полях и буфере
+        """
+        with self.assertRaises(ValueError):
+            RecordSorter("<4x")
+        with self.assertRaises(ValueError):
+            RecordSorter("<HH", key_fields=(2,))
+        sorter = RecordSorter("<H")
+        with self.assertRaises(ValueError):
+            sorter.sort(bytearray(3))
+        with self.assertRaises(TypeError):
+            sorter.sort(bytes(4))
+
+
+class TestAutoSorter(unittest.TestCase):
+    """
+    @class TestAutoSorter
+    @brief Тесты для класса AutoSorter
+    """
+
+    def setUp(self):
+        """
+        @brief Подготовка тестового окружения
+        """
+        import random
+        self.random = random.Random(7)
+        self.sorter = AutoSorter()
+
+    def check(self, data, expected_strategy, key=None, reverse=False):
+        """
+        @brief Проверяет результат сортировки и выбранную стратегию
+        """
+        result = self.sorter.sort(data, key=key, reverse=reverse)
+        expected = sorted(data, key=key, reverse=reverse)
+        if key is None:
+            self.assertEqual(result, expected)
+        else:
+            self.assertEqual([key(x) for x in result], [key(x) for x in expected])
+        stats = self.sorter.get_statistics()
+        self.assertEqual(stats['strategy'], expected_strategy)
+        self.assertTrue(stats['reason'])
+
+    def test_empty_and_small_input(self):
+        """
+        @brief Тест выбора сортировки вставками для малого входа
+        """
+        self.check([], "insertion")
+        self.check([3, 1, 2, 5, 4], "insertion")
+        self.check([3, 1, 2, 5, 4], "insertion", reverse=True)
+
+    def test_small_input_is_stable(self):
+        """
+        @brief Тест устойчивости сортировки вставками
+        """
+        data = [(1, 'a'), (0, 'b'), (1, 'c'), (0, 'd')]
+        result = self.sorter.sort(data, key=lambda x: x[0])
+        self.assertEqual(result, [(0, 'b'), (0, 'd'), (1, 'a'), (1, 'c')])
+
+    def test_nearly_sorted_input(self):
+        """
+        @brief Тест выбора гибрида для почти упорядоченных данных
+        """
+        data = list(range(5000))
+        data[10], data[20] = data[20], data[10]
+        self.check(data, "hybrid")
+        self.check(list(range(5000, 0, -1)), "hybrid")
+
+    def test_random_integers(self):
+        """
+        @brief Тест выбора поразрядной сортировки для целых в небольшом диапазоне
+        """
+        data = [self.random.randint(-1000, 1000) for _ in range(2000)]
+        self.check(data, "radix")
+        self.check(data, "radix", reverse=True)
+        self.assertIn('passes', self.sorter.get_statistics())
+
+    def test_wide_key_range(self):
+        """
+        @brief Тест выбора сортировки Шелла для длинных строковых ключей
+        """
+        data = [''.join(self.random.choice('abcdef') for _ in range(20)) for _ in range(500)]
+        self.check(data, "shell")
+        self.assertEqual(self.sorter.get_statistics()['key_type'], "str")
+
+    def test_unencodable_keys(self):
+        """
+        @brief Тест выбора сортировки Шелла для ключей, не поддерживающих Radix
+        """
+        data = [(self.random.randint(0, 9), self.random.random()) for _ in range(300)]
+        self.check(data, "shell")
+        self.check(data, "radix", key=lambda x: x[1])
+        self.assertEqual(self.sorter.get_statistics()['key_type'], "float")
+
+
+class TestSortedBatchList(unittest.TestCase):
+    """
+    @class TestSortedBatchList
+    @brief Тесты для класса SortedBatchList
+    """
+
+    def setUp(self):
+        """
+        @brief Подготовка тестового окружения
+        """
+        import random
+        self.random = random.Random(13)
+
+    def test_batches_are_merged(self):
+        """
+        @brief Тест добавления пакетов и деления блоков
+        """
+        container = SortedBatchList(block_size=16)
+        expected = []
+        for _ in range(20):
+            batch = [self.random.randint(-500, 500) for _ in range(self.random.randint(0, 60))]
+            container.extend(batch)
+            expected.extend(batch)
+            self.assertEqual(list(container), sorted(expected))
+        container.add(10 ** 6)
+        self.assertEqual(container[-1], 10 ** 6)
+        self.assertEqual(list(reversed(container)), sorted(expected + [10 ** 6], reverse=True))
+        stats = container.get_statistics()
+        self.assertEqual(stats['size'], len(expected) + 1)
+        self.assertGreater(stats['blocks'], 1)
+
+    def test_key_and_sorter(self):
+        """
+        @brief Тест контейнера с функцией ключа и заданным сортировщиком
+        """
+        products = [Product(f"P{i}", self.random.randint(1, 100) / 4, i, "Test") for i in range(300)]
+        container = SortedBatchList(products[:100], key=lambda p: p.price,
+                                    sorter=LSDRadixSorter(), block_size=8)
+        container.extend(products[100:])
+        self.assertEqual([p.price for p in container], sorted(p.price for p in products))
+        self.assertIn(products[42], container)
+        self.assertNotIn(Product("Other", products[42].price, -1, "Test"), container)
+
+    def test_equal_keys_keep_batch_order(self):
+        """
+        @brief Тест что элементы с равными ключами из поздних пакетов идут после ранних
+        """
+        container = SortedBatchList(key=lambda pair: pair[0], sorter=LSDRadixSorter(),
+                                    block_size=2)
+        for batch in range(5):
+            container.extend([(value, batch) for value in (3, 1, 2)])
+        self.assertEqual(list(container), [(value, batch) for value in (1, 2, 3)
+                                           for batch in range(5)])
+
+    def test_bisect_and_getitem(self):
+        """
+        @brief Тест бинарного поиска и доступа по позиции
+        """
+        data = [self.random.randint(0, 50) for _ in range(400)]
+        container = SortedBatchList(block_size=10)
+        for i in range(0, 400, 37):
+            container.extend(data[i:i + 37])
+        ordered = sorted(data)
+        import bisect
+        for value in (-1, 0, 25, 50, 51):
+            self.assertEqual(container.bisect_left(value), bisect.bisect_left(ordered, value))
+            self.assertEqual(container.bisect_right(value), bisect.bisect_right(ordered, value))
+        self.assertEqual([container[i] for i in range(len(container))], ordered)
+        with self.assertRaises(IndexError):
+            container[400]
+
+    def test_positions_follow_block_splits(self):
+        """
+        @brief Тест что индекс позиций блоков обновляется после каждого пакета
+        """
+        container = SortedBatchList(block_size=4)
+        ordered = []
+        for _ in range(15):
+            batch = [self.random.randint(0, 30) for _ in range(self.random.randint(1, 20))]
+            container.extend(batch)
+            ordered = sorted(ordered + batch)
+            self.assertEqual([container[i] for i in range(len(container))], ordered)
+            self.assertEqual(container[-1], ordered[-1])
+            self.assertEqual(container.bisect_right(15), len([x for x in ordered if x <= 15]))
+            self.assertEqual(list(container.islice(3, 11)), ordered[3:11])
+
+    def test_irange(self):
+        """
+        @brief Тест перебора диапазона ключей
+        """
+        data = [self.random.randint(0, 100) for _ in range(500)]
+        container = SortedBatchList(data, block_size=7)
+        ordered = sorted(data)
+        self.assertEqual(list(container.irange(20, 40)), [x for x in ordered if 20 <= x <= 40])
+        self.assertEqual(list(container.irange(20, 40, inclusive=(False, False))),
+                         [x for x in ordered if 20 < x < 40])
+        self.assertEqual(list(container.irange(maximum=10, reverse=True)),
+                         [x for x in reversed(ordered) if x <= 10])
+        self.assertEqual(list(container.irange(minimum=95)), [x for x in ordered if x >= 95])
+        self.assertEqual(list(container.irange(60, 50)), [])
+        self.assertEqual(list(container.islice(5, 15)), ordered[5:15])
+
+    def test_invalid_block_size(self):
+        """
+        @brief Тест ошибки при неверном размере блока
+        """
+        with self.assertRaises(ValueError):
+            SortedBatchList(block_size=0)
+        self.assertEqual(list(SortedBatchList().irange()), [])
+
 
 class TestSorterFactory(unittest.TestCase):
     """
@@ -485,6 +1621,25 @@ class TestSorterFactory(unittest.TestCase):
         sorter = SorterFactory.create_sorter("radix")
         self.assertIsInstance(sorter, LSDRadixSorter)
 
+    def test_create_parallel_sorters(self):
+        """
+        @brief Тест создания параллельных сортировщиков через фабрику
+        """
+        sorter = SorterFactory.create_sorter("parallel_shell")
+        self.assertIsInstance(sorter, ParallelSorter)
+        self.assertEqual(sorter.algorithm, "shell")
+        sorter = SorterFactory.create_sorter("parallel_radix")
+        self.assertEqual(sorter.algorithm, "radix")
+
+    def test_create_auto_sorter(self):
+        """
+        @brief Тест создания AutoSorter через фабрику
+        """
+        sorter = SorterFactory.create_sorter("auto")
+        self.assertIsInstance(sorter, AutoSorter)
+        sorter = SorterFactory.create_sorter("msd_radix")
+        self.assertIsInstance(sorter, MSDRadixSorter)
+
     def test_create_shell_sorter_uppercase(self):
         """
         @brief Тест создания ShellSorter с заглавными буквами
@@ -2,6 +2,9 @@ class AdjacentVertexIterator(Generic[T]):
     """
     @class AdjacentVertexIterator
     @brief Двунаправленный итератор для перебора смежных вершин
+    @details Итератор читает список графа без копирования и становится
+             недействительным при любом изменении рёбер графа: после этого
+             current() и __next__ выбрасывают GraphException
     """
 
     def __init__(self, graph: UndirectedGraph[T], vertex: Vertex[T], position: int):
@@ -13,11 +16,22 @@ class AdjacentVertexIterator(Generic[T]):
         """
         self._graph = graph
         self._vertex = vertex
-        self._adjacent_vertices = graph.get_adjacent_vertices(vertex)
+        # Представление списка графа без копирования: создание итератора за O(1)
+        self._adjacent_vertices = graph._adjacent_view(vertex)
         self._position = position
+        self._version = graph._version
+
+    def _check_version(self):
+        """
+        @brief Проверяет, что граф не изменялся после создания итератора
+        @throws GraphException если граф был изменен
+        """
+        if self._version != self._graph._version:
+            raise GraphException("Граф изменен во время обхода смежных вершин")
 
     def current(self) -> Vertex[T]:
         """Получает текущую смежную вершину"""
+        self._check_version()
         if self._position < 0 or self._position >= len(self._adjacent_vertices):
             raise IndexError("Итератор вышел за пределы")
         return self._adjacent_vertices[self._position]
@@ -49,6 +63,7 @@ class AdjacentVertexIterator(Generic[T]):
 
     def __next__(self) -> Vertex[T]:
         """Переходит к следующему элементу"""
+        self._check_version()
         if self._position >= len(self._adjacent_vertices):
             raise StopIteration
         vertex = self.current()
@@ -0,0 +1,348 @@
+from bisect import bisect_left, bisect_right
+
+
+class FrozenGraph(Generic[T]):
+    """
+    @class FrozenGraph
+    @brief Неизменяемый снимок неориентированного графа в формате CSR
+    @details Вершины нумеруются плотными индексами 0..V-1 в порядке идентификаторов.
+             Смежность хранится в двух массивах array:
+             - indptr (V + 1 элементов): соседи вершины i занимают indices[indptr[i]:indptr[i + 1]];
+             - indices (2E элементов): упорядоченные индексы соседей.
+             Дополнительные массивы upper и edge_ptr (V и V + 1 элементов) позволяют
+             обращаться к i-му ребру упорядоченного списка за O(log V) без хранения
+             объектов Edge.
+
+    Элементы массивов - 4-байтовые целые ('i'), пока значения меньше 2^31, иначе 8-байтовые ('q').
+    Каждое ребро хранится в indices дважды, поэтому снимок занимает 8 байт на ребро
+    и еще около 12 байт на вершину (точный объем возвращает nbytes()).
+
+    Снимок поддерживает те же запросы и итераторы, что и UndirectedGraph,
+    но не методы изменения графа.
+    """
+
+    _version = 0  # Снимок не изменяется, поэтому его итераторы всегда действительны
+
+    def __init__(self, vertices: List[Vertex[T]], indptr, indices, upper, edge_ptr):
+        """
+        @brief Конструктор снимка (используйте UndirectedGraph.freeze())
+        @param vertices Вершины в порядке плотных индексов
+        @param indptr Границы списков соседей
+        @param indices Индексы соседей
+        @param upper Для каждой вершины позиция в indices первого соседа с большим индексом
+        @param edge_ptr Количество рёбер (i, j), i < j, у вершин с меньшим индексом
+        """
+        self._vertices = tuple(vertices)
+        self._index: Dict[int, int] = {vertex.vertex_id: i for i, vertex in enumerate(self._vertices)}
+        self.indptr = indptr
+        self.indices = indices
+        self._upper = upper
+        self._edge_ptr = edge_ptr
+        self._edges = FrozenEdgeList(self)
+
+    def _dense_index(self, vertex: Vertex[T]) -> int:
+        """
+        @brief Возвращает плотный индекс вершины
+        @param vertex Вершина
+        @return Индекс в диапазоне [0, V)
+        @throws VertexNotFoundException если вершина не найдена
+        """
+        index = self._index.get(vertex.vertex_id) if isinstance(vertex, Vertex) else None
+        if index is None:
+            raise VertexNotFoundException(f"Вершина {vertex} не найдена в графе")
+        return index
+
+    def _edge_at(self, position: int) -> Edge[T]:
+        """
+        @brief Создает ребро, стоящее на позиции position упорядоченного списка рёбер
+        @param position Позиция в диапазоне [0, E)
+        @return Ребро (вершина с меньшим идентификатором первая)
+        """
+        source = bisect_right(self._edge_ptr, position) - 1
+        target = self.indices[self._upper[source] + position - self._edge_ptr[source]]
+        return Edge(self._vertices[source], self._vertices[target])
+
+    def empty(self) -> bool:
+        """
+        @brief Проверяет, пуст ли граф
+        @return True если граф не содержит вершин
+        """
+        return len(self._vertices) == 0
+
+    def has_vertex(self, vertex: Vertex[T]) -> bool:
+        """
+        @brief Проверяет присутствие вершины в графе
+        @param vertex Вершина для проверки
+        @return True если вершина присутствует в графе
+        """
+        return isinstance(vertex, Vertex) and vertex.vertex_id in self._index
+
+    def has_edge(self, vertex1: Vertex[T], vertex2: Vertex[T]) -> bool:
+        """
+        @brief Проверяет присутствие ребра бинарным поиском в списке соседей
+        @param vertex1 Первая вершина
+        @param vertex2 Вторая вершина
+        @return True если ребро присутствует
+        @throws VertexNotFoundException если одна из вершин не найдена
+        """
+        if not self.has_vertex(vertex1) or not self.has_vertex(vertex2):
+            raise VertexNotFoundException("Одна или обе вершины не найдены в графе")
+
+        source = self._index[vertex1.vertex_id]
+        target = self._index[vertex2.vertex_id]
+        end = self.indptr[source + 1]
+        position = bisect_left(self.indices, target, self.indptr[source], end)
+        return position < end and self.indices[position] == target
+
+    def vertex_count(self) -> int:
+        """
+        @brief Получает количество вершин в графе
+        @return Количество вершин
+        """
+        return len(self._vertices)
+
+    def edge_count(self) -> int:
+        """
+        @brief Получает количество ребер в графе
+        @return Количество ребер
+        """
+        return len(self.indices) // 2
+
+    def vertex_degree(self, vertex: Vertex[T]) -> int:
+        """
+        @brief Вычисляет степень вершины
+        @param vertex Вершина
+        @return Степень вершины
+        @throws VertexNotFoundException если вершина не найдена
+        """
+        index = self._dense_index(vertex)
+        return self.indptr[index + 1] - self.indptr[index]
+
+    def edge_degree(self, vertex1: Vertex[T], vertex2: Vertex[T]) -> int:
+        """
+        @brief Вычисляет степень ребра (сумма степеней его вершин минус 2)
+        @param vertex1 Первая вершина
+        @param vertex2 Вторая вершина
+        @return Степень ребра
+        @throws EdgeNotFoundException если ребро не найдено
+        """
+        if not self.has_edge(vertex1, vertex2):
+            raise EdgeNotFoundException(f"Ребро между {vertex1} и {vertex2} не найдено")
+
+        return self.vertex_degree(vertex1) + self.vertex_degree(vertex2) - 2
+
+    def get_adjacent_vertices(self, vertex: Vertex[T]) -> List[Vertex[T]]:
+        """
+        @brief Получает список смежных вершин
+        @param vertex Вершина
+        @return Упорядоченный список смежных вершин
+        @throws VertexNotFoundException если вершина не найдена
+        """
+        return list(self._adjacent_view(vertex))
+
+    def get_incident_edges(self, vertex: Vertex[T]) -> List[Edge[T]]:
+        """
+        @brief Получает список инцидентных ребер
+        @param vertex Вершина
+        @return Упорядоченный список инцидентных ребер
+        @throws VertexNotFoundException если вершина не найдена
+        """
+        return list(self._incident_view(vertex))
+
+    def _adjacent_view(self, vertex: Vertex[T]) -> 'FrozenRow':
+        """
+        @brief Возвращает ленивое представление строки CSR со смежными вершинами
+        @param vertex Вершина
+        @return Последовательность смежных вершин
+        @throws VertexNotFoundException если вершина не найдена
+        """
+        return FrozenRow(self, self._dense_index(vertex), incident=False)
+
+    def _incident_view(self, vertex: Vertex[T]) -> 'FrozenRow':
+        """
+        @brief Возвращает ленивое представление строки CSR с инцидентными ребрами
+        @param vertex Вершина
+        @return Последовательность инцидентных ребер
+        @throws VertexNotFoundException если вершина не найдена
+        """
+        return FrozenRow(self, self._dense_index(vertex), incident=True)
+
+    def nbytes(self) -> int:
+        """
+        @brief Возвращает объем памяти массивов CSR в байтах
+        @return Суммарный размер indptr, indices, upper и edge_ptr
+        """
+        return sum(len(a) * a.itemsize for a in (self.indptr, self.indices, self._upper, self._edge_ptr))
+
+    # Методы для создания итераторов
+    def vertices_begin(self) -> 'VertexIterator':
+        """
+        @brief Создает итератор на начало списка вершин
+        @return Итератор вершин
+        """
+        return VertexIterator(self, 0)
+
+    def vertices_end(self) -> 'VertexIterator':
+        """
+        @brief Создает итератор на конец списка вершин
+        @return Итератор вершин
+        """
+        return VertexIterator(self, len(self._vertices))
+
+    def vertices_rbegin(self) -> 'ReverseVertexIterator':
+        """
+        @brief Создает обратный итератор на конец списка вершин
+        @return Обратный итератор вершин
+        """
+        return ReverseVertexIterator(self, len(self._vertices) - 1)
+
+    def vertices_rend(self) -> 'ReverseVertexIterator':
+        """
+        @brief Создает обратный итератор на начало списка вершин
+        @return Обратный итератор вершин
+        """
+        return ReverseVertexIterator(self, -1)
+
+    def edges_begin(self) -> 'EdgeIterator':
+        """
+        @brief Создает итератор на начало списка ребер
+        @return Итератор ребер
+        """
+        return EdgeIterator(self, 0)
+
+    def edges_end(self) -> 'EdgeIterator':
+        """
+        @brief Создает итератор на конец списка ребер
+        @return Итератор ребер
+        """
+        return EdgeIterator(self, len(self._edges))
+
+    def edges_rbegin(self) -> 'ReverseEdgeIterator':
+        """
+        @brief Создает обратный итератор на конец списка ребер
+        @return Обратный итератор ребер
+        """
+        return ReverseEdgeIterator(self, len(self._edges) - 1)
+
+    def edges_rend(self) -> 'ReverseEdgeIterator':
+        """
+        @brief Создает обратный итератор на начало списка ребер
+        @return Обратный итератор ребер
+        """
+        return ReverseEdgeIterator(self, -1)
+
+    def adjacent_vertices_begin(self, vertex: Vertex[T]) -> 'AdjacentVertexIterator':
+        """
+        @brief Создает итератор на начало списка смежных вершин
+        @param vertex Вершина
+        @return Итератор смежных вершин
+        """
+        return AdjacentVertexIterator(self, vertex, 0)
+
+    def adjacent_vertices_end(self, vertex: Vertex[T]) -> 'AdjacentVertexIterator':
+        """
+        @brief Создает итератор на конец списка смежных вершин
+        @param vertex Вершина
+        @return Итератор смежных вершин
+        """
+        return AdjacentVertexIterator(self, vertex, self.vertex_degree(vertex))
+
+    def incident_edges_begin(self, vertex: Vertex[T]) -> 'IncidentEdgeIterator':
+        """
+        @brief Создает итератор на начало списка инцидентных ребер
+        @param vertex Вершина
+        @return Итератор инцидентных ребер
+        """
+        return IncidentEdgeIterator(self, vertex, 0)
+
+    def incident_edges_end(self, vertex: Vertex[T]) -> 'IncidentEdgeIterator':
+        """
+        @brief Создает итератор на конец списка инцидентных ребер
+        @param vertex Вершина
+        @return Итератор инцидентных ребер
+        """
+        return IncidentEdgeIterator(self, vertex, self.vertex_degree(vertex))
+
+    def __repr__(self):
+        """
+        @brief Строковое представление снимка
+        @return Строка с информацией о графе
+        """
+        return f"FrozenGraph(vertices={len(self._vertices)}, edges={self.edge_count()})"
+
+
+class FrozenEdgeList:
+    """
+    @class FrozenEdgeList
+    @brief Упорядоченный список рёбер снимка, создающий объекты Edge по запросу
+    @details Позволяет итераторам рёбер работать со снимком так же, как со списком _edges
+    """
+
+    def __init__(self, graph: FrozenGraph):
+        """
+        @brief Конструктор списка рёбер
+        @param graph Снимок графа
+        """
+        self._graph = graph
+
+    def __len__(self) -> int:
+        """Количество рёбер"""
+        return self._graph.edge_count()
+
+    def __getitem__(self, position: int) -> Edge:
+        """Ребро на позиции position"""
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("Позиция ребра вне диапазона")
+        return self._graph._edge_at(position)
+
+    def __iter__(self):
+        """Перебирает рёбра по порядку без бинарного поиска"""
+        graph = self._graph
+        vertices = graph._vertices
+        indices = graph.indices
+        for source, vertex in enumerate(vertices):
+            for position in range(graph._upper[source], graph.indptr[source + 1]):
+                yield Edge(vertex, vertices[indices[position]])
+
+
+class FrozenRow:
+    """
+    @class FrozenRow
+    @brief Строка CSR снимка, создающая смежные вершины или инцидентные рёбра по запросу
+    @details Хранит только границы строки, поэтому создается за O(1)
+    """
+
+    def __init__(self, graph: FrozenGraph, index: int, incident: bool):
+        """
+        @brief Конструктор строки
+        @param graph Снимок графа
+        @param index Плотный индекс вершины
+        @param incident True для инцидентных рёбер, False для смежных вершин
+        """
+        self._graph = graph
+        self._index = index
+        self._start = graph.indptr[index]
+        self._end = graph.indptr[index + 1]
+        self._incident = incident
+
+    def __len__(self) -> int:
+        """Степень вершины"""
+        return self._end - self._start
+
+    def __getitem__(self, position: int):
+        """Смежная вершина или инцидентное ребро на позиции position"""
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("Позиция вне строки")
+
+        vertices = self._graph._vertices
+        other = self._graph.indices[self._start + position]
+        if not self._incident:
+            return vertices[other]
+        # Ребро хранится канонически: вершина с меньшим идентификатором первая
+        if other < self._index:
+            return Edge(vertices[other], vertices[self._index])
+        return Edge(vertices[self._index], vertices[other])
@@ -2,6 +2,9 @@ class IncidentEdgeIterator(Generic[T]):
     """
     @class IncidentEdgeIterator
     @brief Двунаправленный итератор для перебора инцидентных ребер
+    @details Итератор читает список графа без копирования и становится
+             недействительным при любом изменении рёбер графа: после этого
+             current() и __next__ выбрасывают GraphException
     """
 
     def __init__(self, graph: UndirectedGraph[T], vertex: Vertex[T], position: int):
@@ -13,11 +16,22 @@ class IncidentEdgeIterator(Generic[T]):
         """
         self._graph = graph
         self._vertex = vertex
-        self._incident_edges = graph.get_incident_edges(vertex)
+        # Представление списка графа без копирования: создание итератора за O(1)
+        self._incident_edges = graph._incident_view(vertex)
         self._position = position
+        self._version = graph._version
+
+    def _check_version(self):
+        """
+        @brief Проверяет, что граф не изменялся после создания итератора
+        @throws GraphException если граф был изменен
+        """
+        if self._version != self._graph._version:
+            raise GraphException("Граф изменен во время обхода инцидентных ребер")
 
     def current(self) -> Edge[T]:
         """Получает текущее инцидентное ребро"""
+        self._check_version()
         if self._position < 0 or self._position >= len(self._incident_edges):
             raise IndexError("Итератор вышел за пределы")
         return self._incident_edges[self._position]
@@ -49,6 +63,7 @@ class IncidentEdgeIterator(Generic[T]):
 
     def __next__(self) -> Edge[T]:
         """Переходит к следующему элементу"""
+        self._check_version()
         if self._position >= len(self._incident_edges):
             raise StopIteration
         edge = self.current()
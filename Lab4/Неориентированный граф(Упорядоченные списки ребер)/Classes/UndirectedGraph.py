@@ -1,9 +1,21 @@
+import csv
+from array import array
+from bisect import bisect_left, insort
+
+
 class UndirectedGraph(Generic[T]):
     """
     @class UndirectedGraph
     @brief Шаблонный класс неориентированного графа на основе упорядоченных списков рёбер
     @details Представляет неориентированный граф с возможностью хранения значений в вершинах
 
+    Помимо упорядоченного списка рёбер граф хранит хэш-таблицу вершин по
+    идентификатору и для каждой вершины упорядоченный список смежных вершин
+    с параллельным списком инцидентных рёбер. Поэтому проверка вершины и
+    степень вычисляются за O(1), а смежные вершины и инцидентные рёбра - за O(deg).
+    Наличие ребра проверяется по множеству канонических пар (min_id, max_id),
+    а упорядоченный список рёбер поддерживается вставкой бинарным поиском.
+
     Класс предоставляет:
     - Добавление/удаление вершин, ребеер
     - Проверку наличия вершин и ребер
@@ -25,7 +37,12 @@ class UndirectedGraph(Generic[T]):
         """
         self._vertices: List[Vertex[T]] = []  # Список вершин
         self._edges: List[Edge[T]] = []  # Упорядоченный список рёбер
+        self._vertex_index: Dict[int, Vertex[T]] = {}  # Вершины по идентификатору
+        self._adjacency: Dict[int, List[Vertex[T]]] = {}  # Упорядоченные списки смежных вершин
+        self._incident: Dict[int, List[Edge[T]]] = {}  # Инцидентные рёбра в том же порядке
+        self._edge_keys: Set[Tuple[int, int]] = set()  # Канонические пары (min_id, max_id)
         self._next_vertex_id = 0
+        self._version = 0  # Номер изменения списков смежности для проверки итераторов
 
     def __copy__(self):
         """
@@ -35,6 +52,12 @@ class UndirectedGraph(Generic[T]):
         new_graph = UndirectedGraph[T]()
         new_graph._vertices = self._vertices.copy()
         new_graph._edges = self._edges.copy()
+        new_graph._vertex_index = self._vertex_index.copy()
+        new_graph._adjacency = {vertex_id: adjacent.copy()
+                                for vertex_id, adjacent in self._adjacency.items()}
+        new_graph._incident = {vertex_id: edges.copy()
+                               for vertex_id, edges in self._incident.items()}
+        new_graph._edge_keys = self._edge_keys.copy()
         new_graph._next_vertex_id = self._next_vertex_id
         return new_graph
 
@@ -47,6 +70,10 @@ class UndirectedGraph(Generic[T]):
         new_graph = UndirectedGraph[T]()
         new_graph._vertices = copy.deepcopy(self._vertices, memo)
         new_graph._edges = copy.deepcopy(self._edges, memo)
+        new_graph._vertex_index = copy.deepcopy(self._vertex_index, memo)
+        new_graph._adjacency = copy.deepcopy(self._adjacency, memo)
+        new_graph._incident = copy.deepcopy(self._incident, memo)
+        new_graph._edge_keys = self._edge_keys.copy()
         new_graph._next_vertex_id = self._next_vertex_id
         return new_graph
 
@@ -71,7 +98,12 @@ class UndirectedGraph(Generic[T]):
         """
         self._vertices.clear()
         self._edges.clear()
+        self._vertex_index.clear()
+        self._adjacency.clear()
+        self._incident.clear()
+        self._edge_keys.clear()
         self._next_vertex_id = 0
+        self._version += 1
 
     def __eq__(self, other) -> bool:
         """
@@ -91,7 +123,7 @@ class UndirectedGraph(Generic[T]):
                 return False
 
         # Сравниваем ребра
-        return sorted(self._edges) == sorted(other._edges)
+        return self._edge_keys == other._edge_keys
 
     def __ne__(self, other) -> bool:
         """
@@ -146,9 +178,15 @@ class UndirectedGraph(Generic[T]):
         if self is other:
             return self
 
-        self._vertices = copy.deepcopy(other._vertices)
-        self._edges = copy.deepcopy(other._edges)
+        memo = {}
+        self._vertices = copy.deepcopy(other._vertices, memo)
+        self._edges = copy.deepcopy(other._edges, memo)
+        self._vertex_index = copy.deepcopy(other._vertex_index, memo)
+        self._adjacency = copy.deepcopy(other._adjacency, memo)
+        self._incident = copy.deepcopy(other._incident, memo)
+        self._edge_keys = other._edge_keys.copy()
         self._next_vertex_id = other._next_vertex_id
+        self._version += 1
         return self
 
     def has_vertex(self, vertex: Vertex[T]) -> bool:
@@ -157,7 +195,7 @@ class UndirectedGraph(Generic[T]):
         @param vertex Вершина для проверки
         @return True если вершина присутствует в графе
         """
-        return vertex in self._vertices
+        return isinstance(vertex, Vertex) and vertex.vertex_id in self._vertex_index
 
     def has_edge(self, vertex1: Vertex[T], vertex2: Vertex[T]) -> bool:
         """
@@ -170,8 +208,18 @@ class UndirectedGraph(Generic[T]):
         if not self.has_vertex(vertex1) or not self.has_vertex(vertex2):
             raise VertexNotFoundException("Одна или обе вершины не найдены в графе")
 
-        edge = Edge(vertex1, vertex2)
-        return edge in self._edges
+        return self._edge_key(vertex1, vertex2) in self._edge_keys
+
+    @staticmethod
+    def _edge_key(vertex1: Vertex[T], vertex2: Vertex[T]) -> Tuple[int, int]:
+        """
+        @brief Возвращает каноническую пару идентификаторов ребра
+        @param vertex1 Первая вершина
+        @param vertex2 Вторая вершина
+        @return Пара (меньший идентификатор, больший идентификатор)
+        """
+        id1, id2 = vertex1.vertex_id, vertex2.vertex_id
+        return (id1, id2) if id1 < id2 else (id2, id1)
 
     def vertex_count(self) -> int:
         """
@@ -197,11 +245,7 @@ class UndirectedGraph(Generic[T]):
         if not self.has_vertex(vertex):
             raise VertexNotFoundException(f"Вершина {vertex} не найдена в графе")
 
-        degree = 0
-        for edge in self._edges:
-            if edge.contains_vertex(vertex):
-                degree += 1
-        return degree
+        return len(self._adjacency[vertex.vertex_id])
 
     def edge_degree(self, vertex1: Vertex[T], vertex2: Vertex[T]) -> int:
         """
@@ -224,9 +268,11 @@ class UndirectedGraph(Generic[T]):
         """
         vertex = Vertex(value, self._next_vertex_id)
         self._next_vertex_id += 1
+        # Идентификаторы возрастают, поэтому добавление в конец сохраняет упорядоченность
         self._vertices.append(vertex)
-        # Поддерживаем упорядоченность списка вершин
-        self._vertices.sort()
+        self._vertex_index[vertex.vertex_id] = vertex
+        self._adjacency[vertex.vertex_id] = []
+        self._incident[vertex.vertex_id] = []
         return vertex
 
     def add_edge(self, vertex1: Vertex[T], vertex2: Vertex[T]) -> Edge[T]:
@@ -244,17 +290,206 @@ class UndirectedGraph(Generic[T]):
         if vertex1 == vertex2:
             raise GraphException("Петли не поддерживаются")
 
-        edge = Edge(vertex1, vertex2)
-        if edge in self._edges:
+        key = self._edge_key(vertex1, vertex2)
+        if key in self._edge_keys:
             raise EdgeAlreadyExistsException(
                 f"Ребро между {vertex1} и {vertex2} уже существует"
             )
 
-        self._edges.append(edge)
+        edge = Edge(vertex1, vertex2)
+        self._edge_keys.add(key)
         # Поддерживаем упорядоченность списка рёбер
-        self._edges.sort()
+        insort(self._edges, edge)
+        self._link(vertex1, vertex2, edge)
+        self._link(vertex2, vertex1, edge)
         return edge
 
+    def add_edges_from(self, pairs: Iterable[Tuple[Vertex[T], Vertex[T]]],
+                       skip_duplicates: bool = False) -> List[Edge[T]]:
+        """
+        @brief Добавляет набор рёбер за одну сортировку
+        @param pairs Пары вершин
+        @param skip_duplicates Пропускать уже существующие и повторяющиеся рёбра
+               вместо выбрасывания исключения
+        @return Созданные рёбра в порядке списка рёбер
+        @throws VertexNotFoundException если одна из вершин не найдена
+        @throws GraphException если пара образует петлю
+        @throws EdgeAlreadyExistsException если ребро уже существует или повторяется
+        @details Вход проверяется за один проход до изменения графа: при ошибке
+                 граф остается прежним. Затем новые рёбра сортируются один раз и
+                 сливаются со списком рёбер и списками смежности - O(V + E log E)
+        """
+        keys = []
+        for vertex1, vertex2 in pairs:
+            if not self.has_vertex(vertex1) or not self.has_vertex(vertex2):
+                raise VertexNotFoundException("Одна или обе вершины не найдены в графе")
+            if vertex1 == vertex2:
+                raise GraphException("Петли не поддерживаются")
+
+            key = self._edge_key(vertex1, vertex2)
+            if key in self._edge_keys:
+                if skip_duplicates:
+                    continue
+                raise EdgeAlreadyExistsException(
+                    f"Ребро между {vertex1} и {vertex2} уже существует"
+                )
+            keys.append(key)
+
+        return self._insert_edges(keys, skip_duplicates)
+
+    def _insert_edges(self, keys: List[Tuple[int, int]], skip_duplicates: bool) -> List[Edge[T]]:
+        """
+        @brief Вставляет рёбра, отсутствующие в графе, сортируя их один раз
+        @param keys Канонические пары новых рёбер (сортируются на месте)
+        @param skip_duplicates Пропускать повторяющиеся пары вместо выбрасывания исключения
+        @return Созданные рёбра в порядке списка рёбер
+        @throws EdgeAlreadyExistsException если пара повторяется (граф не изменяется)
+        """
+        keys.sort()
+        vertex_index = self._vertex_index
+
+        # После сортировки повторы стоят рядом - отдельное множество не нужно
+        duplicate = next((i for i in range(1, len(keys)) if keys[i] == keys[i - 1]), None)
+        if duplicate is not None:
+            if not skip_duplicates:
+                id1, id2 = keys[duplicate]
+                raise EdgeAlreadyExistsException(
+                    f"Ребро между {vertex_index[id1]} и {vertex_index[id2]} повторяется"
+                )
+            keys[:] = [key for i, key in enumerate(keys) if i == 0 or key != keys[i - 1]]
+
+        new_edges = [Edge(vertex_index[id1], vertex_index[id2]) for id1, id2 in keys]
+        self._edge_keys.update(keys)
+
+        if self._edges:
+            # Вершины, у которых уже есть соседи, получат два упорядоченных участка
+            stale = {vertex_id for key in keys for vertex_id in key if self._adjacency[vertex_id]}
+            # Два упорядоченных участка: сортировка по ключу сводится к их слиянию
+            self._edges.extend(new_edges)
+            self._edges.sort(key=lambda edge: self._edge_key(edge.vertex1, edge.vertex2))
+        else:
+            stale = set()
+            self._edges = new_edges.copy()
+
+        # Ключи упорядочены, поэтому соседи каждой вершины добавляются по возрастанию
+        adjacency = self._adjacency
+        incident = self._incident
+        for (id1, id2), edge in zip(keys, new_edges):
+            adjacency[id1].append(edge.vertex2)
+            incident[id1].append(edge)
+            adjacency[id2].append(edge.vertex1)
+            incident[id2].append(edge)
+
+        for vertex_id in stale:
+            adjacent = self._adjacency[vertex_id]
+            if len(adjacent) > 1:
+                order = sorted(range(len(adjacent)), key=lambda i: adjacent[i].vertex_id)
+                edges = incident[vertex_id]
+                # Присваивание срезу сохраняет сами списки, на которые ссылаются итераторы
+                adjacent[:] = [adjacent[i] for i in order]
+                edges[:] = [edges[i] for i in order]
+
+        self._version += 1
+        return new_edges
+
+    @classmethod
+    def from_edge_list(cls, edges: Iterable[Tuple[T, T]], vertices: Optional[Iterable[T]] = None,
+                       skip_duplicates: bool = False) -> 'UndirectedGraph[T]':
+        """
+        @brief Строит граф по списку рёбер, заданных значениями вершин
+        @param edges Пары значений; каждое новое значение становится вершиной
+        @param vertices Значения вершин, добавляемые первыми (в том числе изолированные)
+        @param skip_duplicates Пропускать повторяющиеся рёбра вместо выбрасывания исключения
+        @return Новый граф
+        @throws GraphException если пара образует петлю
+        @throws EdgeAlreadyExistsException если ребро повторяется
+        @details Значения вершин должны быть хэшируемыми. Рёбра читаются за один
+                 проход (подходит для генераторов) и сортируются один раз
+        """
+        graph = cls()
+        ids: Dict[T, int] = {}  # Идентификаторы вершин по значению
+
+        for value in vertices or ():
+            if value not in ids:
+                ids[value] = graph.add_vertex(value).vertex_id
+
+        keys = []
+        for value1, value2 in edges:
+            id1 = ids.get(value1)
+            if id1 is None:
+                id1 = ids[value1] = graph.add_vertex(value1).vertex_id
+            id2 = ids.get(value2)
+            if id2 is None:
+                id2 = ids[value2] = graph.add_vertex(value2).vertex_id
+            if id1 == id2:
+                raise GraphException(f"Петли не поддерживаются: {value1!r}")
+            keys.append((id1, id2) if id1 < id2 else (id2, id1))
+
+        graph._insert_edges(keys, skip_duplicates)
+        return graph
+
+    @classmethod
+    def from_file(cls, path: str, delimiter: Optional[str] = None,
+                  value_type: Callable[[str], T] = str, has_header: bool = False,
+                  skip_duplicates: bool = False, encoding: str = 'utf-8') -> 'UndirectedGraph[T]':
+        """
+        @brief Потоково загружает граф из файла списка рёбер или CSV
+        @param path Путь к файлу
+        @param delimiter Разделитель CSV; если не задан, файлы *.csv читаются
+               с запятой, остальные - как список рёбер через пробельные символы
+        @param value_type Преобразование текстового значения вершины (например, int)
+        @param has_header Первая строка содержит заголовок
+        @param skip_duplicates Пропускать повторяющиеся рёбра
+        @param encoding Кодировка файла
+        @return Новый граф
+        @throws GraphException если строка содержит меньше двух значений
+        @details Пустые строки и строки, начинающиеся с '#', пропускаются.
+                 Файл читается построчно и не загружается в память целиком
+        """
+        if delimiter is None and path.lower().endswith('.csv'):
+            delimiter = ','
+
+        def rows():
+            with open(path, 'r', encoding=encoding, newline='') as f:
+                lines = csv.reader(f, delimiter=delimiter) if delimiter else (line.split() for line in f)
+                for line_number, fields in enumerate(lines, 1):
+                    if line_number == 1 and has_header:
+                        continue
+                    if not fields or fields[0].lstrip().startswith('#'):
+                        continue
+                    if len(fields) < 2:
+                        raise GraphException(
+                            f"Строка {line_number}: ожидалось две вершины, получено {fields}"
+                        )
+                    yield value_type(fields[0].strip()), value_type(fields[1].strip())
+
+        return cls.from_edge_list(rows(), skip_duplicates=skip_duplicates)
+
+    def _link(self, vertex: Vertex[T], other: Vertex[T], edge: Edge[T]):
+        """
+        @brief Вставляет смежную вершину и ребро в упорядоченные списки вершины
+        @param vertex Вершина, в списки которой выполняется вставка
+        @param other Смежная вершина
+        @param edge Ребро между вершинами
+        """
+        adjacent = self._adjacency[vertex.vertex_id]
+        position = bisect_left(adjacent, other)
+        adjacent.insert(position, other)
+        self._incident[vertex.vertex_id].insert(position, edge)
+        self._version += 1
+
+    def _unlink(self, vertex: Vertex[T], other: Vertex[T]):
+        """
+        @brief Удаляет смежную вершину и ребро из упорядоченных списков вершины
+        @param vertex Вершина, из списков которой выполняется удаление
+        @param other Смежная вершина
+        """
+        adjacent = self._adjacency[vertex.vertex_id]
+        position = bisect_left(adjacent, other)
+        del adjacent[position]
+        del self._incident[vertex.vertex_id][position]
+        self._version += 1
+
     def remove_vertex(self, vertex: Vertex[T]):
         """
         @brief Удаляет вершину из графа
@@ -265,10 +500,17 @@ class UndirectedGraph(Generic[T]):
             raise VertexNotFoundException(f"Вершина {vertex} не найдена в графе")
 
         # Удаляем все рёбра, инцидентные этой вершине
-        self._edges = [edge for edge in self._edges if not edge.contains_vertex(vertex)]
+        for other, edge in zip(self._adjacency[vertex.vertex_id], self._incident[vertex.vertex_id]):
+            del self._edges[bisect_left(self._edges, edge)]
+            self._edge_keys.discard(self._edge_key(vertex, other))
+            self._unlink(other, vertex)
 
         # Удаляем саму вершину
-        self._vertices.remove(vertex)
+        del self._vertices[bisect_left(self._vertices, vertex)]
+        del self._vertex_index[vertex.vertex_id]
+        del self._adjacency[vertex.vertex_id]
+        del self._incident[vertex.vertex_id]
+        self._version += 1
 
     def remove_edge(self, vertex1: Vertex[T], vertex2: Vertex[T]):
         """
@@ -277,13 +519,16 @@ class UndirectedGraph(Generic[T]):
         @param vertex2 Вторая вершина
         @throws EdgeNotFoundException если ребро не найдено
         """
-        edge = Edge(vertex1, vertex2)
-        if edge not in self._edges:
+        key = self._edge_key(vertex1, vertex2)
+        if key not in self._edge_keys:
             raise EdgeNotFoundException(
                 f"Ребро между {vertex1} и {vertex2} не найдено"
             )
 
-        self._edges.remove(edge)
+        self._edge_keys.remove(key)
+        del self._edges[bisect_left(self._edges, Edge(vertex1, vertex2))]
+        self._unlink(vertex1, vertex2)
+        self._unlink(vertex2, vertex1)
 
     def remove_vertex_by_iterator(self, vertex_iter: 'VertexIterator'):
         """
@@ -308,17 +553,8 @@ class UndirectedGraph(Generic[T]):
         @return Упорядоченный список смежных вершин
         @throws VertexNotFoundException если вершина не найдена
         """
-        if not self.has_vertex(vertex):
-            raise VertexNotFoundException(f"Вершина {vertex} не найдена в графе")
-
-        adjacent = []
-        for edge in self._edges:
-            other = edge.get_other_vertex(vertex)
-            if other is not None:
-                adjacent.append(other)
-
-        # Возвращаем упорядоченный список
-        return sorted(adjacent)
+        # Список уже упорядочен; возвращаем копию, чтобы не открывать внутреннее состояние
+        return self._adjacent_view(vertex).copy()
 
     def get_incident_edges(self, vertex: Vertex[T]) -> List[Edge[T]]:
         """
@@ -327,11 +563,66 @@ class UndirectedGraph(Generic[T]):
         @return Упорядоченный список инцидентных ребер
         @throws VertexNotFoundException если вершина не найдена
         """
+        # Рёбра упорядочены по смежной вершине, что совпадает с порядком рёбер
+        return self._incident_view(vertex).copy()
+
+    def _adjacent_view(self, vertex: Vertex[T]) -> List[Vertex[T]]:
+        """
+        @brief Возвращает внутренний упорядоченный список смежных вершин без копирования
+        @param vertex Вершина
+        @return Список смежных вершин (только для чтения)
+        @throws VertexNotFoundException если вершина не найдена
+        @details Список меняется вместе с графом; итераторы сверяют _version,
+                 чтобы обнаружить изменение графа во время обхода
+        """
+        if not self.has_vertex(vertex):
+            raise VertexNotFoundException(f"Вершина {vertex} не найдена в графе")
+
+        return self._adjacency[vertex.vertex_id]
+
+    def _incident_view(self, vertex: Vertex[T]) -> List[Edge[T]]:
+        """
+        @brief Возвращает внутренний упорядоченный список инцидентных ребер без копирования
+        @param vertex Вершина
+        @return Список инцидентных ребер (только для чтения)
+        @throws VertexNotFoundException если вершина не найдена
+        @details Список меняется вместе с графом; итераторы сверяют _version,
+                 чтобы обнаружить изменение графа во время обхода
+        """
         if not self.has_vertex(vertex):
             raise VertexNotFoundException(f"Вершина {vertex} не найдена в графе")
 
-        incident = [edge for edge in self._edges if edge.contains_vertex(vertex)]
-        return sorted(incident)
+        return self._incident[vertex.vertex_id]
+
+    def freeze(self) -> 'FrozenGraph':
+        """
+        @brief Создает неизменяемый снимок графа в формате CSR
+        @return Снимок с массивами indptr и indices над плотными индексами вершин
+        @details Снимок не связан с графом: последующие изменения графа на него не влияют.
+                 Построение выполняется за O(V + E) по упорядоченным спискам смежности.
+                 Массивы хранят 4-байтовые целые ('i'), а если значения не помещаются
+                 в 2^31 - 8-байтовые ('q')
+        """
+        vertices = sorted(self._vertices, key=lambda v: v.vertex_id)
+        index = {vertex.vertex_id: i for i, vertex in enumerate(vertices)}
+
+        vertex_code = 'i' if len(vertices) < 2 ** 31 else 'q'
+        offset_code = 'i' if 2 * len(self._edges) < 2 ** 31 else 'q'
+        indptr = array(offset_code, [0])
+        indices = array(vertex_code)
+        upper = array(offset_code)
+        edge_ptr = array(offset_code, [0])
+        for i, vertex in enumerate(vertices):
+            row = [index[other.vertex_id] for other in self._adjacency[vertex.vertex_id]]
+            # Списки смежности упорядочены по идентификатору, а значит и по плотному индексу
+            start = len(indices)
+            indices.extend(row)
+            indptr.append(len(indices))
+            lower = sum(1 for j in row if j < i)
+            upper.append(start + lower)
+            edge_ptr.append(edge_ptr[-1] + len(row) - lower)
+
+        return FrozenGraph(vertices, indptr, indices, upper, edge_ptr)
 
     # Методы для создания итераторов
     def vertices_begin(self) -> 'VertexIterator':
@@ -404,8 +695,7 @@ class UndirectedGraph(Generic[T]):
         @param vertex Вершина
         @return Итератор смежных вершин
         """
-        adjacent = self.get_adjacent_vertices(vertex)
-        return AdjacentVertexIterator(self, vertex, len(adjacent))
+        return AdjacentVertexIterator(self, vertex, self.vertex_degree(vertex))
 
     def incident_edges_begin(self, vertex: Vertex[T]) -> 'IncidentEdgeIterator':
         """
@@ -421,8 +711,7 @@ class UndirectedGraph(Generic[T]):
         @param vertex Вершина
         @return Итератор инцидентных ребер
         """
-        edges = self.get_incident_edges(vertex)
-        return IncidentEdgeIterator(self, vertex, len(edges))
+        return IncidentEdgeIterator(self, vertex, self.vertex_degree(vertex))
 
     def __repr__(self):
         """
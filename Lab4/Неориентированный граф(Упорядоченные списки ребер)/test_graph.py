@@ -11,7 +11,7 @@ from graph import (
     GraphException, VertexNotFoundException, EdgeNotFoundException,
     VertexAlreadyExistsException, EdgeAlreadyExistsException,
     VertexIterator, EdgeIterator, AdjacentVertexIterator, IncidentEdgeIterator,
-    ReverseVertexIterator, ReverseEdgeIterator
+    ReverseVertexIterator, ReverseEdgeIterator, FrozenGraph
 )
 
 
@@ -325,6 +325,283 @@ class TestUndirectedGraph(unittest.TestCase):
         self.assertEqual(self.graph.vertex_count(), graph_copy.vertex_count())
         self.assertEqual(self.graph.edge_count(), graph_copy.edge_count())
 
+    def test_adjacency_index_order(self):
+        """Тест упорядоченности списков смежности при вставке в произвольном порядке"""
+        vertices = [self.graph.add_vertex(i) for i in range(6)]
+        for i in (5, 1, 3, 0, 4):
+            self.graph.add_edge(vertices[2], vertices[i])
+        self.graph.add_edge(vertices[5], vertices[0])
+
+        self.assertEqual(self.graph.get_adjacent_vertices(vertices[2]),
+                         [vertices[0], vertices[1], vertices[3], vertices[4], vertices[5]])
+        self.assertEqual(self.graph.get_incident_edges(vertices[2]),
+                         sorted(self.graph.get_incident_edges(vertices[2])))
+        self.assertEqual(self.graph.vertex_degree(vertices[2]), 5)
+        self.assertEqual(self.graph.vertex_degree(vertices[5]), 2)
+
+    def test_adjacency_index_after_removal(self):
+        """Тест обновления списков смежности при удалении рёбер и вершин"""
+        v1 = self.graph.add_vertex(10)
+        v2 = self.graph.add_vertex(20)
+        v3 = self.graph.add_vertex(30)
+        self.graph.add_edge(v1, v2)
+        self.graph.add_edge(v1, v3)
+        self.graph.add_edge(v2, v3)
+
+        self.graph.remove_edge(v2, v1)
+        self.assertEqual(self.graph.get_adjacent_vertices(v1), [v3])
+        self.assertEqual(self.graph.vertex_degree(v2), 1)
+
+        self.graph.remove_vertex(v3)
+        self.assertEqual(self.graph.vertex_degree(v1), 0)
+        self.assertEqual(self.graph.get_incident_edges(v2), [])
+        self.assertFalse(self.graph.has_vertex(v3))
+        self.assertFalse(self.graph.has_vertex("not a vertex"))
+        with self.assertRaises(VertexNotFoundException):
+            self.graph.vertex_degree(v3)
+
+    def test_edges_stay_ordered(self):
+        """Тест упорядоченности рёбер и проверки наличия при вставке в случайном порядке"""
+        import random
+        rng = random.Random(1)
+        vertices = [self.graph.add_vertex(i) for i in range(30)]
+        pairs = [(i, j) for i in range(30) for j in range(i + 1, 30)]
+        rng.shuffle(pairs)
+        for i, j in pairs[:200]:
+            if rng.random() < 0.5:
+                i, j = j, i
+            self.graph.add_edge(vertices[i], vertices[j])
+        for i, j in pairs[:50]:
+            self.graph.remove_edge(vertices[j], vertices[i])
+
+        edges = list(self.graph.edges_begin())
+        self.assertEqual(edges, sorted(edges))
+        self.assertEqual(self.graph.edge_count(), 150)
+        for i, j in pairs[:200]:
+            self.assertEqual(self.graph.has_edge(vertices[j], vertices[i]), (i, j) not in pairs[:50])
+
+        self.graph.remove_vertex(vertices[7])
+        edges = list(self.graph.edges_begin())
+        self.assertEqual(edges, sorted(edges))
+        self.assertTrue(all(not edge.contains_vertex(vertices[7]) for edge in edges))
+        self.assertEqual(list(self.graph.vertices_begin()), vertices[:7] + vertices[8:])
+
+    def test_copy_has_independent_adjacency(self):
+        """Тест независимости списков смежности копии графа"""
+        v1 = self.graph.add_vertex(10)
+        v2 = self.graph.add_vertex(20)
+        self.graph.add_edge(v1, v2)
+
+        graph_copy = copy.copy(self.graph)
+        graph_copy.remove_edge(v1, v2)
+        self.assertEqual(self.graph.vertex_degree(v1), 1)
+        self.assertEqual(graph_copy.vertex_degree(v1), 0)
+
+
+class TestBulkConstruction(unittest.TestCase):
+    """
+    @class TestBulkConstruction
+    @brief Тесты пакетного построения графа
+    """
+
+    def setUp(self):
+        """Подготовка к тестам"""
+        import tempfile
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Удаление временного каталога"""
+        self.temp_dir.cleanup()
+
+    def write(self, name, text):
+        """Записывает временный файл и возвращает путь к нему"""
+        import os
+        path = os.path.join(self.temp_dir.name, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        return path
+
+    def test_from_edge_list_matches_incremental(self):
+        """Тест совпадения пакетного и поэлементного построения"""
+        pairs = [("b", "c"), ("a", "b"), ("d", "a"), ("c", "a"), ("d", "c")]
+        graph = UndirectedGraph.from_edge_list(pairs, vertices=["a", "e"])
+
+        expected = UndirectedGraph[str]()
+        vertices = {value: expected.add_vertex(value) for value in "aebcd"}
+        for value1, value2 in pairs:
+            expected.add_edge(vertices[value1], vertices[value2])
+
+        self.assertEqual(graph, expected)
+        self.assertEqual(graph.vertex_count(), 5)
+        edges = list(graph.edges_begin())
+        self.assertEqual(edges, sorted(edges))
+        for vertex in graph.vertices_begin():
+            expected_vertex = vertices[vertex.value]
+            self.assertEqual([v.value for v in graph.get_adjacent_vertices(vertex)],
+                             [v.value for v in expected.get_adjacent_vertices(expected_vertex)])
+            self.assertEqual(graph.vertex_degree(vertex), expected.vertex_degree(expected_vertex))
+
+    def test_from_edge_list_duplicates_and_loops(self):
+        """Тест обработки повторяющихся рёбер и петель"""
+        with self.assertRaises(EdgeAlreadyExistsException):
+            UndirectedGraph.from_edge_list([(1, 2), (2, 1)])
+        graph = UndirectedGraph.from_edge_list([(1, 2), (2, 1), (2, 3)], skip_duplicates=True)
+        self.assertEqual(graph.edge_count(), 2)
+        with self.assertRaises(GraphException):
+            UndirectedGraph.from_edge_list([(1, 1)])
+
+    def test_add_edges_from(self):
+        """Тест добавления набора рёбер в существующий граф"""
+        graph = UndirectedGraph[int]()
+        vertices = [graph.add_vertex(i) for i in range(5)]
+        graph.add_edge(vertices[2], vertices[4])
+
+        edges = graph.add_edges_from([(vertices[2], vertices[0]), (vertices[3], vertices[2]),
+                                      (vertices[0], vertices[1])])
+        self.assertEqual(len(edges), 3)
+        self.assertEqual(graph.edge_count(), 4)
+        self.assertEqual(graph.get_adjacent_vertices(vertices[2]),
+                         [vertices[0], vertices[3], vertices[4]])
+        self.assertEqual(graph.get_incident_edges(vertices[2]),
+                         sorted(graph.get_incident_edges(vertices[2])))
+        self.assertTrue(graph.has_edge(vertices[1], vertices[0]))
+
+    def test_add_edges_from_is_atomic(self):
+        """Тест что при ошибке граф не изменяется"""
+        graph = UndirectedGraph[int]()
+        vertices = [graph.add_vertex(i) for i in range(3)]
+        graph.add_edge(vertices[0], vertices[1])
+
+        with self.assertRaises(EdgeAlreadyExistsException):
+            graph.add_edges_from([(vertices[1], vertices[2]), (vertices[1], vertices[0])])
+        with self.assertRaises(EdgeAlreadyExistsException):
+            graph.add_edges_from([(vertices[1], vertices[2]), (vertices[2], vertices[1])])
+        with self.assertRaises(VertexNotFoundException):
+            graph.add_edges_from([(vertices[1], vertices[2]), (vertices[0], Vertex(0, 99))])
+        self.assertEqual(graph.edge_count(), 1)
+        self.assertEqual(graph.vertex_degree(vertices[2]), 0)
+
+        graph.add_edges_from([(vertices[1], vertices[0]), (vertices[2], vertices[1])],
+                             skip_duplicates=True)
+        self.assertEqual(graph.edge_count(), 2)
+
+    def test_from_file_edge_list(self):
+        """Тест загрузки списка рёбер, разделенного пробелами"""
+        path = self.write("graph.txt", "# граф\n1 2\n\n2   3\n3\t1\n")
+        graph = UndirectedGraph.from_file(path, value_type=int)
+        self.assertEqual(graph.vertex_count(), 3)
+        self.assertEqual(graph.edge_count(), 3)
+        self.assertEqual(sorted(v.value for v in graph.vertices_begin()), [1, 2, 3])
+
+    def test_from_file_csv(self):
+        """Тест загрузки CSV файла с заголовком"""
+        path = self.write("graph.csv", "source,target\nМосква,Казань\nКазань,Пермь\n")
+        graph = UndirectedGraph.from_file(path, has_header=True)
+        self.assertEqual([v.value for v in graph.vertices_begin()], ["Москва", "Казань", "Пермь"])
+        self.assertEqual(graph.edge_count(), 2)
+
+        path = self.write("graph.tsv", "a;b\nc\n")
+        with self.assertRaises(GraphException):
+            UndirectedGraph.from_file(path, delimiter=";")
+
+
+class TestFrozenGraph(unittest.TestCase):
+    """
+    @class TestFrozenGraph
+    @brief Тесты для неизменяемого CSR-снимка графа
+    """
+
+    def setUp(self):
+        """Подготовка графа с удаленной вершиной и изолированной вершиной"""
+        self.graph = UndirectedGraph[int]()
+        self.v = [self.graph.add_vertex(i * 10) for i in range(6)]
+        for i, j in [(3, 1), (0, 1), (4, 0), (1, 4), (2, 4), (5, 2)]:
+            self.graph.add_edge(self.v[i], self.v[j])
+        self.graph.remove_vertex(self.v[2])
+        self.isolated = self.graph.add_vertex(60)
+        self.frozen = self.graph.freeze()
+
+    @staticmethod
+    def collect(begin, end):
+        """Собирает элементы диапазона итераторов в список"""
+        result = []
+        while begin != end:
+            result.append(begin.current())
+            begin.next()
+        return result
+
+    def test_csr_layout(self):
+        """Тест массивов indptr и indices над плотными индексами"""
+        self.assertIsInstance(self.frozen, FrozenGraph)
+        self.assertEqual(list(self.frozen.indptr), [0, 2, 5, 6, 8, 8, 8])
+        self.assertEqual(list(self.frozen.indices), [1, 3, 0, 2, 3, 1, 0, 1])
+        self.assertEqual((self.frozen.indptr.itemsize, self.frozen.indices.itemsize), (4, 4))
+        # 8 байт на ребро и 12 байт на вершину (indptr, upper, edge_ptr)
+        self.assertEqual(self.frozen.nbytes(),
+                         8 * self.frozen.edge_count() + 4 * (3 * self.frozen.vertex_count() + 2))
+
+    def test_queries_match_graph(self):
+        """Тест совпадения запросов снимка и исходного графа"""
+        self.assertEqual(self.frozen.vertex_count(), self.graph.vertex_count())
+        self.assertEqual(self.frozen.edge_count(), self.graph.edge_count())
+        self.assertFalse(self.frozen.empty())
+        self.assertFalse(self.frozen.has_vertex(self.v[2]))
+        for vertex in self.graph.vertices_begin():
+            self.assertEqual(self.frozen.vertex_degree(vertex), self.graph.vertex_degree(vertex))
+            self.assertEqual(self.frozen.get_adjacent_vertices(vertex),
+                             self.graph.get_adjacent_vertices(vertex))
+            self.assertEqual(self.frozen.get_incident_edges(vertex),
+                             self.graph.get_incident_edges(vertex))
+            for other in self.graph.vertices_begin():
+                self.assertEqual(self.frozen.has_edge(vertex, other), self.graph.has_edge(vertex, other))
+
+        self.assertEqual(self.frozen.edge_degree(self.v[1], self.v[4]),
+                         self.graph.edge_degree(self.v[1], self.v[4]))
+        with self.assertRaises(EdgeNotFoundException):
+            self.frozen.edge_degree(self.v[0], self.v[5])
+        with self.assertRaises(VertexNotFoundException):
+            self.frozen.vertex_degree(self.v[2])
+
+    def test_iterators_match_graph(self):
+        """Тест совпадения обхода итераторами снимка и исходного графа"""
+        self.assertEqual(self.collect(self.frozen.vertices_begin(), self.frozen.vertices_end()),
+                         self.collect(self.graph.vertices_begin(), self.graph.vertices_end()))
+        self.assertEqual(self.collect(self.frozen.vertices_rbegin(), self.frozen.vertices_rend()),
+                         self.collect(self.graph.vertices_rbegin(), self.graph.vertices_rend()))
+        self.assertEqual(self.collect(self.frozen.edges_begin(), self.frozen.edges_end()),
+                         self.collect(self.graph.edges_begin(), self.graph.edges_end()))
+        self.assertEqual(self.collect(self.frozen.edges_rbegin(), self.frozen.edges_rend()),
+                         self.collect(self.graph.edges_rbegin(), self.graph.edges_rend()))
+        self.assertEqual(list(self.frozen._edges), list(self.graph._edges))
+        for vertex in self.graph.vertices_begin():
+            self.assertEqual(
+                self.collect(self.frozen.adjacent_vertices_begin(vertex),
+                             self.frozen.adjacent_vertices_end(vertex)),
+                self.collect(self.graph.adjacent_vertices_begin(vertex),
+                             self.graph.adjacent_vertices_end(vertex)))
+            self.assertEqual(
+                self.collect(self.frozen.incident_edges_begin(vertex),
+                             self.frozen.incident_edges_end(vertex)),
+                self.collect(self.graph.incident_edges_begin(vertex),
+                             self.graph.incident_edges_end(vertex)))
+
+    def test_snapshot_is_independent(self):
+        """Тест что изменения графа не влияют на снимок"""
+        self.graph.add_edge(self.v[0], self.isolated)
+        self.graph.remove_vertex(self.v[1])
+        self.assertEqual(self.frozen.edge_count(), 4)
+        self.assertTrue(self.frozen.has_edge(self.v[0], self.v[1]))
+        self.assertFalse(self.frozen.has_edge(self.v[0], self.isolated))
+        self.assertFalse(hasattr(self.frozen, "add_edge"))
+
+    def test_empty_graph(self):
+        """Тест снимка пустого графа"""
+        frozen = UndirectedGraph[int]().freeze()
+        self.assertTrue(frozen.empty())
+        self.assertEqual(frozen.edge_count(), 0)
+        self.assertEqual(frozen.edges_begin(), frozen.edges_end())
+        self.assertEqual(list(frozen.indptr), [0])
+
 
 class TestVertexIterator(unittest.TestCase):
     """
@@ -467,6 +744,39 @@ class TestAdjacentVertexIterator(unittest.TestCase):
 
         self.assertEqual(len(vertices), 2)
 
+    def test_adjacent_vertex_iterator_backward(self):
+        """Тест обхода смежных вершин от конца к началу"""
+        it = self.graph.adjacent_vertices_end(self.v1)
+        begin = self.graph.adjacent_vertices_begin(self.v1)
+        vertices = []
+        while it != begin:
+            it.prev()
+            vertices.append(it.current())
+
+        self.assertEqual(vertices, [self.v3, self.v2])
+        with self.assertRaises(IndexError):
+            self.graph.adjacent_vertices_end(self.v1).current()
+        with self.assertRaises(VertexNotFoundException):
+            self.graph.adjacent_vertices_begin(Vertex(0, 99))
+
+    def test_adjacent_vertex_iterator_invalidated_by_mutation(self):
+        """Тест что изменение графа во время обхода смежных вершин обнаруживается"""
+        it = self.graph.adjacent_vertices_begin(self.v2)
+        self.graph.get_adjacent_vertices(self.v2).append(self.v3)
+        self.assertEqual(it.current(), self.v1)
+
+        self.graph.add_edge(self.v2, self.v3)
+        with self.assertRaises(GraphException):
+            it.current()
+        with self.assertRaises(GraphException):
+            next(it)
+
+        it = self.graph.adjacent_vertices_begin(self.v1)
+        with self.assertRaises(GraphException):
+            for v in it:
+                self.graph.remove_vertex(v)
+        self.assertEqual(self.graph.vertex_degree(self.v1), 1)
+
 
 class TestIncidentEdgeIterator(unittest.TestCase):
     """
@@ -503,6 +813,34 @@ class TestIncidentEdgeIterator(unittest.TestCase):
 
         self.assertEqual(len(edges), 2)
 
+    def test_incident_edge_iterator_end(self):
+        """Тест что конец диапазона совпадает со степенью вершины"""
+        it = self.graph.incident_edges_begin(self.v1)
+        it.next().next()
+        self.assertEqual(it, self.graph.incident_edges_end(self.v1))
+        self.assertEqual(it.prev().current(), Edge(self.v1, self.v3))
+        self.assertEqual(self.graph.incident_edges_begin(self.v2),
+                         self.graph.incident_edges_end(self.v2).prev())
+
+    def test_incident_edge_iterator_invalidated_by_mutation(self):
+        """Тест что изменение графа во время обхода инцидентных ребер обнаруживается"""
+        v4 = self.graph.add_vertex(40)
+        it = self.graph.incident_edges_begin(self.v1)
+        self.assertEqual(next(it), Edge(self.v1, self.v2))
+
+        adjacent = self.graph._adjacent_view(self.v2)
+        self.graph.add_edges_from([(v4, self.v2), (self.v2, self.v3)])
+        self.assertIs(self.graph._adjacent_view(self.v2), adjacent)
+        self.assertEqual(adjacent, [self.v1, self.v3, v4])
+        with self.assertRaises(GraphException):
+            next(it)
+
+        it = self.graph.incident_edges_begin(self.v1)
+        self.graph.remove_edge(self.v1, self.v2)
+        with self.assertRaises(GraphException):
+            it.current()
+        self.assertEqual(list(self.graph.incident_edges_begin(self.v1)), [Edge(self.v1, self.v3)])
+
 
 class TestIteratorDeletion(unittest.TestCase):
     """